@@ -257,3 +257,76 @@ class TestExitCodes:
             "--prompt", "nonexistent_prompt", "https://youtu.be/dQw4w9WgXcQ"
         )
         assert code == 2, f"Expected exit 2 for invalid prompt, got {code}"
+
+
+# ---------------------------------------------------------------------------
+# Slice 5: Run metrics (meta.json + runs.jsonl ledger)
+# ---------------------------------------------------------------------------
+
+
+class TestGetAudioDuration:
+    def test_reads_metadata_duration(self) -> None:
+        from transcript import get_audio_duration
+
+        assert get_audio_duration({"metadata": {"duration": 120.5}}) == 120.5
+
+    def test_missing_duration(self) -> None:
+        from transcript import get_audio_duration
+
+        assert get_audio_duration({}) is None
+
+
+class TestRunMetrics:
+    INFO = {"title": "Some Talk", "video_id": "dQw4w9WgXcQ"}
+    URL = "https://youtu.be/dQw4w9WgXcQ"
+
+    def test_real_time_factor(self) -> None:
+        from transcript import build_run_metrics
+
+        metrics = build_run_metrics(
+            self.INFO,
+            self.URL,
+            {"download": 3.0, "transcribe": 6.0},
+            1_000_000,
+            1_000_000,
+            600.0,
+            {"raw_transcript.txt": 1234},
+            None,
+        )
+        assert metrics["transcription_rtf"] == 0.01
+        assert metrics["timings_s"]["download"] == 3.0
+        assert metrics["token_counts"] == {"raw_transcript.txt": 1234}
+        assert metrics["summary"] is None
+
+    def test_rtf_none_without_duration(self) -> None:
+        from transcript import build_run_metrics
+
+        metrics = build_run_metrics(
+            self.INFO, self.URL, {"transcribe": 6.0}, None, None, None, {}, None
+        )
+        assert metrics["transcription_rtf"] is None
+
+    def test_writes_meta_json_and_appends_ledger(self, tmp_path: Path) -> None:
+        import json
+
+        from transcript import (
+            META_JSON_FILENAME,
+            RUN_LEDGER_FILENAME,
+            build_run_metrics,
+            save_run_metrics,
+        )
+
+        metrics = build_run_metrics(
+            self.INFO, self.URL, {"total": 1.0}, 10, 10, 5.0, {}, None
+        )
+        for name in ("run_a", "run_b"):
+            run_dir = tmp_path / name
+            run_dir.mkdir()
+            ledger = save_run_metrics(run_dir, tmp_path, metrics)
+
+        assert ledger == tmp_path / RUN_LEDGER_FILENAME
+        saved = json.loads((tmp_path / "run_a" / META_JSON_FILENAME).read_text())
+        assert saved["video_id"] == "dQw4w9WgXcQ"
+
+        lines = ledger.read_text().splitlines()
+        assert [json.loads(line)["output_dir"] for line in lines] == ["run_a", "run_b"]
@@ -75,6 +75,10 @@ CLAUDE_SAFE_INPUT_LIMIT = 150_000  # Safe input limit (tokens), leaves room for
 SUMMARY_CLI_TIMEOUT = 600  # 10 minutes (matches SKILL.md recommendation)
 SUMMARY_MAX_RETRIES = 3  # Retry attempts for summary CLI failures
 
+# Run metrics (meta.json per run, JSONL ledger across runs in the base directory)
+META_JSON_FILENAME = "meta.json"
+RUN_LEDGER_FILENAME = "runs.jsonl"
+
 console = Console()
 
 
@@ -221,6 +225,14 @@ def transcribe_audio(audio_path: Path, api_key: str) -> dict:
     return result
 
 
+def get_audio_duration(response: dict) -> float | None:
+    """Return the audio duration in seconds reported by Deepgram, if any."""
+    duration = response.get("metadata", {}).get("duration")
+    if isinstance(duration, (int, float)) and duration > 0:
+        return float(duration)
+    return None
+
+
 def parse_transcript(response: dict) -> tuple[str, str, str]:
     """Parse Deepgram response into different output formats."""
     channel = response["results"]["channels"][0]["alternatives"][0]
@@ -283,6 +295,66 @@ def get_token_counts(output_dir: Path) -> dict[str, int]:
     return counts
 
 
+def build_run_metrics(
+    info: dict,
+    url: str,
+    timings: dict[str, float],
+    bytes_downloaded: int | None,
+    bytes_uploaded: int | None,
+    audio_duration: float | None,
+    token_counts: dict[str, int],
+    usage_stats: dict | None,
+) -> dict:
+    """Assemble machine-readable metrics for one run (meta.json / ledger line).
+
+    Args:
+        info: Video info from ``get_video_info`` (title, video_id).
+        url: YouTube URL that was processed.
+        timings: Stage name -> elapsed seconds (measured with ``time.monotonic``).
+        bytes_downloaded: Size of the downloaded audio file.
+        bytes_uploaded: Bytes sent to Deepgram.
+        audio_duration: Audio length in seconds reported by Deepgram.
+        token_counts: Output of ``get_token_counts``.
+        usage_stats: Summary provider stats, or None when no summary ran.
+    """
+    transcribe_seconds = timings.get("transcribe")
+    real_time_factor = None
+    if transcribe_seconds is not None and audio_duration:
+        real_time_factor = round(transcribe_seconds / audio_duration, 4)
+
+    return {
+        "version": __version__,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "title": info["title"],
+        "video_id": info["video_id"],
+        "url": url,
+        "timings_s": {stage: round(secs, 3) for stage, secs in timings.items()},
+        "bytes_downloaded": bytes_downloaded,
+        "bytes_uploaded": bytes_uploaded,
+        "audio_duration_s": audio_duration,
+        "transcription_rtf": real_time_factor,
+        "token_counts": token_counts,
+        "summary": usage_stats,
+    }
+
+
+def save_run_metrics(output_dir: Path, base_dir: Path, metrics: dict) -> Path:
+    """Write meta.json for this run and append it to the JSONL ledger.
+
+    Returns:
+        Path to the ledger file in *base_dir*.
+    """
+    (output_dir / META_JSON_FILENAME).write_text(
+        json.dumps(metrics, indent=2) + "\n", encoding="utf-8"
+    )
+
+    ledger_path = base_dir / RUN_LEDGER_FILENAME
+    ledger_entry = {**metrics, "output_dir": output_dir.name}
+    with ledger_path.open("a", encoding="utf-8") as ledger:
+        ledger.write(json.dumps(ledger_entry) + "\n")
+    return ledger_path
+
+
 def validate_context_size(
     transcript_text: str, prompt_text: str
 ) -> tuple[bool, int, str]:
@@ -712,7 +784,8 @@ Default (transcript + {DEFAULT_PROMPT} prompt via {DEFAULT_PROVIDER}):
         usage=argparse.SUPPRESS,
         epilog=f"""
 Output files (in timestamped folder):
-  {{prompt}}.md, raw_transcript.txt, raw_sentences.txt, raw_transcript.json, meta.txt
+  {{prompt}}.md, raw_transcript.txt, raw_sentences.txt, raw_transcript.json,
+  meta.txt, meta.json (stage timings); runs are also appended to {RUN_LEDGER_FILENAME}
 
 Environment:
   DEEPGRAM_API_KEY  [{api_key_status}]
@@ -862,13 +935,18 @@ def main() -> None:
 
     console.print()
 
+    timings: dict[str, float] = {}
+    run_start = time.monotonic()
+
     # Get video info
+    stage_start = time.monotonic()
     with Status("[cyan]Fetching video info...[/cyan]", console=console):
         try:
             info = retry_request(lambda: get_video_info(args.url))
         except subprocess.CalledProcessError:
             console.print("[red]Failed to get video info[/red]")
             sys.exit(1)
+    timings["video_info"] = time.monotonic() - stage_start
 
     console.print(f"[bold green]🎬 {info['title']}[/bold green]")
     console.print()
@@ -878,26 +956,39 @@ def main() -> None:
     output_dir = create_output_dir(info["title"], info["video_id"], base_dir=base_dir)
 
     # Download audio
+    stage_start = time.monotonic()
     with Status("[cyan]Downloading audio...[/cyan]", console=console):
         try:
             audio_path = retry_request(lambda: download_audio(args.url, output_dir))
         except subprocess.CalledProcessError:
             console.print("[red]Failed to download audio[/red]")
             sys.exit(1)
+    timings["download"] = time.monotonic() - stage_start
+    bytes_downloaded = audio_path.stat().st_size
+    bytes_uploaded = bytes_downloaded  # the whole file is posted to Deepgram
     console.print("[green]⬇️  Downloaded[/green]")
 
     # Transcribe
+    stage_start = time.monotonic()
     with Status("[cyan]Transcribing with Deepgram...[/cyan]", console=console):
         try:
             response = retry_request(lambda: transcribe_audio(audio_path, api_key))
         except httpx.HTTPError as e:
             console.print(f"[red]Transcription failed:[/red] {e}")
             sys.exit(1)
+    timings["transcribe"] = time.monotonic() - stage_start
+    audio_duration = get_audio_duration(response)
     console.print("[green]📝 Transcribed[/green]")
 
     # Parse and save
+    stage_start = time.monotonic()
     transcript, sentences, json_data = parse_transcript(response)
     save_outputs(output_dir, transcript, sentences, json_data)
+    timings["parse_save"] = time.monotonic() - stage_start
+
+    stage_start = time.monotonic()
+    token_counts = get_token_counts(output_dir)
+    timings["token_count"] = time.monotonic() - stage_start
 
     # Cleanup audio
     audio_path.unlink(missing_ok=True)
@@ -906,6 +997,7 @@ def main() -> None:
     summary_path: Path | None = None
     usage_stats: dict | None = None
     if selected_prompt:
+        stage_start = time.monotonic()
         with Status(
             f"[cyan]Generating summary with {args.provider}...[/cyan]", console=console
         ):
@@ -927,6 +1019,9 @@ def main() -> None:
                 print_summary_usage(usage_stats)
             except SummaryCLIError as e:
                 console.print(f"[red]{args.provider} error:[/red] {e}")
+        timings["summary"] = time.monotonic() - stage_start
+
+    timings["total"] = time.monotonic() - run_start
 
     console.print()
     console.print(f"[dim]📂 {output_dir}[/dim]")
@@ -941,6 +1036,19 @@ URL: {args.url}
 """
     (output_dir / "meta.txt").write_text(meta_content, encoding="utf-8")
 
+    # Save meta.json and append to the runs ledger
+    metrics = build_run_metrics(
+        info,
+        args.url,
+        timings,
+        bytes_downloaded,
+        bytes_uploaded,
+        audio_duration,
+        token_counts,
+        usage_stats,
+    )
+    save_run_metrics(output_dir, base_dir or OUTPUT_DIR, metrics)
+
     # Open folder
     open_folder(output_dir)
     if summary_path:
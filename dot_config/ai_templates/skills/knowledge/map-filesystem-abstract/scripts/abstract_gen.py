@@ -12,23 +12,60 @@
 
 from __future__ import annotations
 
-import json
-import os
-import signal
 import sys
-import time
-from pathlib import Path
-from typing import Annotated
-
-import typer
-from lib.exporter import ExportConfig, Exporter
-from lib.models import ErrorCode, ScanResult
-from lib.parser import Parser
-from lib.scanner import Scanner, ScannerConfig
-from lib.tree_builder import TreeBuilder
-from lib.validator import Validator
-from rich.console import Console
-from rich.table import Table
+
+from lib.client import forward
+
+# Thin client: a running `serve` daemon answers before typer and rich load
+if __name__ == "__main__" and (_code := forward(sys.argv[1:])) is not None:
+    sys.exit(_code)
+
+import functools  # noqa: E402
+import io  # noqa: E402
+import itertools  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import shutil  # noqa: E402
+import signal  # noqa: E402
+import time  # noqa: E402
+from contextlib import redirect_stderr, redirect_stdout  # noqa: E402
+from dataclasses import replace  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Annotated, Any, NoReturn  # noqa: E402
+
+import typer  # noqa: E402
+from lib.cache import ScanCache  # noqa: E402
+from lib.catalog import (  # noqa: E402
+    Catalog,
+    QueryError,
+    catalog_path,
+    compile_where,
+    find_catalog,
+)
+from lib.client import SERVED_COMMANDS, socket_path  # noqa: E402
+from lib.daemon import AtlasIndex, serve  # noqa: E402
+from lib.exporter import STREAM_FORMATS, ExportConfig, Exporter  # noqa: E402
+from lib.models import AtlasFile, ErrorCode, ScanError, ScanResult  # noqa: E402
+from lib.parser import Parser  # noqa: E402
+from lib.profiling import Profiler, record  # noqa: E402
+from lib.scanner import (  # noqa: E402
+    DEFAULT_WORKERS,
+    Scanner,
+    ScannerConfig,
+    dedupe_roots,
+    scan_roots,
+)
+from lib.tree_builder import TreeBuilder, TreeView  # noqa: E402
+from lib.updater import (  # noqa: E402
+    DEFAULT_AGENT,
+    DEFAULT_JOBS,
+    DEFAULT_TIMEOUT,
+    Updater,
+    UpdateResult,
+)
+from lib.validator import Validator  # noqa: E402
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
 
 _HELP = """\
 Discover, validate, and export atlas files (.abstract.md, .overview.md).
@@ -46,9 +83,15 @@ CLI:
   uv run abstract_gen.py list                List (executive-assistant)
   uv run abstract_gen.py list --all          List (all projects)
   uv run abstract_gen.py list ~/path         List (custom root)
+  uv run abstract_gen.py update              Update stale atlases (executive-assistant)
+  uv run abstract_gen.py update --all        Update stale atlases (all projects)
+  uv run abstract_gen.py update ~/path       Update stale atlases (custom root)
   uv run abstract_gen.py scan ~/path         Discover atlas files
   uv run abstract_gen.py validate ~/path     Check frontmatter
   uv run abstract_gen.py orphans ~/path      Find missing atlases
+  uv run abstract_gen.py serve               Keep an index hot for the above
+  uv run abstract_gen.py index ~/path        Build the SQLite atlas catalog
+  uv run abstract_gen.py query -w 'layer=l1 and date_updated < 30 days ago'
 
 Exit codes: 0=ok  1=error  2=empty  3=invalid"""
 
@@ -58,10 +101,14 @@ app = typer.Typer(
     add_completion=False,
 )
 
+_VALID_FORMATS = {"human", "json", "yaml", "toml", "plain"}
+
 _no_color = "NO_COLOR" in os.environ
 stdout_console = Console(no_color=_no_color)
 stderr_console = Console(stderr=True, no_color=_no_color)
 
+_daemon_index: AtlasIndex | None = None  # set while running `serve`
+
 
 def _version_callback(value: bool) -> None:
     if value:
@@ -96,9 +143,10 @@ def main(
 
 @app.command()
 def scan(
-    path: Annotated[
-        Path, typer.Argument(help="Directory to scan", exists=False)
-    ] = Path("."),
+    paths: Annotated[
+        list[Path] | None,
+        typer.Argument(help="Directories to scan (default: .)", exists=False),
+    ] = None,
     format: Annotated[
         str,
         typer.Option(
@@ -111,6 +159,26 @@ def scan(
     export: Annotated[
         str | None, typer.Option("--export", "-e", help="Export to file: graphviz")
     ] = None,
+    root_at: Annotated[
+        Path | None,
+        typer.Option("--root-at", help="Tree/graphviz: only this subtree"),
+    ] = None,
+    tree_depth: Annotated[
+        int | None,
+        typer.Option(
+            "--tree-depth", min=0, help="Tree/graphviz: fold levels below this"
+        ),
+    ] = None,
+    max_children: Annotated[
+        int | None,
+        typer.Option(
+            "--max-children", min=1, help="Tree/graphviz: fold children past this"
+        ),
+    ] = None,
+    clusters: Annotated[
+        bool,
+        typer.Option("--clusters", help="Graphviz: one cluster per scope: top atlas"),
+    ] = False,
     has_abstract: Annotated[
         bool, typer.Option("--has-abstract", help="Only dirs with .abstract.md")
     ] = False,
@@ -129,12 +197,43 @@ def scan(
     depth: Annotated[
         int | None, typer.Option("--depth", "-d", help="Max recursion depth")
     ] = None,
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Directory listing threads")
+    ] = DEFAULT_WORKERS,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
     metadata: Annotated[
         bool, typer.Option("--metadata", "-m", help="Include frontmatter")
     ] = False,
     stats: Annotated[
         bool, typer.Option("--stats", "-s", help="Show timing statistics")
     ] = False,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help="Write each dir as found (json as NDJSON, or plain); unsorted",
+        ),
+    ] = False,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Time each phase (stderr)")
+    ] = False,
+    profile_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-out",
+            help="Write a profile: *.json phases, *.folded stacks, else pstats",
+        ),
+    ] = None,
     verbose: Annotated[bool, typer.Option("--verbose", help="Show progress")] = False,
     debug: Annotated[bool, typer.Option("--debug", help="Full debug output")] = False,
     quiet: Annotated[
@@ -142,23 +241,35 @@ def scan(
     ] = False,
 ) -> None:
     """Discover atlas files with filters and multiple output formats."""
-    _run_scan(
-        path=path,
-        format=format,
-        show_tree=tree,
-        export_format=export,
-        has_abstract=has_abstract,
-        has_overview=has_overview,
-        has_both=has_both,
-        validate=validate,
-        find_orphans=orphans,
-        depth=depth,
-        include_metadata=metadata,
-        show_stats=stats,
-        verbose=verbose,
-        debug=debug,
-        quiet=quiet,
-    )
+    profiler = Profiler.for_options(profile, profile_out)
+    with record(profile_out, profiler):
+        _run_scan(
+            paths=paths or [Path(".")],
+            format=format,
+            show_tree=tree,
+            export_format=export,
+            root_at=root_at,
+            tree_depth=tree_depth,
+            max_children=max_children,
+            clusters=clusters,
+            has_abstract=has_abstract,
+            has_overview=has_overview,
+            has_both=has_both,
+            validate=validate,
+            find_orphans=orphans,
+            depth=depth,
+            workers=workers,
+            prune=prune,
+            ignore_files=ignore_files,
+            no_cache=no_cache,
+            stream=stream,
+            profiler=profiler,
+            include_metadata=metadata,
+            show_stats=stats,
+            verbose=verbose,
+            debug=debug,
+            quiet=quiet,
+        )
 
 
 @app.command()
@@ -169,20 +280,37 @@ def validate(
     depth: Annotated[
         int | None, typer.Option("--depth", "-d", help="Max recursion depth")
     ] = None,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Time each phase (stderr)")
+    ] = False,
+    profile_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-out",
+            help="Write a profile: *.json phases, *.folded stacks, else pstats",
+        ),
+    ] = None,
     verbose: Annotated[bool, typer.Option("--verbose", help="Show progress")] = False,
     quiet: Annotated[
         bool, typer.Option("--quiet", "-q", help="Suppress warnings")
     ] = False,
 ) -> None:
     """Check frontmatter consistency across atlas files."""
-    _run_scan(
-        path=path,
-        format="human",
-        validate=True,
-        depth=depth,
-        verbose=verbose,
-        quiet=quiet,
-    )
+    profiler = Profiler.for_options(profile, profile_out)
+    with record(profile_out, profiler):
+        _run_scan(
+            paths=[path],
+            format="human",
+            validate=True,
+            depth=depth,
+            no_cache=no_cache,
+            profiler=profiler,
+            verbose=verbose,
+            quiet=quiet,
+        )
 
 
 @app.command()
@@ -196,20 +324,47 @@ def orphans(
     format: Annotated[
         str, typer.Option("--format", "-f", help="Output format: human, json")
     ] = "human",
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Time each phase (stderr)")
+    ] = False,
+    profile_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-out",
+            help="Write a profile: *.json phases, *.folded stacks, else pstats",
+        ),
+    ] = None,
     verbose: Annotated[bool, typer.Option("--verbose", help="Show progress")] = False,
     quiet: Annotated[
         bool, typer.Option("--quiet", "-q", help="Suppress warnings")
     ] = False,
 ) -> None:
     """Find directories missing expected atlas files."""
-    _run_scan(
-        path=path,
-        format=format,
-        find_orphans=True,
-        depth=depth,
-        verbose=verbose,
-        quiet=quiet,
-    )
+    profiler = Profiler.for_options(profile, profile_out)
+    with record(profile_out, profiler):
+        _run_scan(
+            paths=[path],
+            format=format,
+            find_orphans=True,
+            depth=depth,
+            prune=prune,
+            ignore_files=ignore_files,
+            no_cache=no_cache,
+            profiler=profiler,
+            verbose=verbose,
+            quiet=quiet,
+        )
 
 
 _SCAN_ROOT = Path.home() / "Documents/github_local"
@@ -218,9 +373,9 @@ _DEFAULT_PROJECT = "executive-assistant"
 
 @app.command(name="list")
 def list_dirs(
-    path: Annotated[
-        Path | None,
-        typer.Argument(help="Directory to scan (default: executive-assistant)"),
+    paths: Annotated[
+        list[Path] | None,
+        typer.Argument(help="Directories to scan (default: executive-assistant)"),
     ] = None,
     all_projects: Annotated[
         bool,
@@ -229,28 +384,88 @@ def list_dirs(
     json_output: Annotated[
         bool, typer.Option("--json", help="Output as JSON array")
     ] = False,
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Directory listing threads")
+    ] = DEFAULT_WORKERS,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Time each phase (stderr)")
+    ] = False,
+    profile_out: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-out",
+            help="Write a profile: *.json phases, *.folded stacks, else pstats",
+        ),
+    ] = None,
     quiet: Annotated[
         bool, typer.Option("--quiet", "-q", help="Suppress warnings")
     ] = False,
 ) -> None:
     """List directories that have both .abstract.md and .overview.md."""
-    if path is not None:
-        scan_path = path.expanduser().resolve()
-    elif all_projects:
-        scan_path = _SCAN_ROOT.resolve()
+    if paths:
+        roots = _resolve_roots(paths)
     else:
-        scan_path = (_SCAN_ROOT / _DEFAULT_PROJECT).resolve()
+        roots = [_resolve_scope(None, all_projects)]
+    profiler = Profiler.for_options(profile, profile_out)
+    with record(profile_out, profiler):
+        _run_list(
+            roots,
+            json_output=json_output,
+            workers=workers,
+            prune=prune,
+            ignore_files=ignore_files,
+            no_cache=no_cache,
+            profiler=profiler,
+            quiet=quiet,
+        )
 
-    if not scan_path.is_dir():
-        stderr_console.print(f"[red]Error:[/red] {scan_path} is not a directory")
-        raise typer.Exit(1)
+
+def _run_list(
+    roots: list[Path],
+    json_output: bool,
+    workers: int,
+    prune: list[str] | None,
+    ignore_files: bool,
+    no_cache: bool,
+    profiler: Profiler,
+    quiet: bool,
+) -> None:
+    start_time = time.time()
+    phase = profiler.phase
 
     if not quiet:
-        stderr_console.print(f"[dim]Scanning {scan_path}[/dim]")
+        for root in roots:
+            stderr_console.print(f"[dim]Scanning {root}[/dim]")
 
-    config = ScannerConfig(root_path=scan_path, has_both=True, quiet=quiet)
-    scanner = Scanner(config)
-    atlases = scanner.scan()
+    config = ScannerConfig(
+        root_path=roots[0],
+        has_both=True,
+        quiet=quiet,
+        workers=workers,
+        prune=tuple(prune or ()),
+        use_ignore_files=ignore_files,
+    )
+    caches = [_open_cache(root, no_cache) for root in roots]
+    scanners = [
+        Scanner(replace(config, root_path=root), cache)
+        for root, cache in zip(roots, caches, strict=True)
+    ]
+    with phase("scan"):
+        per_root, _ = dedupe_roots(scanners, scan_roots(scanners, workers))
+    atlases = [atlas for found in per_root for atlas in found]
+    with phase("cache_save"):
+        _save_caches(caches)
     if not atlases:
         stderr_console.print(
             "[yellow]No directories with both atlas files found.[/yellow]"
@@ -258,44 +473,305 @@ def list_dirs(
         raise typer.Exit(2)
 
     # Deduplicate by directory
-    atlas_dirs = sorted({a.dir_path for a in atlases})
+    atlas_dirs = sorted(Path(d) for d in {a.dir_str for a in atlases})
 
-    if json_output:
-        print(json.dumps([str(d) for d in atlas_dirs], indent=2), file=sys.stdout)
+    with phase("write"):
+        if json_output:
+            print(json.dumps([str(d) for d in atlas_dirs], indent=2), file=sys.stdout)
+        else:
+            for d in atlas_dirs:
+                print(d, file=sys.stdout)
+    if profiler.show:
+        _print_profile(profiler, time.time() - start_time)
+    raise typer.Exit(0)
+
+
+@app.command(name="update")
+def update_dirs(
+    path: Annotated[
+        Path | None,
+        typer.Argument(help="Directory to update (default: executive-assistant)"),
+    ] = None,
+    all_projects: Annotated[
+        bool,
+        typer.Option("--all", help="Update the entire ~/Documents/github_local tree"),
+    ] = False,
+    jobs: Annotated[
+        int, typer.Option("--jobs", "-J", min=1, help="Concurrent agent runs")
+    ] = DEFAULT_JOBS,
+    agent: Annotated[
+        str,
+        typer.Option(
+            "--agent",
+            envvar="ABSTRACT_GEN_AGENT",
+            help="LLM CLI; the prompt is appended, or replaces {prompt}",
+        ),
+    ] = DEFAULT_AGENT,
+    timeout: Annotated[
+        float, typer.Option("--timeout", min=1, help="Seconds per directory")
+    ] = DEFAULT_TIMEOUT,
+    force: Annotated[
+        bool, typer.Option("--force", help="Regenerate every atlas in scope")
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", "-n", help="List stale directories; change nothing"),
+    ] = False,
+    json_output: Annotated[
+        bool, typer.Option("--json", help="Output as JSON array")
+    ] = False,
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Directory listing threads")
+    ] = DEFAULT_WORKERS,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
+    quiet: Annotated[
+        bool, typer.Option("--quiet", "-q", help="Suppress warnings")
+    ] = False,
+) -> None:
+    """Regenerate stale atlases only, leaves first, with a bounded agent pool."""
+    scan_path = _resolve_scope(path, all_projects)
+    config = ScannerConfig(
+        root_path=scan_path,
+        quiet=quiet,
+        workers=workers,
+        prune=tuple(prune or ()),
+        use_ignore_files=ignore_files,
+    )
+    cache = _open_cache(scan_path, no_cache)
+    scanner = Scanner(config, cache)
+    parser = Parser(quiet=True, cache=cache, read_body=False, workers=workers)
+    atlases = parser.parse_batch(scanner.scan())
+    if cache is not None:
+        cache.save()
+
+    updater = Updater(
+        scan_path,
+        agent=agent,
+        jobs=jobs,
+        timeout=timeout,
+        prune=config.prune,
+        workers=workers,
+    )
+    plan = updater.plan(atlases, force=force, create_root=path is not None)
+    total = len({a.dir_path for a in atlases})
+
+    if dry_run:
+        if json_output:
+            print(
+                json.dumps(
+                    [{"path": str(s.path), "reason": s.reason} for s in plan],
+                    indent=2,
+                )
+            )
+        else:
+            for s in plan:
+                print(s.path)
+        if not quiet:
+            stderr_console.print(f"[dim]{len(plan)} of {total} stale[/dim]")
         raise typer.Exit(0)
 
-    for d in atlas_dirs:
-        print(d, file=sys.stdout)
-    raise typer.Exit(0)
+    if not plan:
+        updater.save_state()
+        if not quiet:
+            stderr_console.print(
+                f"[green]All {total} atlas directories are up to date.[/green]"
+            )
+        raise typer.Exit(0)
+
+    program = updater.command(scan_path)[0]
+    if shutil.which(program) is None:
+        stderr_console.print(
+            f"[red]Error:[/red] Agent '{program}' not found; set --agent or "
+            "ABSTRACT_GEN_AGENT"
+        )
+        raise typer.Exit(1)
+
+    if not quiet:
+        stderr_console.print(
+            f"[dim]Updating {len(plan)} atlas directories, "
+            f"{min(jobs, len(plan))} at a time[/dim]"
+        )
+        for s in plan:
+            stderr_console.print(f"[dim]  {s.path}: {s.reason}[/dim]")
+
+    def on_done(result: UpdateResult) -> None:
+        if result.ok:
+            stderr_console.print(
+                f"[green]✓[/green] {result.path} [dim]({result.seconds:.0f}s)[/dim]"
+            )
+        else:
+            stderr_console.print(f"[red]✗[/red] {result.path}: {result.message}")
+
+    try:
+        results = updater.run(plan, on_done)
+    finally:
+        updater.save_state()
+
+    failed = [r for r in results if not r.ok]
+    if json_output:
+        print(
+            json.dumps(
+                [
+                    {"path": str(r.path), "ok": r.ok, "message": r.message}
+                    for r in results
+                ],
+                indent=2,
+            )
+        )
+    stderr_console.print(f"{len(results) - len(failed)} updated, {len(failed)} failed")
+    raise typer.Exit(1 if failed else 0)
+
+
+def _resolve_scope(path: Path | None, all_projects: bool) -> Path:
+    """Shared list/update scope: PATH, --all, or the default project."""
+    if path is not None:
+        scan_path = path.expanduser().resolve()
+    elif all_projects:
+        scan_path = _SCAN_ROOT.resolve()
+    else:
+        scan_path = (_SCAN_ROOT / _DEFAULT_PROJECT).resolve()
+
+    if not scan_path.is_dir():
+        stderr_console.print(f"[red]Error:[/red] {scan_path} is not a directory")
+        raise typer.Exit(1)
+    return scan_path
+
+
+def _resolve_roots(paths: list[Path]) -> list[Path]:
+    """Resolved scan roots in the order given, each once; exits if one is bad."""
+    roots: list[Path] = []
+    for path in paths:
+        root = path.expanduser().resolve()
+        if not root.exists():
+            stderr_console.print(f"[red]Error: Path not found: {root}[/red]")
+            raise typer.Exit(1)
+        if not root.is_dir():
+            stderr_console.print(f"[red]Error: Not a directory: {root}[/red]")
+            raise typer.Exit(1)
+        if root not in roots:
+            roots.append(root)
+    return roots
+
+
+def _open_cache(root: Path, no_cache: bool) -> ScanCache | None:
+    if no_cache:
+        return None
+    if _daemon_index is not None:
+        _daemon_index.refresh()
+        _daemon_index.cache.reset_stats()
+        return _daemon_index.cache
+    return ScanCache.for_root(root)
+
+
+def _save_caches(caches: list[ScanCache | None]) -> None:
+    saved: set[int] = set()
+    for cache in caches:
+        if cache is not None and id(cache) not in saved:
+            cache.save()
+            saved.add(id(cache))
+
+
+def _walk_stats(
+    scanners: list[Scanner],
+    caches: list[ScanCache | None],
+    found: list[int],
+    dropped: list[int],
+) -> dict[str, Any]:
+    """Walk and cache stats; for several roots, totals plus a ``roots`` list."""
+    opened = list({id(c): c for c in caches if c is not None}.values())
+    if len(scanners) == 1:
+        return {**scanners[0].stats, **(opened[0].stats if opened else {})}
+
+    totals: dict[str, Any] = {}
+    for scanner in scanners:
+        for key, value in scanner.stats.items():
+            if key == "walk_time_ms":  # the walks overlap
+                totals[key] = max(totals.get(key, 0), value)
+            elif key == "workers":
+                totals[key] = value
+            else:
+                totals[key] = totals.get(key, 0) + value
+    if opened:
+        totals.update(ScanCache.combined_stats(opened))
+    totals["duplicate_dirs"] = sum(dropped)
+    totals["roots"] = [
+        {
+            "root": str(scanner.config.root_path),
+            "atlases_found": count,
+            "duplicate_dirs": duplicates,
+            **scanner.stats,
+            **(cache.stats if cache is not None else {}),
+        }
+        for scanner, cache, count, duplicates in zip(
+            scanners, caches, found, dropped, strict=True
+        )
+    ]
+    return totals
 
 
 def _run_scan(
-    path: Path,
+    paths: list[Path],
     format: str = "human",
     show_tree: bool = False,
     export_format: str | None = None,
+    root_at: Path | None = None,
+    tree_depth: int | None = None,
+    max_children: int | None = None,
+    clusters: bool = False,
     has_abstract: bool = False,
     has_overview: bool = False,
     has_both: bool = False,
     depth: int | None = None,
+    workers: int = DEFAULT_WORKERS,
+    prune: list[str] | None = None,
+    ignore_files: bool = False,
+    no_cache: bool = False,
     include_metadata: bool = False,
     show_stats: bool = False,
     validate: bool = False,
     find_orphans: bool = False,
+    stream: bool = False,
+    profiler: Profiler | None = None,
     verbose: bool = False,
     debug: bool = False,
     quiet: bool = False,
 ) -> None:
     start_time = time.time()
+    profiler = profiler or Profiler(enabled=False)
+    phase = profiler.phase
 
-    resolved_path = path.resolve()
-    if not resolved_path.exists():
-        stderr_console.print(f"[red]Error: Path not found: {resolved_path}[/red]")
-        raise typer.Exit(1)
+    roots = _resolve_roots(paths)
+    resolved_path = roots[0]
 
-    if not resolved_path.is_dir():
-        stderr_console.print(f"[red]Error: Not a directory: {resolved_path}[/red]")
+    view = TreeView(max_depth=tree_depth, max_children=max_children)
+    folding = root_at is not None or tree_depth is not None or max_children is not None
+    if folding and not show_tree and export_format != "graphviz":
+        stderr_console.print(
+            "[red]Error: --root-at, --tree-depth and --max-children need "
+            "--tree or --export graphviz[/red]"
+        )
         raise typer.Exit(1)
+    if clusters and export_format != "graphviz":
+        stderr_console.print("[red]Error: --clusters needs --export graphviz[/red]")
+        raise typer.Exit(1)
+    if root_at is not None:
+        # normpath, not resolve: atlas paths keep the symlinks they were found by
+        view.root_at = Path(os.path.normpath(resolved_path / root_at))
+        if not view.root_at.is_dir():
+            stderr_console.print(
+                f"[red]Error: --root-at is not a directory: {view.root_at}[/red]"
+            )
+            raise typer.Exit(1)
 
     config = ScannerConfig(
         root_path=resolved_path,
@@ -305,28 +781,71 @@ def _run_scan(
         has_both=has_both,
         quiet=quiet,
         verbose=verbose,
+        workers=workers,
+        prune=tuple(prune or ()),
+        use_ignore_files=ignore_files,
     )
-
-    scanner = Scanner(config)
+    caches = [_open_cache(root, no_cache) for root in roots]
+    scanners = [
+        Scanner(replace(config, root_path=root), cache)
+        for root, cache in zip(roots, caches, strict=True)
+    ]
 
     if verbose:
-        stderr_console.print(f"[dim]Scanning {resolved_path}...[/dim]")
+        for root in roots:
+            stderr_console.print(f"[dim]Scanning {root}...[/dim]")
 
-    atlases = scanner.scan()
+    if stream:
+        if format not in STREAM_FORMATS or show_tree or export_format or find_orphans:
+            stderr_console.print(
+                "[red]Error: --stream supports --format json (NDJSON) or plain, "
+                "without --tree, --export or --orphans[/red]"
+            )
+            raise typer.Exit(1)
+        _stream_scan(
+            scanners,
+            Exporter(ExportConfig(format=format, include_metadata=include_metadata)),
+            validate=validate,
+            show_stats=show_stats,
+            quiet=quiet,
+            start_time=start_time,
+            profiler=profiler,
+        )
+        return
+
+    with phase("scan"):
+        per_root, dropped = dedupe_roots(scanners, scan_roots(scanners, workers))
 
-    parser = Parser(quiet=quiet)
-    atlases = parser.parse_batch(atlases)
+    # No command outputs the body, so read frontmatter blocks only
+    parsers = [
+        Parser(quiet=quiet, cache=cache, read_body=False, workers=workers)
+        for cache in caches
+    ]
+    with phase("parse"):
+        per_root = [
+            parser.parse_batch(found)
+            for parser, found in zip(parsers, per_root, strict=True)
+        ]
+    atlases = per_root[0]
+    if len(per_root) > 1:
+        atlases = sorted(itertools.chain(*per_root), key=lambda a: a.path)
 
-    all_errors = scanner.errors + parser.errors
+    all_errors = [e for s in scanners for e in s.errors]
+    all_errors.extend(e for p in parsers for e in p.errors)
 
     validator = Validator(quiet=quiet)
     if validate:
-        validation_result = validator.validate(atlases)
+        with phase("validate"):
+            validation_result = validator.validate(atlases)
         all_errors.extend(validation_result.errors)
 
     orphan_dirs: list[Path] = []
     if find_orphans:
-        orphan_dirs = scanner.find_orphans(atlases)
+        with phase("orphans"):
+            orphan_dirs = sorted({o for s in scanners for o in s.find_orphans(atlases)})
+
+    with phase("cache_save"):
+        _save_caches(caches)
 
     scan_time = time.time() - start_time
 
@@ -338,69 +857,501 @@ def _run_scan(
             "scan_time_ms": int(scan_time * 1000),
             "atlases_found": len(atlases),
             "orphan_dirs": len(orphan_dirs),
-            **scanner.stats,
+            **_walk_stats(scanners, caches, [len(a) for a in per_root], dropped),
+            **(_daemon_index.stats if _daemon_index is not None else {}),
         },
     )
 
-    valid_formats = {"human", "json", "yaml", "toml", "plain"}
-    if format not in valid_formats:
+    if format not in _VALID_FORMATS:
         stderr_console.print(
-            f"[red]Error: Invalid format '{format}'. Valid formats: {', '.join(sorted(valid_formats))}[/red]"
+            f"[red]Error: Invalid format '{format}'. Valid formats: {', '.join(sorted(_VALID_FORMATS))}[/red]"
         )
         raise typer.Exit(1)
 
+    # Tree and DOT output can be many MB: written directly, not through rich
     if show_tree:
-        builder = TreeBuilder()
-        tree_output = builder.build_ascii_tree(atlases)
-        stdout_console.print(tree_output)
+        with phase("tree"):
+            builder = TreeBuilder()
+            tree_output = builder.build_ascii_tree(atlases, view)
+        with phase("write"):
+            _write_stdout(tree_output + "\n" if tree_output else "")
     elif export_format == "graphviz":
-        exporter = Exporter(ExportConfig(format="human"))
-        dot_output = exporter.export_graphviz(result)
-        stdout_console.print(dot_output, markup=False)
+        with phase("export"):
+            exporter = Exporter(ExportConfig(format="human"))
+            try:
+                exporter.write_graphviz(atlases, sys.stdout, view, clusters)
+                sys.stdout.flush()
+            except BrokenPipeError:
+                _exit_broken_pipe()
     elif find_orphans:
-        _output_orphans(orphan_dirs, format)
+        with phase("write"):
+            _output_orphans(orphan_dirs, format)
     else:
-        exporter = Exporter(
-            ExportConfig(
-                format=format,
-                include_metadata=include_metadata,
-                show_stats=show_stats,
+        with phase("export"):
+            exporter = Exporter(
+                ExportConfig(
+                    format=format,
+                    include_metadata=include_metadata,
+                    show_stats=show_stats,
+                )
             )
-        )
-        output = exporter.export(result)
-        stdout_console.print(output, markup=False)
+            output = exporter.export(result)
+        with phase("write"):
+            _print_export(output, format)
 
     if not quiet:
-        for error in all_errors:
-            if error.code in (
-                ErrorCode.E002,
-                ErrorCode.E003,
-                ErrorCode.E004,
-                ErrorCode.E011,
-            ):
-                stderr_console.print(f"[yellow]Warning: {error}[/yellow]")
-            else:
-                stderr_console.print(f"[red]Error: {error}[/red]")
+        _print_errors(all_errors)
 
     if show_stats:
-        stats_table = Table(title="Statistics")
-        stats_table.add_column("Metric", style="cyan")
-        stats_table.add_column("Value", style="green")
-        for key, value in result.stats.items():
-            stats_table.add_row(key, str(value))
-        stderr_console.print(stats_table)
+        _print_stats(result.stats)
+
+    if profiler.show:
+        _print_profile(profiler, time.time() - start_time)
 
     if not atlases and not find_orphans:
-        stderr_console.print("[yellow]No atlas files found.[/yellow]")
-        stderr_console.print("Try a different path or check --help for options.")
-        raise typer.Exit(2)
+        _exit_empty()
 
     if validate and any(not a.is_valid for a in atlases):
-        invalid_count = sum(1 for a in atlases if not a.is_valid)
+        _exit_invalid(sum(1 for a in atlases if not a.is_valid))
+
+
+def _print_export(output: str, format: str) -> None:
+    """Machine-readable formats go out verbatim; rich would wrap long lines."""
+    if format == "human":
+        stdout_console.print(output, markup=False)
+    else:
+        _write_stdout(output + "\n")
+
+
+def _write_stdout(text: str) -> None:
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _exit_broken_pipe()
+
+
+def _exit_broken_pipe() -> NoReturn:
+    """The reader went away (``| head``); stop quietly instead of a traceback."""
+    try:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (OSError, ValueError):
+        pass
+    raise typer.Exit(0)
+
+
+def _stream_scan(
+    scanners: list[Scanner],
+    exporter: Exporter,
+    validate: bool,
+    show_stats: bool,
+    quiet: bool,
+    start_time: float,
+    profiler: Profiler,
+) -> None:
+    """Parse, validate and write each directory as the walk reaches it.
+
+    Output bypasses rich and is flushed per directory, so ``| head`` or
+    ``| jq`` see results immediately. Parent references can only be resolved
+    once every directory is known, so those errors, and the checks against
+    enclosing atlases, are reported at the end. Several roots are streamed
+    one after another; a directory an earlier root already reached (same
+    real path) is skipped.
+    """
+    caches = [scanner.cache for scanner in scanners]
+    parsers = [Parser(quiet=quiet, cache=cache, read_body=False) for cache in caches]
+    validator = Validator(quiet=quiet) if validate else None
+    errors: list[ScanError] = []
+    known: set[str] = set()
+    deferred: list[AtlasFile] = []
+    indexed: list[AtlasFile] = []  # parsed without bodies, for validate_hierarchy
+    counts = {"atlases": 0, "invalid": 0}
+    found = [0] * len(scanners)
+    dropped = [0] * len(scanners)
+    seen: set[str] = set()  # real paths written by earlier roots
+    reached: set[str] = set()  # real paths written by the current root
+    phase = profiler.phase
+
+    def emit(i: int, atlases: list[AtlasFile]) -> None:
+        directory = atlases[0].dir_str
+        real = scanners[i].real_paths.get(directory, directory)
+        if real in seen:
+            dropped[i] += 1
+            return
+        reached.add(real)
+        found[i] += len(atlases)
+        parser = parsers[i]
+        with phase("parse"):
+            parser.parse_batch(atlases)
+        if validator is not None:
+            with phase("validate"):
+                validator.validate_fields(atlases, errors)
+                validator.validate_date_consistency(atlases, errors)
+                known.add(os.path.basename(directory))
+                indexed.extend(atlases)
+                deferred.extend(
+                    a
+                    for a in atlases
+                    if validator.unresolved_parent(a, set()) is not None
+                )
+        counts["atlases"] += len(atlases)
+        counts["invalid"] += sum(1 for a in atlases if not a.is_valid)
+        with phase("export"):
+            line = exporter.export_dir(atlases) + "\n"
+        with phase("write"):
+            sys.stdout.write(line)
+            sys.stdout.flush()
+
+    try:
+        for i, scanner in enumerate(scanners):
+            with phase("scan"):
+                scanner.stream(functools.partial(emit, i))
+            seen |= reached
+            reached.clear()
+    except BrokenPipeError:
+        _exit_broken_pipe()
+
+    if validator is not None:
+        with phase("validate"):
+            valid = [a for a in indexed if a.is_valid]
+            validator.validate_parent_refs(deferred, errors, known)
+            validator.validate_hierarchy(indexed, errors)
+        counts["invalid"] += sum(1 for a in valid if not a.is_valid)
+    with phase("cache_save"):
+        _save_caches(caches)
+
+    if not quiet:
+        _print_errors(
+            [e for s in scanners for e in s.errors]
+            + [e for p in parsers for e in p.errors]
+            + errors
+        )
+    if show_stats:
+        _print_stats(
+            {
+                "scan_time_ms": int((time.time() - start_time) * 1000),
+                "atlases_found": counts["atlases"],
+                **_walk_stats(scanners, caches, found, dropped),
+                **(_daemon_index.stats if _daemon_index is not None else {}),
+            }
+        )
+    if profiler.show:
+        _print_profile(profiler, time.time() - start_time)
+    if not counts["atlases"]:
+        _exit_empty()
+    if counts["invalid"]:
+        _exit_invalid(counts["invalid"])
+
+
+def _print_profile(profiler: Profiler, total: float) -> None:
+    table = Table(title="Profile")
+    table.add_column("Phase", style="cyan")
+    table.add_column("ms", style="green", justify="right")
+    table.add_column("%", style="green", justify="right")
+    for name, ms, percent in profiler.report(total):
+        table.add_row(name, f"{ms:.1f}", f"{percent:.1f}")
+    table.add_row("total", f"{total * 1000:.1f}", "100.0", style="bold")
+    stderr_console.print(table)
+
+
+def _print_errors(errors: list[ScanError]) -> None:
+    for error in errors:
+        if error.code in (
+            ErrorCode.E002,
+            ErrorCode.E003,
+            ErrorCode.E004,
+            ErrorCode.E011,
+        ):
+            stderr_console.print(f"[yellow]Warning: {error}[/yellow]")
+        else:
+            stderr_console.print(f"[red]Error: {error}[/red]")
+
+
+def _exit_empty() -> None:
+    stderr_console.print("[yellow]No atlas files found.[/yellow]")
+    stderr_console.print("Try a different path or check --help for options.")
+    raise typer.Exit(2)
+
+
+def _exit_invalid(invalid_count: int) -> None:
+    stderr_console.print(
+        f"[red]Validation failed: {invalid_count} invalid atlas file(s)[/red]"
+    )
+    raise typer.Exit(3)
+
+
+_ROOT_STATS_COLUMNS = (  # all of them are in --format json output
+    "atlases_found",
+    "duplicate_dirs",
+    "dirs_scanned",
+    "walk_time_ms",
+    "cache_hit_rate",
+)
+
+
+def _print_stats(stats: dict[str, Any]) -> None:
+    stats_table = Table(title="Statistics")
+    stats_table.add_column("Metric", style="cyan")
+    stats_table.add_column("Value", style="green")
+    for key, value in stats.items():
+        if key != "roots":
+            stats_table.add_row(key, str(value))
+    stderr_console.print(stats_table)
+
+    roots = stats.get("roots")
+    if roots:
+        columns = [key for key in _ROOT_STATS_COLUMNS if key in roots[0]]
+        roots_table = Table(title="Per-root statistics")
+        roots_table.add_column("root", style="cyan")
+        for key in columns:
+            roots_table.add_column(
+                key.replace("_", " "), style="green", justify="right"
+            )
+        for row in roots:
+            roots_table.add_row(row["root"], *(str(row[key]) for key in columns))
+        stderr_console.print(roots_table)
+
+
+@app.command(name="index")
+def index_catalog(
+    path: Annotated[
+        Path, typer.Argument(help="Directory to catalog", exists=False)
+    ] = Path("."),
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Directory listing threads")
+    ] = DEFAULT_WORKERS,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore the scan cache; full rescan")
+    ] = False,
+    quiet: Annotated[
+        bool, typer.Option("--quiet", "-q", help="Suppress warnings")
+    ] = False,
+) -> None:
+    """Materialize atlases and their frontmatter into a SQLite catalog."""
+    start = time.perf_counter()
+    root = path.expanduser().resolve()
+    if not root.is_dir():
+        stderr_console.print(f"[red]Error:[/red] {root} is not a directory")
+        raise typer.Exit(1)
+
+    config = ScannerConfig(
+        root_path=root,
+        quiet=quiet,
+        workers=workers,
+        prune=tuple(prune or ()),
+        use_ignore_files=ignore_files,
+    )
+    cache = _open_cache(root, no_cache)
+    scanner = Scanner(config, cache)
+    parser = Parser(quiet=quiet, cache=cache, read_body=False, workers=workers)
+    atlases = parser.parse_batch(scanner.scan())
+    Validator(quiet=quiet).validate(atlases)
+    if cache is not None:
+        cache.save()
+
+    catalog = Catalog(catalog_path(root))
+    try:
+        count = catalog.rebuild(root, atlases)
+    finally:
+        catalog.close()
+    if not quiet:
+        elapsed = int((time.perf_counter() - start) * 1000)
         stderr_console.print(
-            f"[red]Validation failed: {invalid_count} invalid atlas file(s)[/red]"
+            f"[dim]Indexed {count} atlas files under {root} in {elapsed} ms[/dim]"
         )
-        raise typer.Exit(3)
+
+
+@app.command(name="query")
+def query_catalog(
+    path: Annotated[
+        Path, typer.Argument(help="Directory to query (within an indexed root)")
+    ] = Path("."),
+    where: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--where",
+            "-w",
+            help="Filter, e.g. 'layer=l1 and date_updated < 30 days ago' "
+            "(repeatable, ANDed)",
+        ),
+    ] = None,
+    format: Annotated[
+        str,
+        typer.Option(
+            "--format", "-f", help="Output format: human, json, yaml, toml, plain"
+        ),
+    ] = "human",
+    metadata: Annotated[
+        bool, typer.Option("--metadata", "-m", help="Include frontmatter")
+    ] = False,
+    stats: Annotated[
+        bool, typer.Option("--stats", "-s", help="Show timing statistics")
+    ] = False,
+) -> None:
+    """Filter the catalog built by `index`, without walking the filesystem."""
+    start = time.perf_counter()
+    scope = path.expanduser().resolve()
+    found = find_catalog(scope)
+    if found is None:
+        stderr_console.print(
+            f"[red]Error:[/red] No catalog covers {scope}; "
+            f"run 'abstract_gen.py index {scope}' first"
+        )
+        raise typer.Exit(1)
+    db_path, root = found
+    if format not in _VALID_FORMATS:
+        stderr_console.print(
+            f"[red]Error: Invalid format '{format}'. Valid formats: {', '.join(sorted(_VALID_FORMATS))}[/red]"
+        )
+        raise typer.Exit(1)
+
+    conditions, params = [], []
+    try:
+        for expr in where or ():
+            sql, values = compile_where(expr)
+            conditions.append(sql)
+            params += values
+    except QueryError as e:
+        stderr_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    catalog = Catalog(db_path)
+    try:
+        atlases = catalog.query(
+            " AND ".join(conditions), params, under=None if scope == root else scope
+        )
+        meta = catalog.meta()
+    finally:
+        catalog.close()
+
+    result = ScanResult(
+        atlases=atlases,
+        stats={
+            "query_time_ms": int((time.perf_counter() - start) * 1000),
+            "atlases_found": len(atlases),
+            "catalog_root": str(root),
+            "indexed_at": meta.get("indexed_at", ""),
+        },
+    )
+    exporter = Exporter(
+        ExportConfig(format=format, include_metadata=metadata, show_stats=stats)
+    )
+    output = exporter.export(result)
+    if output:
+        _print_export(output, format)
+    if stats:
+        _print_stats(result.stats)
+    if not atlases:
+        stderr_console.print("[yellow]No atlas files match.[/yellow]")
+        raise typer.Exit(2)
+
+
+@app.command(name="serve")
+def serve_index(
+    path: Annotated[
+        Path | None,
+        typer.Argument(help="Root to index (default: ~/Documents/github_local)"),
+    ] = None,
+    workers: Annotated[
+        int, typer.Option("--workers", "-j", min=1, help="Directory listing threads")
+    ] = DEFAULT_WORKERS,
+    prune: Annotated[
+        list[str] | None,
+        typer.Option("--prune", help="Also prune dirs matching this glob (repeatable)"),
+    ] = None,
+    ignore_files: Annotated[
+        bool,
+        typer.Option("--ignore-files", help="Honor .gitignore and .atlasignore"),
+    ] = False,
+    no_watch: Annotated[
+        bool,
+        typer.Option("--no-watch", help="Revalidate by stat instead of inotify"),
+    ] = False,
+    quiet: Annotated[
+        bool, typer.Option("--quiet", "-q", help="Suppress warnings")
+    ] = False,
+) -> None:
+    """Keep the atlas index in memory and answer list/scan/orphans/validate."""
+    global _daemon_index
+    root = (path.expanduser() if path is not None else _SCAN_ROOT).resolve()
+    if not root.is_dir():
+        stderr_console.print(f"[red]Error:[/red] {root} is not a directory")
+        raise typer.Exit(1)
+
+    config = ScannerConfig(
+        root_path=root,
+        quiet=True,
+        workers=workers,
+        prune=tuple(prune or ()),
+        use_ignore_files=ignore_files,
+    )
+    index = AtlasIndex(config, watch=not no_watch)
+    sock = socket_path()
+
+    def ready(_server: object) -> None:
+        if quiet:
+            return
+        mode = "inotify" if index.cache.trusted else "stat checks"
+        stderr_console.print(
+            f"[dim]Serving {root} on {sock} ({mode}, "
+            f"{index.stats['daemon_refresh_ms']} ms initial walk)[/dim]"
+        )
+
+    _daemon_index = index
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        serve(index, _serve_request, sock, ready)
+    except FileExistsError as e:
+        stderr_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+    finally:
+        _daemon_index = None
+
+
+def _serve_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Run one forwarded CLI invocation in this process, capturing its output."""
+    global stdout_console, stderr_console
+    argv = request.get("argv")
+    if not isinstance(argv, list) or not argv or argv[0] not in SERVED_COMMANDS:
+        return {"exit_code": None}
+
+    out, err = io.StringIO(), io.StringIO()
+    width = request.get("width") or 80
+    no_color = bool(request.get("no_color"))
+    saved = stdout_console, stderr_console, os.getcwd()
+    stdout_console = Console(
+        file=out,
+        force_terminal=bool(request.get("stdout_tty")),
+        no_color=no_color,
+        width=width,
+    )
+    stderr_console = Console(
+        file=err,
+        force_terminal=bool(request.get("stderr_tty")),
+        no_color=no_color,
+        width=width,
+    )
+    try:
+        os.chdir(request.get("cwd") or "/")
+        with redirect_stdout(out), redirect_stderr(err):
+            app([str(a) for a in argv], prog_name="abstract_gen")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except OSError:
+        return {"exit_code": None}  # e.g. the client's cwd is gone; run locally
+    finally:
+        stdout_console, stderr_console, cwd = saved
+        os.chdir(cwd)
+    return {"stdout": out.getvalue(), "stderr": err.getvalue(), "exit_code": code}
 
 
 def _output_orphans(orphan_dirs: list[Path], format: str) -> None:
@@ -409,9 +1360,7 @@ def _output_orphans(orphan_dirs: list[Path], format: str) -> None:
         return
 
     if format == "json":
-        stdout_console.print(
-            json.dumps([str(p) for p in orphan_dirs], indent=2), markup=False
-        )
+        _write_stdout(json.dumps([str(p) for p in orphan_dirs], indent=2) + "\n")
     else:
         stderr_console.print(
             f"[yellow]Orphan directories (missing atlases): {len(orphan_dirs)}[/yellow]\n"
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#     "typer>=0.9.0",
+#     "rich>=13.0.0",
+#     "pyyaml>=6.0",
+#     "tomli-w>=1.0",
+# ]
+# ///
+"""benchmark - Time abstract_gen commands on synthetic trees.
+
+Trees are generated deterministically from a spec (size, depth, fan-out,
+atlas density, junk ``node_modules``) and kept between runs under
+``--workdir``. Each command runs end to end in a fresh interpreter, as a user
+would run it, with ``--profile-out`` collecting per-phase timings. Results
+are JSON, keyed by tree spec and command, so runs on different commits can
+be compared with ``--compare``.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ABSTRACT_GEN = SCRIPT_DIR / "abstract_gen.py"
+RESULTS_VERSION = 1
+COMPLETE_MARKER = ".bench_tree.json"
+
+# name -> abstract_gen arguments; {root} is the tree root
+COMMANDS: dict[str, list[str]] = {
+    "scan": ["scan", "{root}", "--format", "plain", "-q"],
+    "list": ["list", "{root}", "-q"],
+    "validate": ["validate", "{root}", "-q"],
+    "orphans": ["orphans", "{root}", "-q"],
+    "tree": ["scan", "{root}", "--tree", "-q"],
+    "graphviz": ["scan", "{root}", "--export", "graphviz", "-q"],
+}
+CACHE_MODES = ("cold", "warm")
+
+app = typer.Typer(name="benchmark", help=__doc__, add_completion=False)
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    dirs: int
+    depth: int = 6
+    fanout: int = 0  # 0: smallest fan-out that reaches `dirs` within `depth`
+    atlas_density: float = 0.2  # share of directories holding atlas files
+    node_modules: float = 0.02  # share of directories with a junk subtree
+    files_per_dir: int = 2
+    seed: int = 0
+
+    @property
+    def branching(self) -> int:
+        if self.fanout:
+            return self.fanout
+        fanout = 2
+        while sum(fanout**k for k in range(1, self.depth + 1)) < self.dirs:
+            fanout += 1
+        return fanout
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{_label(self.dirs)}-d{self.depth}-f{self.branching}"
+            f"-a{self.atlas_density:g}-nm{self.node_modules:g}-s{self.seed}"
+        )
+
+
+def _label(count: int) -> str:
+    for suffix, size in (("m", 1_000_000), ("k", 1000)):
+        if count >= size and count % size == 0:
+            return f"{count // size}{suffix}"
+    return str(count)
+
+
+def parse_size(text: str) -> int:
+    """``10k`` -> 10000, ``1.5m`` -> 1500000."""
+    text = text.strip().lower()
+    scale = {"k": 1000, "m": 1_000_000}.get(text[-1:], 1)
+    number = text[:-1] if scale > 1 else text
+    try:
+        return int(float(number) * scale)
+    except ValueError:
+        raise typer.BadParameter(f"Not a size: {text!r}") from None
+
+
+def _frontmatter(layer: int, name: str, parent: str, date: dt.date, valid: bool) -> str:
+    lines = [
+        "---",
+        "type: atlas",
+        f"layer: l{layer}",
+        "corpus: code" if valid else "",
+        f"scope: {'top' if layer == 0 else 'sub'}",
+        "root: root",
+        f"parent: {parent}",
+        f"date_updated: {date.isoformat()}",
+        "---",
+        f"# {name}",
+        "",
+    ]
+    return "\n".join(line for line in lines if line != "") + "\n"
+
+
+def generate(spec: TreeSpec, root: Path) -> dict[str, int]:
+    """Build *spec* breadth-first under *root*; returns what was created.
+
+    One atlas directory in ten gets only ``.abstract.md`` (an orphan), and
+    one in two hundred misses a required field (a validation error).
+    """
+    rng = random.Random(spec.seed)
+    fanout = spec.branching
+    base_date = dt.date(2026, 1, 1)
+    counts = {"dirs": 0, "atlas_dirs": 0, "orphan_dirs": 0, "junk_dirs": 0}
+
+    def make_dir(
+        path: Path, depth: int, atlas: tuple[int, str] | None
+    ) -> tuple[int, str] | None:
+        path.mkdir()
+        counts["dirs"] += 1
+        for i in range(spec.files_per_dir):
+            (path / f"file{i}.py").write_text(f"# {path.name} {i}\n")
+        if depth == 0 or rng.random() < spec.atlas_density:
+            layer = 0 if atlas is None else atlas[0] + 1
+            date = base_date + dt.timedelta(days=rng.randrange(365))
+            text = _frontmatter(
+                layer,
+                path.name,
+                "" if atlas is None else atlas[1],
+                date,
+                valid=rng.random() >= 0.005,
+            )
+            (path / ".abstract.md").write_text(text)
+            if depth == 0 or rng.random() >= 0.1:
+                (path / ".overview.md").write_text(text)
+            else:
+                counts["orphan_dirs"] += 1
+            counts["atlas_dirs"] += 1
+            atlas = (layer, path.name)
+        if depth > 0 and rng.random() < spec.node_modules:
+            for pkg in range(10):
+                lib = path / "node_modules" / f"pkg{pkg}" / "lib"
+                lib.mkdir(parents=True)
+                (lib.parent / "package.json").write_text("{}\n")
+            counts["junk_dirs"] += 21
+        return atlas
+
+    queue = deque([(root, 0, make_dir(root, 0, None))])
+    while queue and counts["dirs"] < spec.dirs:
+        path, depth, atlas = queue.popleft()
+        if depth >= spec.depth:
+            continue
+        for i in range(fanout):
+            if counts["dirs"] >= spec.dirs:
+                break
+            child = path / f"d{i}"
+            queue.append((child, depth + 1, make_dir(child, depth + 1, atlas)))
+    return counts
+
+
+def ensure_tree(spec: TreeSpec, workdir: Path) -> tuple[Path, dict[str, Any]]:
+    """The generated tree for *spec*, reused if a complete one exists."""
+    root = workdir / spec.name
+    marker = root / COMPLETE_MARKER
+    try:
+        return root, json.loads(marker.read_text())
+    except (OSError, ValueError):
+        pass
+    if root.exists():
+        shutil.rmtree(root)  # an interrupted generation
+    workdir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    counts = generate(spec, root)
+    info = {
+        "name": spec.name,
+        "spec": asdict(spec) | {"fanout": spec.branching},
+        **counts,
+        "generate_s": round(time.perf_counter() - start, 2),
+    }
+    marker.write_text(json.dumps(info, indent=2) + "\n")
+    return root, info
+
+
+def run_case(
+    root: Path,
+    argv: list[str],
+    cache_mode: str,
+    repeat: int,
+    cache_dir: Path,
+) -> dict[str, Any]:
+    """Run one command *repeat* times; median wall time and phases."""
+    args = [arg.replace("{root}", str(root)) for arg in argv]
+    if cache_mode == "cold":
+        args.append("--no-cache")
+    env = {
+        **os.environ,
+        "ABSTRACT_GEN_CACHE_DIR": str(cache_dir),
+        "ABSTRACT_GEN_NO_DAEMON": "1",
+        "NO_COLOR": "1",
+    }
+
+    def once(profile: Path | None) -> tuple[float, int]:
+        extra = ["--profile-out", str(profile)] if profile is not None else []
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, str(ABSTRACT_GEN), *args, *extra],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return (time.perf_counter() - start) * 1000, proc.returncode
+
+    if cache_mode == "warm":
+        once(None)  # populate the cache
+
+    runs: list[float] = []
+    phases: dict[str, list[float]] = {}
+    exit_code = 0
+    with tempfile.TemporaryDirectory(prefix="abstract_gen_bench_") as tmp:
+        for i in range(repeat):
+            profile = Path(tmp) / f"run{i}.json"
+            wall_ms, exit_code = once(profile)
+            runs.append(round(wall_ms, 1))
+            try:
+                data = json.loads(profile.read_text())
+            except (OSError, ValueError):
+                continue
+            for name, ms in data["phases_ms"].items():
+                phases.setdefault(name, []).append(ms)
+
+    return {
+        "args": args,
+        "exit_code": exit_code,
+        "runs_ms": runs,
+        "median_ms": round(statistics.median(runs), 1),
+        "min_ms": min(runs),
+        "phases_ms": {
+            name: round(statistics.median(values), 1) for name, values in phases.items()
+        },
+    }
+
+
+def _git(*args: str) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=SCRIPT_DIR, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def environment() -> dict[str, Any]:
+    status = _git("status", "--porcelain", "--", ".")
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": dt.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _key(result: dict[str, Any]) -> tuple[str, str, str]:
+    return result["tree"], result["command"], result["cache"]
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Median wall time of each case against *baseline*."""
+    old = {_key(r): r for r in baseline.get("results", [])}
+    lines = []
+    for result in current["results"]:
+        before = old.get(_key(result))
+        if before is None:
+            continue
+        ratio = (
+            result["median_ms"] / before["median_ms"]
+            if before["median_ms"]
+            else math.inf
+        )
+        lines.append(
+            f"{result['tree']:<32} {result['command']:<9} {result['cache']:<5}"
+            f" {before['median_ms']:>9.1f} -> {result['median_ms']:>9.1f} ms"
+            f"  x{ratio:.2f}"
+        )
+    return lines
+
+
+@app.command()
+def main(
+    sizes: Annotated[
+        str,
+        typer.Option("--sizes", help="Comma-separated directory counts: 10k,100k,500k"),
+    ] = "10k",
+    depth: Annotated[int, typer.Option("--depth", min=1, help="Max tree depth")] = 6,
+    fanout: Annotated[
+        int, typer.Option("--fanout", min=0, help="Children per directory (0: derive)")
+    ] = 0,
+    atlas_density: Annotated[
+        float,
+        typer.Option(
+            "--atlas-density", min=0, max=1, help="Share of dirs with atlases"
+        ),
+    ] = 0.2,
+    node_modules: Annotated[
+        float,
+        typer.Option(
+            "--node-modules", min=0, max=1, help="Share of dirs with junk node_modules"
+        ),
+    ] = 0.02,
+    seed: Annotated[int, typer.Option("--seed", help="Tree generator seed")] = 0,
+    commands: Annotated[
+        str, typer.Option("--commands", help=f"Comma-separated: {','.join(COMMANDS)}")
+    ] = ",".join(COMMANDS),
+    cache: Annotated[
+        str, typer.Option("--cache", help="Comma-separated cache modes: cold,warm")
+    ] = ",".join(CACHE_MODES),
+    repeat: Annotated[
+        int, typer.Option("--repeat", "-r", min=1, help="Timed runs per case")
+    ] = 3,
+    workdir: Annotated[
+        Path, typer.Option("--workdir", help="Where generated trees are kept")
+    ] = Path(tempfile.gettempdir()) / "abstract_gen_bench",
+    out: Annotated[
+        Path | None,
+        typer.Option("--out", "-o", help="Write JSON results here (default stdout)"),
+    ] = None,
+    baseline: Annotated[
+        Path | None,
+        typer.Option("--compare", help="Earlier results JSON to compare against"),
+    ] = None,
+) -> None:
+    """Generate synthetic trees and time abstract_gen commands on them."""
+    names = [c.strip() for c in commands.split(",") if c.strip()]
+    modes = [m.strip() for m in cache.split(",") if m.strip()]
+    unknown = [n for n in names if n not in COMMANDS] + [
+        m for m in modes if m not in CACHE_MODES
+    ]
+    if unknown:
+        raise typer.BadParameter(f"Unknown command or cache mode: {', '.join(unknown)}")
+
+    specs = [
+        TreeSpec(
+            parse_size(size), depth, fanout, atlas_density, node_modules, seed=seed
+        )
+        for size in sizes.split(",")
+    ]
+    report: dict[str, Any] = {
+        "version": RESULTS_VERSION,
+        "environment": environment(),
+        "trees": [],
+        "results": [],
+    }
+    for spec in specs:
+        print(f"tree {spec.name}: generating or reusing", file=sys.stderr)
+        root, info = ensure_tree(spec, workdir)
+        report["trees"].append(info)
+        with tempfile.TemporaryDirectory(
+            prefix="abstract_gen_bench_cache_"
+        ) as cache_dir:
+            for name in names:
+                for mode in modes:
+                    result = run_case(
+                        root, COMMANDS[name], mode, repeat, Path(cache_dir)
+                    )
+                    report["results"].append(
+                        {"tree": spec.name, "command": name, "cache": mode, **result}
+                    )
+                    phases = " ".join(
+                        f"{k}={v:.0f}" for k, v in result["phases_ms"].items()
+                    )
+                    print(
+                        f"  {name:<9} {mode:<5} {result['median_ms']:>9.1f} ms  {phases}",
+                        file=sys.stderr,
+                    )
+
+    text = json.dumps(report, indent=2) + "\n"
+    if out is not None:
+        out.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+    if baseline is not None:
+        for line in compare(json.loads(baseline.read_text()), report):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1 @@
+"""abstract_gen library: scan, parse, validate, and export atlas files."""
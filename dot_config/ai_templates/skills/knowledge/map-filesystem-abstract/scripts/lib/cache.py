@@ -0,0 +1,235 @@
+"""Incremental scan cache, two JSON files per scan root.
+
+A directory's listing is reused while its mtime is unchanged (adding,
+removing or renaming an entry bumps it); every directory is still stat'ed,
+which is far cheaper than listing it. Parsed frontmatter is reused while an
+atlas file's size and mtime are unchanged. Entries not seen during a run are
+dropped on save, so deleted directories do not accumulate.
+
+Parsed files are kept in a second file that is only loaded when a file is
+first looked up, so runs that never parse (``list``) neither pay for it in
+memory nor rewrite it.
+
+The ``serve`` daemon keeps a *trusted* cache in memory: filesystem watches
+invalidate entries as things change, so lookups skip the ``stat`` checks.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Override location with ABSTRACT_GEN_CACHE_DIR
+CACHE_DIR = Path(
+    os.environ.get("ABSTRACT_GEN_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "abstract_gen"
+)
+CACHE_VERSION = 2
+FILES_SUFFIX = ".files.json"
+
+
+def json_default(value: Any) -> Any:
+    """JSON has no dates; YAML frontmatter does (``date_updated``)."""
+    if isinstance(value, dt.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Cannot cache {type(value).__name__}")
+
+
+def json_object_hook(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__date__" in obj:
+            return dt.date.fromisoformat(obj["__date__"])
+        if "__datetime__" in obj:
+            return dt.datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def _hit_stats(hits: dict[str, int], misses: dict[str, int]) -> dict[str, Any]:
+    found = sum(hits.values())
+    total = found + sum(misses.values())
+    return {
+        "cache_dir_hits": hits["dirs"],
+        "cache_file_hits": hits["files"],
+        "cache_hit_rate": round(found / total, 3) if total else 0.0,
+    }
+
+
+def cache_path(root: Path) -> Path:
+    digest = hashlib.sha1(os.fsencode(os.path.realpath(root))).hexdigest()[:16]
+    return CACHE_DIR / f"{digest}.json"
+
+
+class ScanCache:
+    trusted = False  # entries are kept current by a watcher; skip stat checks
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.files_path = path.with_suffix(FILES_SUFFIX)
+        self._dirs: dict[str, dict[str, Any]] = {}
+        self._files: dict[str, dict[str, Any]] | None = None  # not loaded yet
+        self._files_lock = threading.Lock()
+        self._seen_dirs: dict[str, dict[str, Any]] = {}
+        self._seen_files: dict[str, dict[str, Any]] = {}
+        self.reset_stats()
+        self._load()
+
+    @classmethod
+    def for_root(cls, root: Path) -> ScanCache:
+        return cls(cache_path(root))
+
+    def _load(self) -> None:
+        self._dirs = self._read(self.path, "dirs")
+
+    @staticmethod
+    def _read(path: Path, key: str) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(path.read_text(), object_hook=json_object_hook)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get(key) or {}
+
+    def _file_entries(self) -> dict[str, dict[str, Any]]:
+        """Parsed-file entries, read from disk on first use (by any thread)."""
+        if self._files is None:
+            with self._files_lock:
+                if self._files is None:
+                    self._files = self._read(self.files_path, "files")
+        return self._files
+
+    # Directory listings. lookup_dir runs on scanner worker threads and only
+    # reads; record_dir runs on the calling thread.
+
+    def lookup_dir(self, path: str, mtime_ns: int | None) -> dict[str, Any] | None:
+        """Cached listing of *path*; ``mtime_ns=None`` trusts the entry."""
+        if mtime_ns is None:
+            return self._dirs.get(path)
+        entry = self._seen_dirs.get(path) or self._dirs.get(path)
+        if entry is not None and entry["mtime_ns"] == mtime_ns:
+            return entry
+        return None
+
+    def record_dir(self, path: str, entry: dict[str, Any], hit: bool) -> None:
+        self._seen_dirs[path] = entry
+        self._count("dirs", hit)
+
+    # Parsed atlas files
+
+    def lookup_file(
+        self, path: str, st: os.stat_result | None
+    ) -> dict[str, Any] | None:
+        """Cached parse of *path*; ``st=None`` trusts the entry."""
+        entry = self._file_entries().get(path)
+        if st is None:
+            return entry
+        if (
+            entry is not None
+            and entry["mtime_ns"] == st.st_mtime_ns
+            and entry["size"] == st.st_size
+        ):
+            return entry
+        return None
+
+    def record_file(self, path: str, entry: dict[str, Any], hit: bool) -> None:
+        self._seen_files[path] = entry
+        self._count("files", hit)
+
+    # Daemon bookkeeping
+
+    def invalidate(self, path: str) -> bool:
+        """Forget *path* as a directory and as a file; True if anything was cached."""
+        found = False
+        files = self._file_entries()
+        for entries in (self._dirs, files, self._seen_dirs, self._seen_files):
+            found = entries.pop(path, None) is not None or found
+        return found
+
+    def clear(self) -> None:
+        self._dirs, self._files = {}, {}
+        self.begin_run()
+
+    def begin_run(self) -> None:
+        """Start a fresh set of seen entries and counters."""
+        self._seen_dirs, self._seen_files = {}, {}
+        self.reset_stats()
+
+    def rollover(self) -> None:
+        """Make the entries seen this run the baseline for the next lookups."""
+        self._dirs = self._seen_dirs
+        if self._files is not None:
+            self._files = self._seen_files
+        self.begin_run()
+
+    def reset_stats(self) -> None:
+        self.hits = {"dirs": 0, "files": 0}
+        self.misses = {"dirs": 0, "files": 0}
+
+    @property
+    def dir_paths(self) -> list[str]:
+        return list(self._dirs)
+
+    def _count(self, kind: str, hit: bool) -> None:
+        if hit:
+            self.hits[kind] += 1
+        else:
+            self.misses[kind] += 1
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return _hit_stats(self.hits, self.misses)
+
+    @staticmethod
+    def combined_stats(caches: Iterable[ScanCache]) -> dict[str, Any]:
+        """:attr:`stats` over several caches (a multi-root scan)."""
+        hits = {"dirs": 0, "files": 0}
+        misses = {"dirs": 0, "files": 0}
+        for cache in caches:
+            for kind in hits:
+                hits[kind] += cache.hits[kind]
+                misses[kind] += cache.misses[kind]
+        return _hit_stats(hits, misses)
+
+    def save(self) -> None:
+        """Write entries seen this run atomically; failures are not fatal.
+
+        The file entries are left alone if no file was looked up this run.
+        """
+        loaded = self._files is not None or self._seen_files
+        files = self._seen_files if loaded else None
+        self._write(self._seen_dirs, files)
+
+    def _write(
+        self,
+        dirs: dict[str, dict[str, Any]],
+        files: dict[str, dict[str, Any]] | None,
+    ) -> None:
+        self._write_json(self.path, "dirs", dirs)
+        if files is not None:
+            self._write_json(self.files_path, "files", files)
+
+    @staticmethod
+    def _write_json(path: Path, key: str, entries: dict[str, dict[str, Any]]) -> None:
+        data = {"version": CACHE_VERSION, key: entries}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            # dumps uses the C encoder; dump to a file iterates in pure Python
+            text = json.dumps(data, default=json_default, separators=(",", ":"))
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except (OSError, TypeError):
+            Path(tmp).unlink(missing_ok=True)
@@ -0,0 +1,394 @@
+"""SQLite atlas catalog: frontmatter materialized into indexed columns.
+
+``index`` writes one row per atlas file; ``query`` filters rows with a small
+expression language compiled to SQL, so answers come from indexes instead of
+a filesystem walk::
+
+    layer=l1 and date_updated < 30 days ago
+    corpus = code or (scope ~ 'api*' and not valid = true)
+    parent.layer = l0            # atlas whose parent atlas dir is at l0
+    child.date_updated > today   # atlas with a child dated in the future
+
+``parent.FIELD`` / ``child.FIELD`` join on ``parent_dir``: the nearest
+ancestor directory holding an atlas (the tree the ``--tree`` view shows).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from lib import cache
+from lib.frontmatter import intern_frontmatter
+from lib.models import ATLAS_FILENAMES, AtlasFile
+from lib.tree_builder import TreeBuilder
+from lib.validator import parse_date, parse_level
+
+SCHEMA_VERSION = 1
+CATALOG_SUFFIX = ".catalog.sqlite3"
+
+# Query field -> (column, kind)
+FIELDS: dict[str, tuple[str, str]] = {
+    "path": ("path", "text"),
+    "dir": ("dir", "text"),
+    "file": ("file", "text"),  # abstract | overview
+    "type": ("type", "text"),
+    "layer": ("layer", "text"),
+    "level": ("level", "int"),  # numeric part of layer: l2 -> 2
+    "corpus": ("corpus", "text"),
+    "scope": ("scope", "text"),
+    "root": ("root", "text"),
+    "parent": ("parent", "text"),
+    "date_updated": ("date_updated", "date"),
+    "depth": ("depth", "int"),  # directory depth below the catalog root
+    "valid": ("valid", "bool"),
+}
+_INDEXED = (
+    "dir",
+    "parent_dir",
+    "layer",
+    "level",
+    "corpus",
+    "scope",
+    "root",
+    "parent",
+    "date_updated",
+)
+_OPS = {
+    "=": "=",
+    "==": "=",
+    "!=": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+    "~": "GLOB",
+}
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<quoted>'[^']*'|"[^"]*")
+      | (?P<op>==|!=|<=|>=|=|<|>|~)
+      | (?P<paren>[()])
+      | (?P<word>[^\s()'"=!<>~]+)
+    )""",
+    re.VERBOSE,
+)
+_AGO = re.compile(r"^(\d+)\s*(day|week|month|year)s?\s+ago$")
+_UNIT_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+
+class QueryError(ValueError):
+    """Malformed ``--where`` expression."""
+
+
+def catalog_path(root: Path) -> Path:
+    return cache.cache_path(root).with_suffix(CATALOG_SUFFIX)
+
+
+def find_catalog(path: Path) -> tuple[Path, Path] | None:
+    """Catalog covering *path*: its own, or the nearest ancestor's.
+
+    Returns ``(catalog_file, catalog_root)``.
+    """
+    for candidate in (path, *path.parents):
+        db = catalog_path(candidate)
+        if db.exists():
+            return db, candidate
+    return None
+
+
+# -- expression parsing ------------------------------------------------------
+
+
+def _tokenize(expr: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    expr = expr.strip()
+    while pos < len(expr):
+        match = _TOKEN.match(expr, pos)
+        if match is None or match.end() == pos:
+            raise QueryError(f"Unexpected input at: {expr[pos:]!r}")
+        kind = match.lastgroup or ""
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+        while pos < len(expr) and expr[pos].isspace():
+            pos += 1
+    return tokens
+
+
+def _date_value(text: str, today: dt.date) -> str:
+    lowered = text.lower()
+    if lowered == "today":
+        return today.isoformat()
+    if lowered == "yesterday":
+        return (today - dt.timedelta(days=1)).isoformat()
+    if match := _AGO.match(lowered):
+        days = int(match.group(1)) * _UNIT_DAYS[match.group(2)]
+        return (today - dt.timedelta(days=days)).isoformat()
+    date = parse_date(text)
+    if date is None:
+        raise QueryError(
+            f"Invalid date: {text!r} (use YYYY-MM-DD, today or 'N days ago')"
+        )
+    return date.isoformat()
+
+
+def _coerce(field: str, kind: str, text: str, today: dt.date) -> Any:
+    if kind == "date":
+        return _date_value(text, today)
+    if kind == "int":
+        digits = text[1:] if field == "level" and text[:1] == "l" else text
+        try:
+            return int(digits)
+        except ValueError:
+            raise QueryError(f"{field} expects a number, got {text!r}") from None
+    if kind == "bool":
+        if text.lower() in ("true", "yes", "1"):
+            return 1
+        if text.lower() in ("false", "no", "0"):
+            return 0
+        raise QueryError(f"{field} expects true or false, got {text!r}")
+    return text
+
+
+class _Parser:
+    """Recursive descent: or > and > not > (expr) | field op value."""
+
+    def __init__(self, expr: str, today: dt.date) -> None:
+        self.tokens = _tokenize(expr)
+        self.pos = 0
+        self.today = today
+        self.params: list[Any] = []
+
+    def parse(self) -> str:
+        if not self.tokens:
+            raise QueryError("Empty expression")
+        sql = self._or()
+        if self.pos != len(self.tokens):
+            raise QueryError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return sql
+
+    def _peek_word(self) -> str | None:
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == "word":
+            return self.tokens[self.pos][1].lower()
+        return None
+
+    def _or(self) -> str:
+        parts = [self._and()]
+        while self._peek_word() == "or":
+            self.pos += 1
+            parts.append(self._and())
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def _and(self) -> str:
+        parts = [self._not()]
+        while self._peek_word() == "and":
+            self.pos += 1
+            parts.append(self._not())
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def _not(self) -> str:
+        if self._peek_word() == "not":
+            self.pos += 1
+            return f"NOT {self._not()}"
+        if self.pos < len(self.tokens) and self.tokens[self.pos] == ("paren", "("):
+            self.pos += 1
+            sql = self._or()
+            if self.pos >= len(self.tokens) or self.tokens[self.pos] != ("paren", ")"):
+                raise QueryError("Missing ')'")
+            self.pos += 1
+            return sql
+        return self._comparison()
+
+    def _comparison(self) -> str:
+        if self._peek_word() is None:
+            raise QueryError("Expected a field name")
+        name = self.tokens[self.pos][1].lower()
+        self.pos += 1
+        if self.pos >= len(self.tokens) or self.tokens[self.pos][0] != "op":
+            raise QueryError(f"Expected an operator after {name!r}")
+        op = _OPS[self.tokens[self.pos][1]]
+        self.pos += 1
+        raw, quoted = self._value()
+
+        relation, _, field = name.rpartition(".")
+        if relation not in ("", "parent", "child") or field not in FIELDS:
+            raise QueryError(
+                f"Unknown field {name!r}; fields: {', '.join(FIELDS)}"
+                " (prefix parent. or child. to join)"
+            )
+        column, kind = FIELDS[field]
+        alias = {"": "a", "parent": "p", "child": "c"}[relation]
+        if not quoted and raw.lower() == "none":
+            if op not in ("=", "!="):
+                raise QueryError(f"Only = and != compare with none ({name})")
+            test = f"{alias}.{column} IS {'NOT ' if op == '!=' else ''}NULL"
+        else:
+            if op == "GLOB" and kind != "text":
+                raise QueryError(f"~ only applies to text fields ({name})")
+            self.params.append(_coerce(field, kind, raw, self.today))
+            test = f"{alias}.{column} {op} ?"
+
+        if relation == "parent":
+            return (
+                "EXISTS (SELECT 1 FROM atlases p"
+                f" WHERE p.dir = a.parent_dir AND {test})"
+            )
+        if relation == "child":
+            return (
+                "EXISTS (SELECT 1 FROM atlases c"
+                f" WHERE c.parent_dir = a.dir AND {test})"
+            )
+        return test
+
+    def _value(self) -> tuple[str, bool]:
+        """A quoted string, or bare words up to and/or/')' ('30 days ago').
+
+        Returns ``(text, quoted)``; only a bare ``none`` means NULL.
+        """
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == "quoted":
+            self.pos += 1
+            return self.tokens[self.pos - 1][1][1:-1], True
+        words = []
+        while self.pos < len(self.tokens):
+            kind, text = self.tokens[self.pos]
+            if kind != "word" or text.lower() in ("and", "or"):
+                break
+            words.append(text)
+            self.pos += 1
+        if not words:
+            raise QueryError("Expected a value")
+        return " ".join(words), False
+
+
+def compile_where(expr: str, today: dt.date | None = None) -> tuple[str, list[Any]]:
+    """Compile a filter expression to an SQL condition over alias ``a``."""
+    parser = _Parser(expr, today or dt.date.today())
+    return parser.parse(), parser.params
+
+
+# -- storage -----------------------------------------------------------------
+
+
+def _text(value: Any) -> str | None:
+    return None if value in (None, "") else str(value)
+
+
+class Catalog:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._create()
+
+    def _create(self) -> None:
+        db = self._db
+        db.executescript(
+            "DROP TABLE IF EXISTS atlases; DROP TABLE IF EXISTS meta;"
+            "CREATE TABLE atlases ("
+            " path TEXT PRIMARY KEY, dir TEXT NOT NULL, parent_dir TEXT,"
+            " file TEXT NOT NULL, type TEXT, layer TEXT, level INTEGER,"
+            " corpus TEXT, scope TEXT, root TEXT, parent TEXT, date_updated TEXT,"
+            " depth INTEGER NOT NULL, valid INTEGER NOT NULL,"
+            " frontmatter TEXT NOT NULL, errors TEXT NOT NULL);"
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+        )
+        for column in _INDEXED:
+            db.execute(f"CREATE INDEX idx_{column} ON atlases({column})")
+        db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def rebuild(self, root: Path, atlases: Iterable[AtlasFile]) -> int:
+        """Replace the catalog contents with *atlases* (parsed, validated)."""
+        atlases = list(atlases)
+        tree = TreeBuilder().build(atlases)
+        parent_dirs = {
+            str(child["path"]): key
+            for key, node in tree["nodes"].items()
+            for child in node["children"]
+        }
+        root_str = os.fspath(root)
+        rows = []
+        for atlas in atlases:
+            fm = atlas.frontmatter or {}
+            directory = atlas.dir_str
+            relative = os.path.relpath(directory, root_str)
+            date = parse_date(fm["date_updated"]) if fm.get("date_updated") else None
+            rows.append(
+                (
+                    atlas.path_str,
+                    directory,
+                    parent_dirs.get(directory),
+                    atlas.atlas_type.value,
+                    _text(fm.get("type")),
+                    atlas.layer,
+                    parse_level(atlas.layer),
+                    _text(fm.get("corpus")),
+                    _text(fm.get("scope")),
+                    _text(fm.get("root")),
+                    _text(fm.get("parent")),
+                    date.isoformat() if date else None,
+                    0 if relative == "." else relative.count(os.sep) + 1,
+                    int(atlas.is_valid),
+                    json.dumps(fm, default=cache.json_default),
+                    json.dumps(atlas.validation_errors),
+                )
+            )
+        with self._db as db:
+            db.execute("DELETE FROM atlases")
+            db.executemany(f"INSERT INTO atlases VALUES ({', '.join('?' * 16)})", rows)
+            db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("root", root_str),
+                    ("indexed_at", dt.datetime.now().isoformat(timespec="seconds")),
+                ],
+            )
+        return len(rows)
+
+    def meta(self) -> dict[str, str]:
+        return dict(self._db.execute("SELECT key, value FROM meta").fetchall())
+
+    def query(
+        self, where: str = "", params: Iterable[Any] = (), under: Path | None = None
+    ) -> list[AtlasFile]:
+        """Atlases matching *where* (from :func:`compile_where`), in path order."""
+        conditions, values = [], list(params)
+        if where:
+            conditions.append(where)
+        if under is not None:
+            prefix = os.fspath(under)
+            # Index-friendly prefix match: dir == prefix or starts with prefix/
+            conditions.append("(a.dir = ? OR (a.dir >= ? AND a.dir < ?))")
+            values += [prefix, prefix + os.sep, prefix + chr(ord(os.sep) + 1)]
+        sql = "SELECT a.path, a.frontmatter, a.valid, a.errors FROM atlases a"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY a.path"
+        root = self.meta().get("root")
+        atlases = []
+        for row in self._db.execute(sql, values):
+            path = row["path"]
+            atlas = AtlasFile(
+                path,
+                ATLAS_FILENAMES[os.path.basename(path)],
+                frontmatter=intern_frontmatter(
+                    json.loads(row["frontmatter"], object_hook=cache.json_object_hook)
+                ),
+                is_valid=bool(row["valid"]),
+                validation_errors=json.loads(row["errors"]),
+                root=root,
+            )
+            atlases.append(atlas)
+        return atlases
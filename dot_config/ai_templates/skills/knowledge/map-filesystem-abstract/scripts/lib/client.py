@@ -0,0 +1,79 @@
+"""Thin client: hand a CLI invocation to a running ``serve`` daemon.
+
+Imported before typer and rich, so it sticks to the standard library. Any
+failure to reach the daemon returns None and the CLI runs locally.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+from lib import cache
+
+SERVED_COMMANDS = frozenset({"list", "scan", "orphans", "validate"})
+SOCKET_NAME = "serve.sock"
+CLIENT_TIMEOUT = 120.0  # seconds; a slower daemon is treated as absent
+
+
+def socket_path() -> Path:
+    return cache.CACHE_DIR / SOCKET_NAME
+
+
+def _terminal_width() -> int:
+    """Width as rich would pick it locally: COLUMNS, then any std stream's tty."""
+    try:
+        return int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        pass
+    for fd in (0, 1, 2):
+        try:
+            return os.get_terminal_size(fd).columns
+        except OSError:
+            continue
+    return 80
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* on the daemon and print its output; returns the exit code.
+
+    Returns None (nothing printed) when no daemon answers, when the command
+    is not served, or when ``ABSTRACT_GEN_NO_DAEMON`` is set.
+    """
+    if not argv or argv[0] not in SERVED_COMMANDS:
+        return None
+    if os.environ.get("ABSTRACT_GEN_NO_DAEMON"):
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "stdout_tty": sys.stdout.isatty(),
+        "stderr_tty": sys.stderr.isatty(),
+        "no_color": "NO_COLOR" in os.environ,
+        "width": _terminal_width(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT)
+            sock.connect(os.fspath(path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            chunks = []
+            while chunk := sock.recv(1 << 16):
+                chunks.append(chunk)
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(response, dict) or response.get("exit_code") is None:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    return int(response["exit_code"])
@@ -0,0 +1,209 @@
+"""``serve`` daemon: keep the scan cache hot and answer CLI queries.
+
+The daemon walks its root once, then keeps an in-memory, *trusted*
+:class:`~lib.cache.ScanCache` current with inotify watches. An event drops
+the affected directory listing or parsed file. The next query walks the
+cache, so only changed directories are listed and only changed atlases are
+parsed. Queries run the regular CLI code, so output matches a local run.
+
+Without inotify (or past the watch limit) the cache stays untrusted and
+every query revalidates it by ``stat``, like a normal cached run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from lib.cache import ScanCache, cache_path
+from lib.ignore import IGNORE_FILENAMES
+from lib.parser import Parser
+from lib.scanner import Scanner, ScannerConfig
+from lib.watcher import (
+    ENTRY_EVENTS,
+    SELF_EVENTS,
+    InotifyWatcher,
+    WatchLimitError,
+    inotify_available,
+)
+
+MAX_REQUEST = 1 << 20
+
+RequestHandler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class _DaemonCache(ScanCache):
+    """Persisted by the daemon on exit; query runs must not overwrite it."""
+
+    def save(self) -> None:
+        pass
+
+    def persist(self) -> None:
+        self._write(self._dirs, self._files)
+
+
+class AtlasIndex:
+    def __init__(self, config: ScannerConfig, watch: bool = True) -> None:
+        self.config = config
+        self.cache = _DaemonCache(cache_path(config.root_path))
+        self.lock = threading.RLock()
+        self.dirty = True
+        self.refreshes = 0
+        self.stats: dict[str, Any] = {}
+        self.watcher: InotifyWatcher | None = None
+        self.watch_limit_hit = False
+        if watch and inotify_available():
+            self.watcher = InotifyWatcher(self._on_event)
+
+    def refresh(self) -> None:
+        """Re-walk the root from the cache if anything changed since last time."""
+        with self.lock:
+            if not self.dirty and self.cache.trusted:
+                return
+            self.dirty = False
+            start = time.perf_counter()
+            cache = self.cache
+            cache.begin_run()
+            scanner = Scanner(self.config, cache)
+            atlases = scanner.scan()
+            parser = Parser(
+                quiet=True, cache=cache, read_body=False, workers=self.config.workers
+            )
+            parser.parse_batch(atlases)
+            cache.rollover()
+            self._watch()
+            self.refreshes += 1
+            self.stats = {
+                "daemon_refreshes": self.refreshes,
+                "daemon_refresh_ms": int((time.perf_counter() - start) * 1000),
+                "daemon_watched_dirs": self.watcher.watched if self.watcher else 0,
+            }
+
+    def _watch(self) -> None:
+        if self.watcher is None or self.watch_limit_hit:
+            return
+        try:
+            added = self.watcher.sync(self.cache.dir_paths)
+        except WatchLimitError:
+            # Fall back to stat checks; the watcher thread is closed on exit
+            self.watch_limit_hit = True
+            self.watcher.sync(())
+            self.cache.trusted = False
+            return
+        # A change between listing a directory and watching it produced no
+        # event; compare new watches against the cache once.
+        if self._stale(added):
+            self.dirty = True
+        self.cache.trusted = True
+
+    def _stale(self, paths: list[str]) -> bool:
+        cache = self.cache
+        stale = False
+        for path in paths:
+            try:
+                entry = cache.lookup_dir(path, os.stat(path).st_mtime_ns)
+            except OSError:
+                entry = None
+            if entry is None:
+                stale = cache.invalidate(path) or stale
+                continue
+            for name in entry["atlas"]:
+                file_path = os.path.join(path, name)
+                try:
+                    fresh = cache.lookup_file(file_path, os.stat(file_path))
+                except OSError:
+                    fresh = None
+                if fresh is None:
+                    stale = cache.invalidate(file_path) or stale
+        return stale
+
+    def _on_event(self, dir_path: str | None, name: str, mask: int) -> None:
+        with self.lock:
+            if dir_path is None:  # event queue overflowed; changes were lost
+                self.cache.clear()
+                self.dirty = True
+                return
+            changed = name in IGNORE_FILENAMES  # re-read on every walk
+            if mask & (ENTRY_EVENTS | SELF_EVENTS):
+                changed = self.cache.invalidate(dir_path) or changed
+            if name:
+                changed = self.cache.invalidate(os.path.join(dir_path, name)) or changed
+            if changed:
+                self.dirty = True
+
+    def close(self) -> None:
+        """Stop watching and persist the cache; safe to call twice."""
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
+        with self.lock:
+            self.cache.persist()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline(MAX_REQUEST))
+        except ValueError:
+            return
+        if not isinstance(request, dict):
+            return
+        index = self.server.index
+        with index.lock:
+            response = self.server.handle_request_data(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, path: str, index: AtlasIndex, handle: RequestHandler) -> None:
+        self.index = index
+        self.handle_request_data = handle
+        super().__init__(path, _Handler)
+
+
+def daemon_running(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(os.fspath(path))
+    except OSError:
+        return False
+    return True
+
+
+def serve(
+    index: AtlasIndex,
+    handle: RequestHandler,
+    path: Path,
+    ready: Callable[[socketserver.BaseServer], None] | None = None,
+) -> None:
+    """Answer requests on *path* until interrupted or shut down.
+
+    *handle* runs one CLI call; *ready* is called with the listening server.
+    """
+    if daemon_running(path):
+        raise FileExistsError(f"A daemon is already listening on {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)  # stale socket from a crashed daemon
+
+    index.refresh()
+    if index.watcher is not None:
+        index.watcher.start()
+    server = _Server(os.fspath(path), index, handle)
+    try:
+        os.chmod(path, 0o600)
+        if ready is not None:
+            ready(server)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+        index.close()
@@ -0,0 +1,198 @@
+"""Render scan results as human, json, yaml, toml, plain, tree, or DOT output.
+
+``json`` and ``plain`` can also be streamed one directory at a time
+(:meth:`Exporter.export_dir`); streamed JSON is NDJSON, one record per line.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from lib.models import AtlasFile, ErrorCode, ScanError, ScanResult
+from lib.tree_builder import MORE_LABEL, TreeBuilder, TreeView
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - declared in the script header
+    yaml = None
+
+try:
+    import tomli_w
+except ImportError:  # pragma: no cover - declared in the script header
+    tomli_w = None
+
+
+STREAM_FORMATS = ("json", "plain")
+
+
+@dataclass
+class ExportConfig:
+    format: str = "human"
+    include_metadata: bool = False
+    show_stats: bool = False
+
+
+def _drop_none(value: Any) -> Any:
+    """TOML has no null; strip None values recursively."""
+    if isinstance(value, dict):
+        return {k: _drop_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_none(v) for v in value]
+    return value
+
+
+def _dot_quote(text: str) -> str:
+    return '"' + text.replace('"', '\\"') + '"'
+
+
+class Exporter:
+    def __init__(self, config: ExportConfig | None = None) -> None:
+        self.config = config or ExportConfig()
+
+    def export(self, result: ScanResult) -> str:
+        if not result.atlases:
+            return ""
+
+        fmt = self.config.format
+        if fmt == "plain":
+            return "\n".join(a.path_str for a in result.atlases)
+        if fmt == "json":
+            return json.dumps(self._payload(result), indent=2, default=str)
+        if fmt == "yaml":
+            return self._export_yaml(result)
+        if fmt == "toml":
+            return self._export_toml(result)
+        return self._export_human(result)
+
+    def export_dir(self, atlases: list[AtlasFile]) -> str:
+        """One directory's atlases: a compact JSON record, or plain paths."""
+        if self.config.format == "plain":
+            return "\n".join(a.path_str for a in atlases)
+        return "\n".join(
+            json.dumps(record, default=str) for record in self._records(atlases)
+        )
+
+    def _records(self, atlases: list[AtlasFile]) -> list[dict[str, Any]]:
+        """One record per directory, in path order."""
+        by_dir: dict[str, list[AtlasFile]] = {}
+        for atlas in sorted(atlases, key=lambda a: a.path):
+            by_dir.setdefault(atlas.dir_str, []).append(atlas)
+
+        records = []
+        for path, group in by_dir.items():
+            record: dict[str, Any] = {
+                "path": path,
+                "files": [a.atlas_type.value for a in group],
+                "layer": next((a.layer for a in group if a.layer), None),
+                "is_valid": all(a.is_valid for a in group),
+            }
+            if self.config.include_metadata:
+                record["frontmatter"] = next(
+                    (a.frontmatter for a in group if a.frontmatter), {}
+                )
+            records.append(record)
+        return records
+
+    def _payload(self, result: ScanResult) -> Any:
+        records = self._records(result.atlases)
+        if self.config.show_stats:
+            return {"atlases": records, "stats": result.stats}
+        return records
+
+    def _export_human(self, result: ScanResult) -> str:
+        lines = []
+        for record in self._records(result.atlases):
+            lines.append(f"{record['path']} ({', '.join(record['files'])})")
+            for key, value in (record.get("frontmatter") or {}).items():
+                lines.append(f"    {key}: {'' if value is None else value}")
+        return "\n".join(lines)
+
+    def _export_yaml(self, result: ScanResult) -> str:
+        if yaml is None:
+            return "# PyYAML not installed; JSON fallback\n" + json.dumps(
+                self._payload(result), indent=2, default=str
+            )
+        return yaml.safe_dump(self._payload(result), sort_keys=False).rstrip("\n")
+
+    def _export_toml(self, result: ScanResult) -> str:
+        payload = {"atlases": self._records(result.atlases)}
+        if self.config.show_stats:
+            payload["stats"] = result.stats
+        if tomli_w is None:
+            return "# tomli-w not installed; JSON fallback\n" + json.dumps(
+                payload, indent=2, default=str
+            )
+        return tomli_w.dumps(_drop_none(payload)).rstrip("\n")
+
+    def export_tree(self, result: ScanResult) -> str:
+        return TreeBuilder().build_ascii_tree(result.atlases)
+
+    def export_graphviz(self, result: ScanResult) -> str:
+        """Render the atlas hierarchy as a Graphviz DOT digraph."""
+        out = io.StringIO()
+        self.write_graphviz(result.atlases, out)
+        return out.getvalue().rstrip("\n")
+
+    def write_graphviz(
+        self,
+        atlases: list[AtlasFile],
+        out: TextIO,
+        view: TreeView | None = None,
+        clusters: bool = False,
+    ) -> None:
+        """Write the DOT digraph to *out* node by node as the tree is walked.
+
+        With *clusters*, each ``scope: top`` atlas and its subtree go in a
+        ``subgraph cluster_*``; ``dot`` lays clusters out separately, which
+        keeps large roots tractable. An edge into a cluster is written after
+        the cluster closes, so its tail stays outside.
+        """
+        write = out.write
+        write("digraph atlases {\n  rankdir=LR;\n  node [shape=box, style=rounded];\n")
+        indent = "  "
+        open_clusters: list[tuple[int, str]] = []  # (id(node), deferred edge)
+        for event, node, arg in TreeBuilder().walk(atlases, view):
+            key = _dot_quote(str(node["path"]))
+            if event == "node":
+                edge = (
+                    f"{_dot_quote(str(arg['path']))} -> {key};\n"
+                    if arg is not None
+                    else ""
+                )
+                if clusters and node["scope"] == "top":
+                    cluster = _dot_quote("cluster_" + str(node["path"]))
+                    write(f"{indent}subgraph {cluster} {{\n")
+                    indent += "  "
+                    write(f"{indent}label={_dot_quote(node['name'])};\n")
+                    open_clusters.append((id(node), edge))
+                    edge = ""
+                label = node["name"] + "\\n" + ", ".join(node["atlases"])
+                if node["layer"]:
+                    label += f" ({node['layer']})"
+                write(f"{indent}{key} [label={_dot_quote(label)}];\n")
+                if edge:
+                    write(indent + edge)
+            elif event == "more":
+                more = _dot_quote(str(node["path"]) + "#more")
+                label = _dot_quote(MORE_LABEL.format(arg))
+                write(f"{indent}{more} [label={label}, shape=plaintext];\n")
+                write(f"{indent}{key} -> {more};\n")
+            elif open_clusters and open_clusters[-1][0] == id(node):
+                indent = indent[:-2]
+                write(f"{indent}}}\n")
+                edge = open_clusters.pop()[1]
+                if edge:
+                    write(indent + edge)
+        write("}\n")
+
+    def check_graphviz_available(self) -> ScanError | None:
+        if shutil.which("dot") is None:
+            return ScanError(
+                ErrorCode.E012,
+                "Graphviz 'dot' not found; install graphviz to render DOT output",
+            )
+        return None
@@ -0,0 +1,69 @@
+"""Split atlas files into frontmatter and body, and compact loaded frontmatter.
+
+Kept apart from :mod:`lib.parser` so :class:`lib.models.AtlasFile` can read
+its body on first access without importing the parser.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+
+def split_frontmatter(text: str) -> tuple[str | None, str]:
+    """Split ``---``-delimited frontmatter from the body.
+
+    Returns (frontmatter_text, body); frontmatter_text is None when the file
+    does not open with a complete ``---`` block.
+    """
+    if not text.startswith("---"):
+        return None, text
+    lines = text.splitlines(keepends=True)
+    if lines[0].rstrip() != "---":
+        return None, text
+    for i, line in enumerate(lines[1:], 1):
+        if line.rstrip() == "---":
+            return "".join(lines[1:i]), "".join(lines[i + 1 :])
+    return None, text
+
+
+def read_frontmatter(path: str | os.PathLike[str]) -> str | None:
+    """Read *path* only up to the closing ``---``; the body is never loaded.
+
+    Returns the frontmatter text, or None as :func:`split_frontmatter` would.
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        if f.readline().rstrip() != "---":
+            return None
+        lines = []
+        for line in f:
+            if line.rstrip() == "---":
+                return "".join(lines)
+            lines.append(line)
+    return None
+
+
+def read_body(path: str | os.PathLike[str]) -> str:
+    """The body of *path* as :func:`split_frontmatter` returns it ("" if unreadable)."""
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            return split_frontmatter(f.read())[1]
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def intern_frontmatter(frontmatter: dict[str, Any]) -> dict[str, Any]:
+    """A copy of *frontmatter* with its keys and string values interned.
+
+    Across a large tree the same few values (``type: atlas``, layer and
+    corpus names, the project root) repeat in every file; interning keeps
+    one copy of each instead of one per file.
+    """
+    intern = sys.intern
+    return {
+        intern(key) if type(key) is str else key: (
+            intern(value) if type(value) is str else value
+        )
+        for key, value in frontmatter.items()
+    }
@@ -0,0 +1,129 @@
+"""Directory pruning: built-in rules plus opt-in .gitignore/.atlasignore files.
+
+Pruning happens before a directory is queued, so a matched subtree is never
+opened. Only directories are tested; ignore patterns that can only match
+files are harmless.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass
+
+# Dependency, build, SDK and cache directories; atlases never live there.
+DEFAULT_PRUNE_NAMES = frozenset(
+    {
+        "__pycache__",
+        "bower_components",
+        "build",
+        "dist",
+        "google-cloud-sdk",
+        "node_modules",
+        "site-packages",
+        "target",
+        "vendor",
+        "vendors",
+        "venv",
+    }
+)
+IGNORE_FILENAMES = (".gitignore", ".atlasignore")
+
+
+def is_pruned(name: str, extra: tuple[str, ...] = ()) -> bool:
+    """Built-in rules (hidden, dependency/build dirs, archives) and *extra* globs."""
+    if name.startswith(".") or name in DEFAULT_PRUNE_NAMES:
+        return True
+    if "archived" in name.lower():
+        return True
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in extra)
+
+
+def _glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a gitignore glob (``*``, ``?``, ``[...]``, ``**``) to a regex."""
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and (end := pattern.find("]", i + 1)) != -1:
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(out))
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    anchored: bool  # contains a slash: match the path relative to the file
+
+
+@dataclass(frozen=True)
+class IgnoreFile:
+    base: str  # directory holding the ignore file
+    rules: tuple[IgnoreRule, ...]
+
+    @classmethod
+    def parse(cls, base: str, text: str) -> IgnoreFile:
+        rules = []
+        for line in text.splitlines():
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith(("\\#", "\\!")):
+                line = line[1:]
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            rules.append(IgnoreRule(_glob_to_regex(line.lstrip("/")), negate, anchored))
+        return cls(base, tuple(rules))
+
+    @classmethod
+    def read(cls, base: str, path: str) -> IgnoreFile | None:
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return cls.parse(base, f.read())
+        except OSError:
+            return None
+
+    def match(self, path: str, name: str) -> bool | None:
+        """True if ignored, False if re-included by ``!``, None if no rule applies."""
+        relative = path[len(self.base) :].lstrip("/")
+        result = None
+        for rule in self.rules:
+            if rule.regex.fullmatch(relative if rule.anchored else name):
+                result = not rule.negate
+        return result
+
+
+def is_ignored(path: str, name: str, ignore_files: tuple[IgnoreFile, ...]) -> bool:
+    """Deeper ignore files take precedence, as in git."""
+    for ignore_file in reversed(ignore_files):
+        matched = ignore_file.match(path, name)
+        if matched is not None:
+            return matched
+    return False
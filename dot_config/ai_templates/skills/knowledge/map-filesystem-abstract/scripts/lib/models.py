@@ -0,0 +1,161 @@
+"""Data models shared by the scanner, parser, validator, and exporters."""
+
+from __future__ import annotations
+
+import os
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from lib.frontmatter import read_body
+
+
+class AtlasType(str, Enum):
+    ABSTRACT = "abstract"
+    OVERVIEW = "overview"
+
+
+ATLAS_FILENAMES: dict[str, AtlasType] = {
+    ".abstract.md": AtlasType.ABSTRACT,
+    ".overview.md": AtlasType.OVERVIEW,
+}
+
+REQUIRED_FIELDS = ("type", "layer", "corpus", "scope", "root")
+
+
+class ErrorCode(str, Enum):
+    E001 = "E001"  # path not found or not a directory
+    E002 = "E002"  # permission denied
+    E003 = "E003"  # symlink cycle
+    E004 = "E004"  # unreadable atlas file
+    E005 = "E005"  # missing or invalid frontmatter
+    E006 = "E006"  # broken parent reference
+    E007 = "E007"  # missing required field
+    E008 = "E008"  # invalid layer format
+    E009 = "E009"  # invalid date_updated
+    E010 = "E010"  # parent, root or layer disagrees with the enclosing atlas
+    E011 = "E011"  # date_updated older than a child atlas
+    E012 = "E012"  # graphviz not installed
+
+
+@dataclass(slots=True)
+class ScanError:
+    code: ErrorCode
+    message: str
+    path: Path | None = None
+
+    def __str__(self) -> str:
+        where = f" ({self.path})" if self.path is not None else ""
+        return f"{self.code.value}: {self.message}{where}"
+
+
+class AtlasFile:
+    """One atlas file. A large scan holds one per file, so it is kept lean.
+
+    The path is stored as *root*, a string shared by every atlas of a scan,
+    plus :attr:`rel_path` below it; :attr:`path` builds a :class:`Path` on
+    access. ``content`` is read from disk the first time it is used unless a
+    parser already set it.
+    """
+
+    __slots__ = (
+        "root",
+        "rel_path",
+        "atlas_type",
+        "frontmatter",
+        "_content",
+        "is_valid",
+        "validation_errors",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        atlas_type: AtlasType,
+        frontmatter: dict[str, Any] | None = None,
+        content: str | None = None,
+        is_valid: bool = True,
+        validation_errors: list[str] | None = None,
+        root: str | None = None,
+    ) -> None:
+        path = os.fspath(path)
+        prefix = root if root is None or root.endswith(os.sep) else root + os.sep
+        if prefix is not None and path.startswith(prefix):
+            self.root = sys.intern(root)
+            self.rel_path = path[len(prefix) :]
+        else:
+            self.root = ""
+            self.rel_path = path
+        self.atlas_type = atlas_type
+        self.frontmatter = {} if frontmatter is None else frontmatter
+        self._content = content
+        self.is_valid = is_valid
+        self.validation_errors = [] if validation_errors is None else validation_errors
+
+    def __repr__(self) -> str:
+        return (
+            f"AtlasFile(path={self.path_str!r}, atlas_type={self.atlas_type!s}, "
+            f"is_valid={self.is_valid!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Same file, type and frontmatter; whether the body was loaded is moot."""
+        if not isinstance(other, AtlasFile):
+            return NotImplemented
+        return (self.path_str, self.atlas_type, self.frontmatter) == (
+            other.path_str,
+            other.atlas_type,
+            other.frontmatter,
+        )
+
+    @property
+    def path_str(self) -> str:
+        return os.path.join(self.root, self.rel_path) if self.root else self.rel_path
+
+    @property
+    def dir_str(self) -> str:
+        return os.path.dirname(self.path_str)
+
+    @property
+    def path(self) -> Path:
+        return Path(self.path_str)
+
+    @property
+    def dir_path(self) -> Path:
+        return Path(self.dir_str)
+
+    @property
+    def content(self) -> str:
+        """The Markdown body below the frontmatter."""
+        if self._content is None:
+            self._content = read_body(self.path_str)
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
+    @property
+    def layer(self) -> str | None:
+        layer = (self.frontmatter or {}).get("layer")
+        return str(layer) if layer is not None else None
+
+    def add_error(self, message: str) -> None:
+        self.validation_errors.append(message)
+        self.is_valid = False
+
+
+@dataclass(slots=True)
+class ScanResult:
+    atlases: list[AtlasFile] = field(default_factory=list)
+    orphans: list[Path] = field(default_factory=list)
+    errors: list[ScanError] = field(default_factory=list)
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    atlases: list[AtlasFile] = field(default_factory=list)
+    errors: list[ScanError] = field(default_factory=list)
@@ -0,0 +1,169 @@
+"""YAML frontmatter parsing for atlas files."""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import yaml
+
+from lib.cache import ScanCache
+from lib.frontmatter import intern_frontmatter, read_frontmatter, split_frontmatter
+from lib.models import REQUIRED_FIELDS, AtlasFile, ErrorCode, ScanError
+
+FRONTMATTER_ERROR = "Missing or invalid YAML frontmatter"
+LAYER_PATTERN = re.compile(r"^l\d+$")
+PARALLEL_MIN = 64  # smaller batches are not worth a thread pool
+
+# libyaml is several times faster and loads the same types
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _Loaded(NamedTuple):
+    """Outcome of reading one atlas file, computed off the calling thread."""
+
+    stat: os.stat_result | None = None
+    cached: dict[str, Any] | None = None
+    frontmatter: dict[str, Any] | None = None
+    content: str | None = None  # None when the body was not read
+    read_error: Exception | None = None
+    frontmatter_error: bool = False
+
+
+class Parser:
+    def __init__(
+        self,
+        quiet: bool = False,
+        cache: ScanCache | None = None,
+        read_body: bool = True,
+        workers: int = 1,
+    ) -> None:
+        self.quiet = quiet
+        self.cache = cache
+        self.read_body = read_body  # False: frontmatter only, body read on access
+        self.workers = workers
+        self.errors: list[ScanError] = []
+
+    def parse(self, atlas: AtlasFile) -> AtlasFile:
+        """Read *atlas* from disk and fill in frontmatter and content in place.
+
+        With a cache, files whose size and mtime are unchanged are not read.
+        """
+        self._apply(atlas, self._load(atlas))
+        return atlas
+
+    def parse_batch(self, atlases: list[AtlasFile]) -> list[AtlasFile]:
+        """Parse *atlases*; large batches are read on a thread pool.
+
+        Workers only read and YAML-load; results are applied here in input
+        order, so errors come out the same as with a serial parse.
+        """
+        if self.workers <= 1 or len(atlases) < PARALLEL_MIN:
+            return [self.parse(atlas) for atlas in atlases]
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="parse") as pool:
+            loaded = list(pool.map(self._load, atlases))
+        for atlas, result in zip(atlases, loaded, strict=True):
+            self._apply(atlas, result)
+        return atlases
+
+    def _load(self, atlas: AtlasFile) -> _Loaded:
+        """Read and YAML-load one file. Touches no parser or atlas state."""
+        st = None
+        cache = self.cache
+        if cache is not None:
+            key = atlas.path_str
+            if cache.trusted and self._usable(entry := cache.lookup_file(key, None)):
+                return _Loaded(cached=entry)
+            try:
+                st = os.stat(atlas.path_str)
+            except OSError:
+                pass  # reported by the read below
+            else:
+                if self._usable(entry := cache.lookup_file(key, st)):
+                    return _Loaded(stat=st, cached=entry)
+
+        try:
+            if self.read_body:
+                with open(atlas.path_str, encoding="utf-8-sig") as f:
+                    raw, content = split_frontmatter(f.read())
+            else:
+                raw, content = read_frontmatter(atlas.path_str), None
+        except (OSError, UnicodeDecodeError) as e:
+            return _Loaded(read_error=e)
+
+        if raw is None:
+            return _Loaded(st, content=content, frontmatter_error=True)
+        try:
+            frontmatter: Any = yaml.load(raw, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            return _Loaded(st, content=content, frontmatter_error=True)
+        if frontmatter is None:
+            frontmatter = {}
+        elif not isinstance(frontmatter, dict):
+            return _Loaded(st, content=content, frontmatter_error=True)
+        return _Loaded(st, frontmatter=intern_frontmatter(frontmatter), content=content)
+
+    def _usable(self, entry: dict[str, Any] | None) -> bool:
+        """Entries from a metadata-only parse carry no body."""
+        return entry is not None and (
+            entry["content"] is not None or not self.read_body
+        )
+
+    def _apply(self, atlas: AtlasFile, loaded: _Loaded) -> None:
+        key = atlas.path_str
+        if loaded.read_error is not None:
+            e = loaded.read_error
+            self.errors.append(
+                ScanError(ErrorCode.E004, f"Cannot read atlas file: {e}", atlas.path)
+            )
+            atlas.add_error(f"Cannot read file: {e}")
+            return
+        if loaded.cached is not None:
+            self.cache.record_file(key, loaded.cached, hit=True)
+            self._restore(atlas, loaded.cached)
+            return
+
+        atlas.frontmatter = loaded.frontmatter or {}
+        if loaded.content is not None:
+            atlas.content = loaded.content
+        if loaded.frontmatter_error:
+            self._frontmatter_error(atlas)
+        if self.cache is not None and loaded.stat is not None:
+            entry = {
+                "mtime_ns": loaded.stat.st_mtime_ns,
+                "size": loaded.stat.st_size,
+                "frontmatter": atlas.frontmatter,
+                "content": loaded.content,
+                "errors": list(atlas.validation_errors),
+            }
+            self.cache.record_file(key, entry, hit=False)
+
+    def _restore(self, atlas: AtlasFile, entry: dict[str, Any]) -> None:
+        atlas.frontmatter = intern_frontmatter(entry["frontmatter"])
+        if self.read_body:
+            atlas.content = entry["content"]
+        for message in entry["errors"]:
+            if message == FRONTMATTER_ERROR:
+                self._frontmatter_error(atlas)
+            else:
+                atlas.add_error(message)
+
+    def _frontmatter_error(self, atlas: AtlasFile) -> None:
+        atlas.add_error(FRONTMATTER_ERROR)
+        self.errors.append(ScanError(ErrorCode.E005, FRONTMATTER_ERROR, atlas.path))
+
+    @staticmethod
+    def validate_frontmatter_fields(atlas: AtlasFile) -> list[str]:
+        """Return human-readable problems with required fields and layer format."""
+        frontmatter = atlas.frontmatter or {}
+        errors = [
+            f"Missing required field: {name}"
+            for name in REQUIRED_FIELDS
+            if frontmatter.get(name) in (None, "")
+        ]
+        layer = frontmatter.get("layer")
+        if layer not in (None, "") and not LAYER_PATTERN.match(str(layer)):
+            errors.append(f"Invalid layer format: {layer!r} (expected l0, l1, ...)")
+        return errors
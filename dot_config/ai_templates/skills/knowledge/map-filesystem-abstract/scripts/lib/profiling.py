@@ -0,0 +1,160 @@
+"""Per-phase timing and profile files for ``scan --profile``.
+
+:class:`Profiler` times named phases on the calling thread; a phase nested in
+another is subtracted from its parent, so the phases add up to the total.
+
+:func:`record` writes a profile of the whole command. ``*.json`` files get
+the phase timings (for ``benchmark.py`` and other tools). ``*.folded`` and
+``*.collapsed`` files get collapsed stacks (``frame;frame;frame count``) for
+flamegraph.pl, speedscope or inferno, sampled from every thread. Any other
+path gets a cProfile dump for ``pstats`` or snakeviz; cProfile only sees the
+main thread, so scanner and parser worker threads are missing from it.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from types import FrameType
+
+PHASES_SUFFIX = ".json"
+COLLAPSED_SUFFIXES = (".folded", ".collapsed")
+SAMPLE_INTERVAL = 0.001  # seconds
+
+
+_DISABLED = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.profiler._nested.append(0.0)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        nested = profiler._nested.pop()
+        timings = profiler.timings
+        timings[self.name] = timings.get(self.name, 0.0) + elapsed - nested
+        if profiler._nested:
+            profiler._nested[-1] += elapsed
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True, show: bool = False) -> None:
+        self.enabled = enabled
+        self.show = show  # print the phase table when the command ends
+        self.timings: dict[str, float] = {}  # phase -> exclusive seconds
+        self._nested: list[float] = []
+
+    @classmethod
+    def for_options(cls, profile: bool, profile_out: Path | None) -> Profiler:
+        """Enabled for ``--profile`` or a ``--profile-out`` JSON file."""
+        return cls(
+            enabled=profile
+            or (profile_out is not None and profile_out.suffix == PHASES_SUFFIX),
+            show=profile,
+        )
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a ``with`` block; a shared no-op when disabled (cheap per dir)."""
+        return _Phase(self, name) if self.enabled else _DISABLED
+
+    def report(self, total: float) -> list[tuple[str, float, float]]:
+        """``(phase, ms, percent of total)`` rows plus the untimed remainder."""
+        rows = [(name, seconds) for name, seconds in self.timings.items()]
+        rows.append(("other", max(0.0, total - sum(self.timings.values()))))
+        return [
+            (name, seconds * 1000, 100 * seconds / total if total else 0.0)
+            for name, seconds in rows
+        ]
+
+
+class StackSampler:
+    """Counts every thread's Python stack at a fixed interval."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    stack = ";".join(reversed(list(_frames(frame))))
+                    self.counts[f"{names.get(ident, ident)};{stack}"] += 1
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def _frames(frame: FrameType | None) -> Iterator[str]:
+    while frame is not None:
+        code = frame.f_code
+        yield f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        frame = frame.f_back
+
+
+@contextmanager
+def record(path: Path | None, profiler: Profiler | None = None) -> Iterator[None]:
+    """Profile the block into *path*: phases, collapsed stacks or pstats."""
+    if path is None:
+        yield
+        return
+    if path.suffix == PHASES_SUFFIX:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings = profiler.timings if profiler is not None else {}
+            data = {
+                "total_ms": round((time.perf_counter() - start) * 1000, 3),
+                "phases_ms": {k: round(v * 1000, 3) for k, v in timings.items()},
+            }
+            path.write_text(json.dumps(data, indent=2) + "\n")
+        return
+    if path.suffix in COLLAPSED_SUFFIXES:
+        sampler = StackSampler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write(path)
+        return
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
@@ -0,0 +1,420 @@
+"""Atlas file discovery.
+
+Directories are listed with ``os.scandir`` on a thread pool: each listed
+directory yields its subdirectories as new jobs, so idle workers always pick
+up whatever part of the tree is still unexplored. ``DirEntry`` type data is
+reused, so plain directories cost no extra ``stat`` call; only symlinks are
+resolved (for cycle detection). All bookkeeping happens on the calling
+thread and results are sorted, so output is identical for any worker count.
+
+Pruned directories (see :mod:`lib.ignore`) are never queued, so their
+subtrees are never opened. With a :class:`lib.cache.ScanCache`, a directory
+whose mtime is unchanged costs one ``stat`` instead of a listing.
+
+Every walk records how many atlas files each listed directory holds, so
+orphan detection after a scan needs no second walk.
+
+:func:`scan_roots` walks several roots at once on one shared thread pool;
+:func:`dedupe_roots` then drops directories an earlier root already reached.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from lib.cache import ScanCache
+from lib.ignore import IGNORE_FILENAMES, IgnoreFile, is_ignored, is_pruned
+from lib.models import ATLAS_FILENAMES, AtlasFile, AtlasType, ErrorCode, ScanError
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+BATCH_DIRS = 64  # directories a worker lists depth-first before handing back work
+
+
+def _within(path: str, ancestor: str) -> bool:
+    return path == ancestor or path.startswith(ancestor.rstrip(os.sep) + os.sep)
+
+
+@dataclass
+class ScannerConfig:
+    root_path: Path
+    max_depth: int | None = None
+    has_abstract: bool = False
+    has_overview: bool = False
+    has_both: bool = False
+    quiet: bool = False
+    verbose: bool = False
+    workers: int = DEFAULT_WORKERS
+    prune: tuple[str, ...] = ()  # extra directory-name globs to prune
+    use_ignore_files: bool = False  # honor .gitignore and .atlasignore
+
+
+class _DirJob(NamedTuple):
+    path: str
+    depth: int
+    real: str  # resolved path of this directory
+    links: tuple[str, ...]  # resolved dirs where a symlink was followed
+    ignores: tuple[IgnoreFile, ...] = ()  # ignore files from this dir upward
+
+
+@dataclass
+class _Listing:
+    job: _DirJob
+    names: dict[str, Any] | None = None  # raw listing, as stored in the cache
+    cache_hit: bool = False
+    atlas_names: list[str] = field(default_factory=list)
+    subdirs: list[_DirJob] = field(default_factory=list)
+    errors: list[ScanError] = field(default_factory=list)
+    pruned: int = 0
+    ignored: int = 0
+    symlinks: int = 0
+
+
+class Scanner:
+    def __init__(
+        self,
+        config: ScannerConfig,
+        cache: ScanCache | None = None,
+        pool: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self.config = config
+        self.cache = cache
+        self.pool = pool  # listing threads shared with other scanners
+        self.errors: list[ScanError] = []
+        self.stats: dict[str, Any] = {}
+        # resolved path of each directory holding atlas files
+        self.real_paths: dict[str, str] = {}
+        # directory -> atlas files in it (0-2), for every directory the last
+        # walk listed, in walk order
+        self.atlas_counts: dict[str, int] = {}
+
+    def scan(self) -> list[AtlasFile]:
+        """Find atlas files under the root, honoring depth and has_* filters."""
+        atlases: list[AtlasFile] = []
+        self.stream(atlases.extend)
+        atlases.sort(key=lambda a: a.path)
+        return atlases
+
+    def stream(self, handle: Callable[[list[AtlasFile]], None]) -> None:
+        """Pass each matching directory's atlas files to *handle* as it is listed.
+
+        Runs on the calling thread in walk order, which is not sorted.
+        """
+        self.errors = []
+        root = os.fspath(self.config.root_path)  # shared by every AtlasFile
+
+        def collect(listing: _Listing) -> None:
+            names = listing.atlas_names
+            if not names:
+                return
+            if self.config.has_abstract and ".abstract.md" not in names:
+                return
+            if self.config.has_overview and ".overview.md" not in names:
+                return
+            if self.config.has_both and len(names) < len(ATLAS_FILENAMES):
+                return
+            directory = listing.job.path
+            handle(
+                [
+                    AtlasFile(
+                        os.path.join(directory, name), ATLAS_FILENAMES[name], root=root
+                    )
+                    for name in names
+                ]
+            )
+
+        self._walk(collect)
+
+    def find_orphans(self, atlases: list[AtlasFile]) -> list[Path]:
+        """Directories missing expected atlases.
+
+        An orphan either holds only one of the two atlas files, or holds none
+        while its parent directory is mapped by one of *atlases*. Answered
+        from the last walk's :attr:`atlas_counts`; walks only if none ran.
+        """
+        if not self.atlas_counts:
+            self._walk(lambda listing: None)
+        mapped = {a.dir_str for a in atlases}
+        root = os.fspath(self.config.root_path)
+        dirname = os.path.dirname
+        return sorted(
+            Path(path)
+            for path, count in self.atlas_counts.items()
+            if count == 1 or (count == 0 and path != root and dirname(path) in mapped)
+        )
+
+    def _walk(self, handle: Callable[[_Listing], None]) -> None:
+        self.atlas_counts = counts = {}
+        self.real_paths = reals = {}
+        root = self.config.root_path
+        if not root.exists():
+            self.errors.append(ScanError(ErrorCode.E001, "Path not found", root))
+            return
+        if not root.is_dir():
+            self.errors.append(ScanError(ErrorCode.E001, "Not a directory", root))
+            return
+
+        start = time.perf_counter()
+        stats = {
+            "dirs_scanned": 0,
+            "dirs_pruned": 0,
+            "dirs_ignored": 0,
+            "symlinks_followed": 0,
+        }
+        errors: list[ScanError] = []
+
+        def on_listing(listing: _Listing) -> None:
+            counts[listing.job.path] = len(listing.atlas_names)
+            if listing.atlas_names:
+                reals[listing.job.path] = listing.job.real
+            stats["dirs_scanned"] += 1
+            stats["dirs_pruned"] += listing.pruned
+            stats["dirs_ignored"] += listing.ignored
+            stats["symlinks_followed"] += listing.symlinks
+            errors.extend(listing.errors)
+            if self.cache is not None and listing.names is not None:
+                self.cache.record_dir(
+                    listing.job.path, listing.names, listing.cache_hit
+                )
+            handle(listing)
+
+        root_job = _DirJob(os.fspath(root), 0, os.path.realpath(root), ())
+        workers = max(1, self.config.workers)
+        if self.cache is not None and self.cache.trusted:
+            workers = 1  # a trusted cache needs no I/O; threads only add overhead
+        if workers == 1:
+            self._walk_serial(root_job, on_listing)
+        elif self.pool is not None:
+            self._walk_parallel(root_job, on_listing, self.pool)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="scan"
+            ) as pool:
+                self._walk_parallel(root_job, on_listing, pool)
+
+        errors.sort(key=lambda e: (str(e.path), e.code.value))
+        self.errors.extend(errors)
+        self.stats = {
+            **stats,
+            "walk_time_ms": int((time.perf_counter() - start) * 1000),
+            "workers": workers,
+        }
+
+    def _walk_serial(
+        self, root_job: _DirJob, on_listing: Callable[[_Listing], None]
+    ) -> None:
+        stack = [root_job]
+        while stack:
+            listing = self._list_dir(stack.pop())
+            on_listing(listing)
+            stack.extend(listing.subdirs)
+
+    def _walk_parallel(
+        self,
+        root_job: _DirJob,
+        on_listing: Callable[[_Listing], None],
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        done: queue.SimpleQueue = queue.SimpleQueue()
+
+        def submit(job: _DirJob) -> None:
+            pool.submit(self._list_batch, job).add_done_callback(done.put)
+
+        submit(root_job)
+        outstanding = 1
+        while outstanding:
+            listings, leftover = done.get().result()
+            outstanding -= 1
+            for listing in listings:
+                on_listing(listing)
+            for job in leftover:
+                submit(job)
+            outstanding += len(leftover)
+
+    def _list_batch(self, job: _DirJob) -> tuple[list[_Listing], list[_DirJob]]:
+        """List up to BATCH_DIRS directories depth-first from *job*.
+
+        Unvisited subdirectories are returned for other workers to take, which
+        keeps every thread busy without paying a task per directory.
+        """
+        listings: list[_Listing] = []
+        stack = [job]
+        while stack and len(listings) < BATCH_DIRS:
+            listing = self._list_dir(stack.pop())
+            listings.append(listing)
+            stack.extend(listing.subdirs)
+        return listings, stack
+
+    def _list_dir(self, job: _DirJob) -> _Listing:
+        """List one directory: atlas files present plus subdirectories to visit.
+
+        Runs on worker threads, so it only reads *job* and builds a fresh
+        listing; it never touches scanner state.
+        """
+        listing = _Listing(job)
+        max_depth = self.config.max_depth
+        descend = max_depth is None or job.depth < max_depth
+        try:
+            names = self._read_dir(job, listing, descend)
+            listing.names = names
+            listing.atlas_names = list(names["atlas"])
+            dirs = names["dirs"] if descend else ()
+
+            ignores = job.ignores
+            if self.config.use_ignore_files and dirs:
+                # .atlasignore is read last so it can override .gitignore
+                for name in sorted(names["ignore"], key=IGNORE_FILENAMES.index):
+                    path = os.path.join(job.path, name)
+                    ignore_file = IgnoreFile.read(job.path, path)
+                    if ignore_file is not None and ignore_file.rules:
+                        ignores = (*ignores, ignore_file)
+
+            for name, is_link in dirs:
+                if is_pruned(name, self.config.prune):
+                    listing.pruned += 1
+                    continue
+                path = os.path.join(job.path, name)
+                if ignores and is_ignored(path, name, ignores):
+                    listing.ignored += 1
+                    continue
+                child = self._child_job(job, path, is_link, ignores, listing)
+                if child is not None:
+                    listing.subdirs.append(child)
+        except PermissionError:
+            listing.errors.append(
+                ScanError(ErrorCode.E002, "Permission denied", Path(job.path))
+            )
+        except OSError as e:
+            listing.errors.append(
+                ScanError(
+                    ErrorCode.E002,
+                    f"Cannot list directory: {e.strerror}",
+                    Path(job.path),
+                )
+            )
+        return listing
+
+    def _read_dir(
+        self, job: _DirJob, listing: _Listing, descend: bool
+    ) -> dict[str, Any]:
+        """Atlas files, ignore files and subdirectories (with symlink flag).
+
+        Served from the cache when the directory's mtime is unchanged. Fresh
+        listings always include subdirectories when caching, so a later run
+        with a larger ``--depth`` can reuse them.
+        """
+        cache = self.cache
+        mtime_ns = 0
+        if cache is not None:
+            cached = None
+            if cache.trusted:
+                cached = cache.lookup_dir(job.path, None)
+            if cached is None:
+                mtime_ns = os.stat(job.path).st_mtime_ns
+                cached = cache.lookup_dir(job.path, mtime_ns)
+            if cached is not None:
+                listing.cache_hit = True
+                return cached
+
+        atlas: list[str] = []
+        ignore: list[str] = []
+        dirs: list[tuple[str, bool]] = []
+        want_dirs = descend or cache is not None
+        with os.scandir(job.path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in ATLAS_FILENAMES:
+                    if entry.is_file():
+                        atlas.append(name)
+                elif name in IGNORE_FILENAMES:
+                    ignore.append(name)
+                elif want_dirs and entry.is_dir():
+                    dirs.append((name, entry.is_symlink()))
+        atlas.sort(key=lambda n: list(AtlasType).index(ATLAS_FILENAMES[n]))
+        return {"mtime_ns": mtime_ns, "atlas": atlas, "ignore": ignore, "dirs": dirs}
+
+    @staticmethod
+    def _child_job(
+        job: _DirJob,
+        path: str,
+        is_link: bool,
+        ignores: tuple[IgnoreFile, ...],
+        listing: _Listing,
+    ) -> _DirJob | None:
+        depth = job.depth + 1
+        if not is_link:
+            real = os.path.join(job.real, os.path.basename(path))
+            return _DirJob(path, depth, real, job.links, ignores)
+
+        target = os.path.realpath(path)
+        if any(_within(seen, target) for seen in (*job.links, job.real)):
+            listing.errors.append(
+                ScanError(ErrorCode.E003, f"Symlink cycle to {target}", Path(path))
+            )
+            return None
+        listing.symlinks += 1
+        return _DirJob(path, depth, target, (*job.links, job.real), ignores)
+
+
+def scan_roots(
+    scanners: list[Scanner], workers: int = DEFAULT_WORKERS
+) -> list[list[AtlasFile]]:
+    """Run every scanner's :meth:`Scanner.scan` at once; atlases per scanner.
+
+    The walks share one pool of *workers* listing threads. Each walk's
+    bookkeeping runs on its own coordinating thread, so a scanner's state
+    and cache are only touched there. Scanners sharing a cache object (the
+    ``serve`` daemon's) run one after another.
+    """
+    caches = [id(s.cache) for s in scanners if s.cache is not None]
+    if len(scanners) < 2 or len(set(caches)) < len(caches):
+        return [scanner.scan() for scanner in scanners]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+        for scanner in scanners:
+            scanner.pool = pool
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(scanners), thread_name_prefix="root"
+            ) as walks:
+                return list(walks.map(Scanner.scan, scanners))
+        finally:
+            for scanner in scanners:
+                scanner.pool = None
+
+
+def dedupe_roots(
+    scanners: list[Scanner], results: list[list[AtlasFile]]
+) -> tuple[list[list[AtlasFile]], list[int]]:
+    """Drop atlas directories whose real path an earlier root already has.
+
+    Roots keep their order of precedence, so the output does not depend on
+    which walk finished first. Within one root, a directory reached through
+    two symlinked paths is kept twice, as in a single-root scan. Returns the
+    kept atlases and the number of dropped directories, per root.
+    """
+    seen: set[str] = set()
+    kept_per_root: list[list[AtlasFile]] = []
+    dropped_per_root: list[int] = []
+    for scanner, atlases in zip(scanners, results, strict=True):
+        reals = scanner.real_paths
+        kept: list[AtlasFile] = []
+        dropped: set[str] = set()
+        own: set[str] = set()
+        for atlas in atlases:
+            directory = atlas.dir_str
+            real = reals.get(directory, directory)
+            if real in seen:
+                dropped.add(directory)
+            else:
+                kept.append(atlas)
+                own.add(real)
+        seen |= own
+        kept_per_root.append(kept)
+        dropped_per_root.append(len(dropped))
+    return kept_per_root, dropped_per_root
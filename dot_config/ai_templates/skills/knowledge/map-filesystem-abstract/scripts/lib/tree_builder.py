@@ -0,0 +1,214 @@
+"""Build the atlas directory hierarchy and render it as an ASCII tree.
+
+:meth:`TreeBuilder.walk` visits the hierarchy depth-first holding only the
+current ancestor chain, and applies a :class:`TreeView`: a subtree to show
+(``--root-at``) and limits past which nodes fold into one "… N more" entry.
+The ASCII tree and the streaming DOT writer are both built on it.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from lib.models import AtlasFile, AtlasType
+
+_ATLAS_ORDER = [t.value for t in AtlasType]
+
+MORE_LABEL = "… {} more"
+
+
+def _child_layer(layer: str | None) -> str | None:
+    if layer and layer[1:].isdigit():
+        return f"l{int(layer[1:]) + 1}"
+    return None
+
+
+def _within(path: str, ancestor: str) -> bool:
+    return path == ancestor or path.startswith(ancestor.rstrip(os.sep) + os.sep)
+
+
+@dataclass
+class TreeView:
+    root_at: Path | None = None  # only this directory and what lies below it
+    max_depth: int | None = None  # levels shown below each displayed root
+    max_children: int | None = None  # children shown per node
+
+
+class _Frame:
+    """A node on the walk's ancestor chain."""
+
+    __slots__ = ("node", "parts", "anchor", "depth", "children", "hidden")
+
+    def __init__(self, node: dict[str, Any], parts: tuple[str, ...]) -> None:
+        self.node = node
+        self.parts = parts
+        self.anchor: _Frame | None = None  # nearest shown frame, self if shown
+        self.depth = 0  # levels below the displayed root
+        self.children = 0  # shown children
+        self.hidden = 0  # folded atlas directories below
+
+
+class TreeBuilder:
+    def build(self, atlases: list[AtlasFile]) -> dict[str, Any]:
+        """Group atlases by directory and link each directory to its nearest
+        atlas-bearing ancestor.
+
+        Returns ``{"roots": [node, ...], "nodes": {dir_str: node}}`` where a
+        node is ``{"path", "name", "atlases", "layer", "scope", "children"}``.
+        """
+        nodes = self._group(atlases)
+        roots: list[dict[str, Any]] = []
+        for key in sorted(nodes, key=lambda k: nodes[k]["path"].parts):
+            node = nodes[key]
+            node["children"] = []
+            parent = self._nearest_ancestor(node["path"], nodes)
+            if parent is None:
+                roots.append(node)
+                continue
+            parent["children"].append(node)
+            if node["layer"] is None:
+                node["layer"] = _child_layer(parent["layer"])
+
+        return {"roots": roots, "nodes": nodes}
+
+    @staticmethod
+    def _group(atlases: list[AtlasFile]) -> dict[str, dict[str, Any]]:
+        nodes: dict[str, dict[str, Any]] = {}
+        for atlas in sorted(atlases, key=lambda a: a.path):
+            key = atlas.dir_str
+            node = nodes.get(key)
+            if node is None:
+                path = Path(key)
+                node = nodes[key] = {
+                    "path": path,
+                    "name": path.name,
+                    "atlases": [],
+                    "layer": None,
+                    "scope": None,
+                }
+            if atlas.atlas_type.value not in node["atlases"]:
+                node["atlases"].append(atlas.atlas_type.value)
+                node["atlases"].sort(key=_ATLAS_ORDER.index)
+            if node["layer"] is None:
+                node["layer"] = atlas.layer
+            if node["scope"] is None:
+                node["scope"] = (atlas.frontmatter or {}).get("scope")
+        return nodes
+
+    @staticmethod
+    def _nearest_ancestor(
+        path: Path, nodes: dict[str, dict[str, Any]]
+    ) -> dict[str, Any] | None:
+        for ancestor in path.parents:
+            node = nodes.get(str(ancestor))
+            if node is not None:
+                return node
+        return None
+
+    def walk(
+        self, atlases: list[AtlasFile], view: TreeView | None = None
+    ) -> Iterator[tuple[str, dict[str, Any], Any]]:
+        """Shown nodes of *view*, depth-first, as ``(event, node, arg)``.
+
+        Events are ``("node", node, parent_node)`` (``None`` for a displayed
+        root), ``("more", node, count)`` when atlas directories below *node*
+        were folded, and ``("close", node, None)`` once its subtree is done.
+        Nodes outside ``view.root_at`` are walked only to inherit layers.
+        """
+        view = view or TreeView()
+        root_at = os.fspath(view.root_at) if view.root_at is not None else None
+        nodes = self._group(atlases)
+        stack: list[_Frame] = []
+        for key in sorted(nodes, key=lambda k: nodes[k]["path"].parts):
+            node = nodes[key]
+            parts = node["path"].parts
+            while stack and parts[: len(stack[-1].parts)] != stack[-1].parts:
+                yield from self._close(stack.pop())
+            parent = stack[-1] if stack else None
+            if node["layer"] is None and parent is not None:
+                node["layer"] = _child_layer(parent.node["layer"])
+
+            frame = _Frame(node, parts)
+            anchor = parent.anchor if parent is not None else None
+            if root_at is not None and not _within(key, root_at):
+                pass  # above or beside the view
+            elif anchor is None:
+                frame.anchor = frame
+                yield "node", node, None
+            elif anchor is parent and self._fits(parent, view):
+                frame.anchor = frame
+                frame.depth = parent.depth + 1
+                parent.children += 1
+                yield "node", node, parent.node
+            else:
+                frame.anchor = anchor
+                anchor.hidden += 1
+            stack.append(frame)
+
+        while stack:
+            yield from self._close(stack.pop())
+
+    @staticmethod
+    def _fits(parent: _Frame, view: TreeView) -> bool:
+        if view.max_depth is not None and parent.depth >= view.max_depth:
+            return False
+        return view.max_children is None or parent.children < view.max_children
+
+    @staticmethod
+    def _close(frame: _Frame) -> Iterator[tuple[str, dict[str, Any], Any]]:
+        if frame.anchor is not frame:
+            return
+        if frame.hidden:
+            yield "more", frame.node, frame.hidden
+        yield "close", frame.node, None
+
+    def build_ascii_tree(
+        self, atlases: list[AtlasFile], view: TreeView | None = None
+    ) -> str:
+        roots: list[dict[str, Any]] = []
+        stack: list[dict[str, Any]] = []
+        for event, node, arg in self.walk(atlases, view):
+            if event == "node":
+                entry = {"node": node, "children": [], "more": 0}
+                (stack[-1]["children"] if stack else roots).append(entry)
+                stack.append(entry)
+            elif event == "more":
+                stack[-1]["more"] = arg
+            else:
+                stack.pop()
+
+        root_at = view.root_at if view is not None else None
+        lines: list[str] = []
+        for root in roots:
+            node = root["node"]
+            name = node["name"]
+            if root_at is not None and node["path"] != root_at:
+                name = node["path"].relative_to(root_at).as_posix()
+            lines.append(self._label(node, name))
+            self._render_children(root, "", lines)
+        return "\n".join(lines)
+
+    def _render_children(
+        self, entry: dict[str, Any], prefix: str, lines: list[str]
+    ) -> None:
+        path = entry["node"]["path"]
+        children = entry["children"]
+        for i, child in enumerate(children):
+            last = i == len(children) - 1 and not entry["more"]
+            node = child["node"]
+            name = node["path"].relative_to(path).as_posix()
+            lines.append(
+                prefix + ("└── " if last else "├── ") + self._label(node, name)
+            )
+            self._render_children(child, prefix + ("    " if last else "│   "), lines)
+        if entry["more"]:
+            lines.append(prefix + "└── " + MORE_LABEL.format(entry["more"]))
+
+    @staticmethod
+    def _label(node: dict[str, Any], name: str) -> str:
+        layer = f" ({node['layer']})" if node["layer"] else ""
+        return f"{name}/{layer}"
@@ -0,0 +1,386 @@
+"""Incremental atlas regeneration for the ``update`` command.
+
+An atlas directory maps every file below it except pruned directories and
+subtrees with their own atlas; for those, the child's atlas files stand in.
+Each input contributes ``(path, size, mtime_ns)`` to a fingerprint that is
+stored after a successful update. A directory is stale when its fingerprint
+changed, or, before one is stored, when an input is newer than the atlas
+``date_updated``. Parents of stale directories are stale too.
+
+Stale directories are regenerated by an LLM CLI on a bounded thread pool,
+leaves first: a directory starts only once its stale child atlases are done,
+so parents summarize fresh children.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import os
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from lib import cache
+from lib.ignore import is_pruned
+from lib.models import ATLAS_FILENAMES, AtlasFile
+from lib.scanner import DEFAULT_WORKERS
+from lib.validator import parse_date
+
+STATE_SUFFIX = ".update.json"
+STATE_VERSION = 1
+DEFAULT_AGENT = "opencode run"  # override with --agent or ABSTRACT_GEN_AGENT
+DEFAULT_JOBS = 4
+DEFAULT_TIMEOUT = 900  # seconds per directory
+GUIDE_PATH = (
+    Path(__file__).resolve().parents[2] / "references" / "atlas-builder-guide.md"
+)
+
+PROMPT = """\
+Read the atlas-builder guide:
+{guide}
+
+Execute those instructions for: {path}
+Write or update .abstract.md and .overview.md in that directory.
+If this is a top-level atlas (scope: top) and AGENTS.md exists, verify the
+## Entrypoint section exists per the guide. Add if missing, touch nothing else.
+If child atlases exist, verify wiring in the parent Reference Tree; they are
+already up to date.
+Return a short summary of what changed."""
+
+
+def state_path(root: Path) -> Path:
+    return cache.cache_path(root).with_suffix(STATE_SUFFIX)
+
+
+@dataclass(frozen=True)
+class Inputs:
+    fingerprint: str
+    newest_mtime_ns: int
+    files: int
+
+
+def read_inputs(
+    directory: str, boundaries: set[str], prune: tuple[str, ...] = ()
+) -> Inputs:
+    """Fingerprint the files the atlas in *directory* maps.
+
+    *boundaries* are directories with their own atlas: only their atlas
+    files are read. Symlinked directories are not followed.
+    """
+    entries: list[tuple[str, int, int]] = []
+
+    def add(path: str, st: os.stat_result) -> None:
+        entries.append((os.path.relpath(path, directory), st.st_size, st.st_mtime_ns))
+
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if is_pruned(entry.name, prune):
+                                continue
+                            if entry.path in boundaries:
+                                for name in ATLAS_FILENAMES:
+                                    child = os.path.join(entry.path, name)
+                                    try:
+                                        add(child, os.stat(child))
+                                    except OSError:
+                                        pass
+                            elif not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        if current == directory and entry.name in ATLAS_FILENAMES:
+                            continue  # the atlas itself is the output
+                        add(entry.path, entry.stat())
+                    except OSError:
+                        continue  # vanished or dangling symlink
+        except OSError:
+            continue
+
+    entries.sort()
+    digest = hashlib.sha1()
+    for rel, size, mtime_ns in entries:
+        digest.update(f"{rel}\0{size}\0{mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    newest = max((mtime_ns for _, _, mtime_ns in entries), default=0)
+    return Inputs(digest.hexdigest(), newest, len(entries))
+
+
+@dataclass
+class StaleDir:
+    path: Path
+    reason: str
+    parent: Path | None = None  # nearest ancestor atlas directory in the plan
+
+
+@dataclass
+class UpdateResult:
+    path: Path
+    ok: bool
+    message: str
+    seconds: float = 0.0
+
+
+class Updater:
+    def __init__(
+        self,
+        root: Path,
+        agent: str = DEFAULT_AGENT,
+        jobs: int = DEFAULT_JOBS,
+        timeout: float = DEFAULT_TIMEOUT,
+        prune: tuple[str, ...] = (),
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        self.root = root
+        self.agent = agent
+        self.jobs = max(1, jobs)
+        self.timeout = timeout
+        self.prune = prune
+        self.workers = max(1, workers)
+        self.state_path = state_path(root)
+        self._state = self._load_state()
+        self._boundaries: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _load_state(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+            return {}
+        return data.get("dirs") or {}
+
+    def save_state(self) -> None:
+        """Write fingerprints atomically; failures are not fatal."""
+        data = {"version": STATE_VERSION, "dirs": self._state}
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.state_path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+    # Planning
+
+    def plan(
+        self,
+        atlases: Iterable[AtlasFile],
+        force: bool = False,
+        create_root: bool = False,
+    ) -> list[StaleDir]:
+        """Stale atlas directories, leaves first.
+
+        With *create_root*, the root is planned even if it has no atlas yet.
+        Fresh directories without a stored fingerprint get one, so the next
+        run compares fingerprints instead of dates.
+        """
+        by_dir: dict[str, list[AtlasFile]] = {}
+        for atlas in atlases:
+            by_dir.setdefault(atlas.dir_str, []).append(atlas)
+        root = str(self.root)
+        if create_root:
+            by_dir.setdefault(root, [])
+        self._boundaries = set(by_dir)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            inputs = dict(
+                zip(
+                    by_dir,
+                    pool.map(
+                        lambda d: read_inputs(d, self._boundaries, self.prune), by_dir
+                    ),
+                    strict=True,
+                )
+            )
+
+        parents = {d: self._atlas_parent(d) for d in by_dir}
+        reasons: dict[str, str] = {}
+        for directory, group in by_dir.items():
+            reason = (
+                "forced"
+                if force
+                else self._stale_reason(directory, group, inputs[directory])
+            )
+            if reason:
+                reasons[directory] = reason
+            elif directory not in self._state:
+                self._record(directory, inputs[directory])
+
+        # Deepest first, so staleness climbs the whole ancestor chain
+        for directory in sorted(reasons, key=_depth, reverse=True):
+            parent = parents[directory]
+            if parent is not None and parent not in reasons:
+                rel = os.path.relpath(directory, parent)
+                reasons[parent] = f"child atlas stale: {rel}"
+
+        return [
+            StaleDir(
+                Path(d),
+                reasons[d],
+                Path(parents[d]) if parents[d] is not None else None,
+            )
+            for d in sorted(reasons, key=lambda d: (-_depth(d), d))
+        ]
+
+    def _atlas_parent(self, directory: str) -> str | None:
+        path = Path(directory)
+        if str(path) == str(self.root):
+            return None
+        for ancestor in path.parents:
+            if str(ancestor) in self._boundaries:
+                return str(ancestor)
+            if ancestor == self.root:
+                break
+        return None
+
+    def _stale_reason(
+        self, directory: str, group: list[AtlasFile], inputs: Inputs
+    ) -> str | None:
+        present = {a.path.name for a in group}
+        missing = [name for name in ATLAS_FILENAMES if name not in present]
+        if missing:
+            return "missing " + ", ".join(missing)
+        dates = [parse_date(a.frontmatter.get("date_updated")) for a in group]
+        if any(d is None for d in dates):
+            return "no valid date_updated"
+        stored = self._state.get(directory)
+        if stored is not None:
+            if stored.get("fingerprint") != inputs.fingerprint:
+                return "files changed since last update"
+            return None
+        oldest = min(d for d in dates if d is not None)
+        if inputs.newest_mtime_ns:
+            newest = dt.date.fromtimestamp(inputs.newest_mtime_ns / 1e9)
+            if newest > oldest:
+                return f"files changed after {oldest.isoformat()}"
+        return None
+
+    def _record(self, directory: str, inputs: Inputs) -> None:
+        with self._lock:
+            self._state[directory] = {
+                "fingerprint": inputs.fingerprint,
+                "updated_at": dt.datetime.now().isoformat(timespec="seconds"),
+            }
+
+    # Regeneration
+
+    def run(
+        self,
+        plan: list[StaleDir],
+        on_done: Callable[[UpdateResult], None] | None = None,
+    ) -> list[UpdateResult]:
+        """Regenerate *plan* on ``jobs`` threads; a parent waits for its children.
+
+        A parent whose child failed is skipped, and counts as failed for its
+        own parent.
+        """
+        by_path = {s.path: s for s in plan}
+        waiting = {s.path: 0 for s in plan}
+        for s in plan:
+            if s.parent in waiting:
+                waiting[s.parent] += 1
+        blocked: set[Path] = set()
+        ready = deque(s for s in plan if waiting[s.path] == 0)
+        results: list[UpdateResult] = []
+
+        def finish(stale: StaleDir, result: UpdateResult) -> None:
+            results.append(result)
+            if on_done is not None:
+                on_done(result)
+            parent = stale.parent
+            if parent not in waiting:
+                return
+            if not result.ok:
+                blocked.add(parent)
+            waiting[parent] -= 1
+            if waiting[parent]:
+                return
+            if parent in blocked:
+                finish(
+                    by_path[parent],
+                    UpdateResult(parent, False, "skipped: a child atlas failed"),
+                )
+            else:
+                ready.append(by_path[parent])
+
+        with ThreadPoolExecutor(
+            max_workers=self.jobs, thread_name_prefix="update"
+        ) as pool:
+            running: dict[Any, StaleDir] = {}
+            while ready or running:
+                while ready:
+                    stale = ready.popleft()
+                    running[pool.submit(self._regenerate, stale.path)] = stale
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(running.pop(future), future.result())
+        return results
+
+    def command(self, path: Path) -> list[str]:
+        """Agent argv: ``{prompt}``/``{path}`` are substituted, else the prompt is appended."""
+        prompt = PROMPT.format(guide=GUIDE_PATH, path=path)
+        argv = shlex.split(self.agent)
+        if any("{prompt}" in arg for arg in argv):
+            return [
+                arg.replace("{prompt}", prompt).replace("{path}", str(path))
+                for arg in argv
+            ]
+        return [arg.replace("{path}", str(path)) for arg in argv] + [prompt]
+
+    def _regenerate(self, path: Path) -> UpdateResult:
+        start = time.perf_counter()
+
+        def result(ok: bool, message: str) -> UpdateResult:
+            return UpdateResult(path, ok, message, time.perf_counter() - start)
+
+        try:
+            proc = subprocess.run(
+                self.command(path),
+                cwd=path,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return result(False, f"timed out after {self.timeout:g}s")
+        except OSError as e:
+            return result(False, f"cannot run agent: {e.strerror}")
+        if proc.returncode != 0:
+            detail = _last_line(proc.stderr) or _last_line(proc.stdout)
+            return result(
+                False, f"agent exited {proc.returncode}: {detail}".rstrip(": ")
+            )
+
+        missing = [name for name in ATLAS_FILENAMES if not (path / name).is_file()]
+        if missing:
+            return result(False, "agent did not write " + ", ".join(missing))
+        self._record(str(path), read_inputs(str(path), self._boundaries, self.prune))
+        return result(True, _last_line(proc.stdout))
+
+
+def _depth(path: str) -> int:
+    return path.count(os.sep)
+
+
+def _last_line(text: str) -> str:
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return lines[-1][:200] if lines else ""
@@ -0,0 +1,244 @@
+"""Frontmatter and cross-file consistency checks for parsed atlases.
+
+Cross-file checks index the atlases by directory once and compare each one
+with its enclosing atlas (the nearest atlas-bearing ancestor directory), so
+they stay linear in the number of atlases.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+
+from lib.models import AtlasFile, AtlasType, ErrorCode, ScanError, ValidationResult
+from lib.parser import FRONTMATTER_ERROR, Parser
+
+
+def parse_date(value: object) -> dt.date | None:
+    """Coerce a YAML ``date_updated`` value to a date, or None if malformed."""
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    try:
+        return dt.date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def parse_level(layer: str | None) -> int | None:
+    """The depth in an ``lN`` layer, or None if it is not of that form."""
+    if layer and layer[:1] == "l" and layer[1:].isdigit():
+        return int(layer[1:])
+    return None
+
+
+def _enclosing_dirs(dirs: dict[str, list[AtlasFile]]) -> dict[str, str | None]:
+    """Map each atlas directory to its nearest atlas-bearing ancestor.
+
+    Directories between two atlases are remembered on the way up, so every
+    directory is climbed through at most once.
+    """
+    above: dict[str, str | None] = {}  # any directory -> nearest atlas dir above
+    enclosing: dict[str, str | None] = {}
+    for directory in dirs:
+        chain: list[str] = []
+        current = directory
+        while True:
+            parent = os.path.dirname(current)
+            if parent == current:
+                found = None
+                break
+            if parent in dirs:
+                found = parent
+                break
+            if parent in above:
+                found = above[parent]
+                break
+            chain.append(parent)
+            current = parent
+        for passed in chain:
+            above[passed] = found
+        enclosing[directory] = found
+    return enclosing
+
+
+class Validator:
+    def __init__(self, quiet: bool = False) -> None:
+        self.quiet = quiet
+
+    def validate(self, atlases: list[AtlasFile]) -> ValidationResult:
+        """Check every atlas; marks failures on the atlases and returns all errors."""
+        atlases = list(atlases)
+        errors: list[ScanError] = []
+        self.validate_fields(atlases, errors)
+        self.validate_parent_refs(atlases, errors)
+        self.validate_date_consistency(atlases, errors)
+        self.validate_hierarchy(atlases, errors)
+        return ValidationResult(atlases=atlases, errors=errors)
+
+    def validate_fields(
+        self, atlases: list[AtlasFile], errors: list[ScanError]
+    ) -> None:
+        """Required fields and layer format, per file."""
+        for atlas in atlases:
+            if FRONTMATTER_ERROR in atlas.validation_errors:
+                continue
+            for message in Parser.validate_frontmatter_fields(atlas):
+                atlas.add_error(message)
+                code = ErrorCode.E008 if "layer format" in message else ErrorCode.E007
+                errors.append(ScanError(code, message, atlas.path))
+
+    def validate_parent_refs(
+        self,
+        atlases: list[AtlasFile],
+        errors: list[ScanError],
+        known: set[str] | None = None,
+    ) -> None:
+        """A non-empty ``parent`` must name a scanned atlas dir or an ancestor dir.
+
+        *known* defaults to the directory names of *atlases*.
+        """
+        if known is None:
+            known = {os.path.basename(a.dir_str) for a in atlases}
+        for atlas in atlases:
+            parent = self.unresolved_parent(atlas, known)
+            if parent is None:
+                continue
+            message = f"Parent atlas '{parent}' not found"
+            atlas.add_error(message)
+            errors.append(ScanError(ErrorCode.E006, message, atlas.path))
+
+    @staticmethod
+    def unresolved_parent(atlas: AtlasFile, known: set[str]) -> str | None:
+        """The ``parent`` value if it is neither in *known* nor an ancestor name."""
+        parent = (atlas.frontmatter or {}).get("parent")
+        if parent in (None, ""):
+            return None
+        parent = str(parent)
+        if parent in known or parent in {p.name for p in atlas.dir_path.parents}:
+            return None
+        return parent
+
+    def validate_date_consistency(
+        self, atlases: list[AtlasFile], errors: list[ScanError]
+    ) -> None:
+        """``date_updated``, when present, must be a valid YYYY-MM-DD date."""
+        for atlas in atlases:
+            value = (atlas.frontmatter or {}).get("date_updated")
+            if value in (None, "") or parse_date(value) is not None:
+                continue
+            message = f"Invalid date_updated: {value!r} (expected YYYY-MM-DD)"
+            atlas.add_error(message)
+            errors.append(ScanError(ErrorCode.E009, message, atlas.path))
+
+    def validate_hierarchy(
+        self, atlases: list[AtlasFile], errors: list[ScanError]
+    ) -> None:
+        """Each atlas must agree with its enclosing atlas.
+
+        A declared ``parent`` names the enclosing atlas directory (or, with
+        none scanned, an ancestor directory), ``root`` matches the project's
+        (the nearest ``scope: top`` or outermost atlas), and a non-top
+        ``layer`` is one below the enclosing atlas's (all E010). A
+        ``date_updated`` older than a child atlas's is a warning (E011).
+        """
+        order = list(AtlasType)
+        dirs: dict[str, list[AtlasFile]] = {}
+        for atlas in sorted(atlases, key=lambda a: order.index(a.atlas_type)):
+            dirs.setdefault(atlas.dir_str, []).append(atlas)
+        enclosing = _enclosing_dirs(dirs)
+        known = {os.path.basename(directory) for directory in dirs}
+
+        tops: dict[str, str] = {}  # atlas dir -> its project's top dir
+        for directory in dirs:
+            chain: list[str] = []
+            current = directory
+            while current not in tops:
+                parent = enclosing[current]
+                if parent is None or _field(dirs[current][0], "scope") == "top":
+                    tops[current] = current
+                    break
+                chain.append(current)
+                current = parent
+            for passed in chain:
+                tops[passed] = tops[current]
+
+        newest: dict[str, tuple[dt.date, str]] = {}  # dir -> newest child date
+        for directory, group in dirs.items():
+            parent = enclosing[directory]
+            parent_atlas = dirs[parent][0] if parent is not None else None
+            top = dirs[tops[directory]][0]
+            for atlas in group:
+                if FRONTMATTER_ERROR in atlas.validation_errors:
+                    continue
+                for message in self._hierarchy_errors(
+                    atlas, directory, parent, parent_atlas, top, known
+                ):
+                    atlas.add_error(message)
+                    errors.append(ScanError(ErrorCode.E010, message, atlas.path))
+                date = _date(atlas)
+                if date is None or parent is None:
+                    continue
+                if parent not in newest or newest[parent][0] < date:
+                    newest[parent] = (date, directory)
+
+        for directory, (child_date, child) in newest.items():
+            for atlas in dirs[directory]:
+                date = _date(atlas)
+                if date is None or date >= child_date:
+                    continue
+                message = (
+                    f"date_updated {date} is older than child atlas "
+                    f"{os.path.relpath(child, directory)} ({child_date})"
+                )
+                errors.append(ScanError(ErrorCode.E011, message, atlas.path))
+
+    def _hierarchy_errors(
+        self,
+        atlas: AtlasFile,
+        directory: str,
+        parent_dir: str | None,
+        parent: AtlasFile | None,
+        top: AtlasFile,
+        known: set[str],
+    ) -> list[str]:
+        messages: list[str] = []
+        name = _field(atlas, "parent")
+        if name and self.unresolved_parent(atlas, known) is None:
+            if parent_dir is not None and name != os.path.basename(parent_dir):
+                messages.append(
+                    f"Parent '{name}' does not match enclosing atlas "
+                    f"'{os.path.basename(parent_dir)}'"
+                )
+            elif parent_dir is None and name not in directory.split(os.sep)[:-1]:
+                messages.append(f"Parent '{name}' does not enclose this atlas")
+
+        root, top_root = _field(atlas, "root"), _field(top, "root")
+        if root and top_root and root != top_root:
+            messages.append(
+                f"Root '{root}' differs from project root '{top_root}' ({top.dir_path})"
+            )
+
+        if parent is not None and _field(atlas, "scope") != "top":
+            level, parent_level = parse_level(atlas.layer), parse_level(parent.layer)
+            if (
+                level is not None
+                and parent_level is not None
+                and level != parent_level + 1
+            ):
+                messages.append(
+                    f"Layer {atlas.layer} does not follow enclosing atlas "
+                    f"layer {parent.layer}"
+                )
+        return messages
+
+
+def _field(atlas: AtlasFile, name: str) -> str | None:
+    value = (atlas.frontmatter or {}).get(name)
+    return None if value in (None, "") else str(value)
+
+
+def _date(atlas: AtlasFile) -> dt.date | None:
+    value = (atlas.frontmatter or {}).get("date_updated")
+    return None if value in (None, "") else parse_date(value)
@@ -0,0 +1,162 @@
+"""Minimal inotify directory watcher (Linux, via ctypes; no dependencies).
+
+One watch per directory. Events are reported as ``(dir_path, name, mask)``
+to a callback on a background thread. :func:`inotify_available` is False on
+other platforms, where the daemon falls back to mtime checks.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable, Iterable
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+ENTRY_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+CONTENT_EVENTS = IN_MODIFY | IN_CLOSE_WRITE | IN_ATTRIB
+SELF_EVENTS = IN_DELETE_SELF | IN_MOVE_SELF
+WATCH_MASK = ENTRY_EVENTS | CONTENT_EVENTS | SELF_EVENTS | IN_ONLYDIR
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+EventHandler = Callable[[str | None, str, int], None]
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+def inotify_available() -> bool:
+    return _libc() is not None
+
+
+class WatchLimitError(OSError):
+    """fs.inotify.max_user_watches is exhausted."""
+
+
+class InotifyWatcher:
+    def __init__(self, handler: EventHandler) -> None:
+        libc = _libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._handler = handler
+        self._paths: dict[int, set[str]] = {}  # one inode can be reached twice
+        self._wds: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def watched(self) -> int:
+        return len(self._wds)
+
+    def sync(self, paths: Iterable[str]) -> list[str]:
+        """Watch exactly *paths*; returns the newly watched ones.
+
+        Raises :class:`WatchLimitError` when the kernel limit is reached.
+        """
+        wanted = set(paths)
+        added = []
+        with self._lock:
+            for path in self._wds.keys() - wanted:
+                self._unwatch(path)
+            for path in wanted - self._wds.keys():
+                wd = self._libc.inotify_add_watch(
+                    self._fd, os.fsencode(path), WATCH_MASK
+                )
+                if wd < 0:
+                    err = ctypes.get_errno()
+                    if err == errno.ENOSPC:
+                        raise WatchLimitError(err, "inotify watch limit reached")
+                    continue  # vanished or unreadable; the next scan notices
+                self._wds[path] = wd
+                self._paths.setdefault(wd, set()).add(path)
+                added.append(path)
+        return added
+
+    def _unwatch(self, path: str) -> None:
+        wd = self._wds.pop(path)
+        paths = self._paths.get(wd, set())
+        paths.discard(path)
+        if not paths:
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="inotify", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        os.close(self._fd)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._fd], [], [], 0.2)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            for wd, mask, name in self._parse(data):
+                self._dispatch(wd, mask, name)
+
+    @staticmethod
+    def _parse(data: bytes) -> Iterable[tuple[int, int, str]]:
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            raw = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            yield wd, mask, os.fsdecode(raw)
+
+    def _dispatch(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            self._handler(None, "", mask)
+            return
+        with self._lock:
+            paths = list(self._paths.get(wd, ()))
+            if mask & IN_IGNORED:  # watch removed by the kernel
+                for path in paths:
+                    self._wds.pop(path, None)
+                self._paths.pop(wd, None)
+        for path in paths:
+            self._handler(path, name, mask)
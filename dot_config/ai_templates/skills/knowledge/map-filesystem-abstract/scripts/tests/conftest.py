@@ -13,6 +13,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.models import AtlasFile, AtlasType
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch) -> None:
+    """Keep the scan cache out of the real ~/.cache."""
+    import lib.cache
+
+    monkeypatch.setattr(lib.cache, "CACHE_DIR", tmp_path_factory.mktemp("cache"))
+
+
 @pytest.fixture
 def tmp_repo(tmp_path: Path) -> Path:
     repo = tmp_path / "test_repo"
@@ -0,0 +1,68 @@
+"""Tests for the synthetic benchmark trees."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmark import COMMANDS, TreeSpec, ensure_tree, generate, parse_size, run_case
+from lib.scanner import Scanner, ScannerConfig
+
+SPEC = TreeSpec(dirs=200, depth=4, atlas_density=0.3, node_modules=0.05, seed=1)
+
+
+def _listing(root: Path) -> list[str]:
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, _, filenames in os.walk(root)
+        for name in filenames
+    )
+
+
+class TestTreeSpec:
+    def test_derived_fanout_reaches_size(self) -> None:
+        assert SPEC.branching == 4  # 4 + 16 + 64 + 256 >= 200
+        assert SPEC.name == "200-d4-f4-a0.3-nm0.05-s1"
+
+    @pytest.mark.parametrize(
+        ("text", "count"), [("10k", 10_000), ("1.5m", 1_500_000), ("250", 250)]
+    )
+    def test_parse_size(self, text: str, count: int) -> None:
+        assert parse_size(text) == count
+
+
+class TestGenerate:
+    def test_counts_match_what_the_scanner_finds(self, tmp_path: Path) -> None:
+        root = tmp_path / "tree"
+        counts = generate(SPEC, root)
+
+        assert counts["dirs"] == 200
+        scanner = Scanner(ScannerConfig(root_path=root, quiet=True))
+        atlases = scanner.scan()
+        assert len({atlas.dir_path for atlas in atlases}) == counts["atlas_dirs"]
+        assert scanner.stats["dirs_scanned"] == counts["dirs"]
+        assert scanner.stats["dirs_pruned"] > 0  # node_modules
+
+    def test_deterministic(self, tmp_path: Path) -> None:
+        generate(SPEC, tmp_path / "a")
+        generate(SPEC, tmp_path / "b")
+        assert _listing(tmp_path / "a") == _listing(tmp_path / "b")
+
+    def test_complete_tree_is_reused(self, tmp_path: Path) -> None:
+        root, info = ensure_tree(SPEC, tmp_path)
+        (root / "marker").write_text("kept")
+        assert ensure_tree(SPEC, tmp_path) == (root, info)
+        assert (root / "marker").exists()
+
+
+class TestRunCase:
+    def test_warm_list(self, tmp_path: Path) -> None:
+        root, _ = ensure_tree(TreeSpec(dirs=30, depth=3, seed=2), tmp_path / "trees")
+        result = run_case(root, COMMANDS["list"], "warm", 1, tmp_path / "cache")
+
+        assert result["exit_code"] == 0
+        assert len(result["runs_ms"]) == 1
+        assert "scan" in result["phases_ms"]
+        assert "--no-cache" not in result["args"]
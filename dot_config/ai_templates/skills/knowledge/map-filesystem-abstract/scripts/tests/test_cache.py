@@ -0,0 +1,117 @@
+"""Tests for the incremental scan cache."""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+from pathlib import Path
+
+from lib.cache import ScanCache, cache_path
+from lib.parser import FRONTMATTER_ERROR, Parser
+from lib.scanner import Scanner, ScannerConfig
+
+
+def _run(root: Path, **config) -> tuple[ScanCache, list, Parser]:
+    cache = ScanCache.for_root(root)
+    scanner = Scanner(ScannerConfig(root_path=root, **config), cache)
+    parser = Parser(cache=cache)
+    atlases = parser.parse_batch(scanner.scan())
+    cache.save()
+    return cache, atlases, parser
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestScanCache:
+    def test_first_run_misses_second_run_hits(self, tmp_repo: Path) -> None:
+        cold, first, _ = _run(tmp_repo)
+        warm, second, _ = _run(tmp_repo)
+
+        assert cold.stats["cache_hit_rate"] == 0.0
+        assert warm.stats["cache_hit_rate"] == 1.0
+        assert warm.stats["cache_dir_hits"] == 2
+        assert warm.stats["cache_file_hits"] == 3
+        assert [a.path for a in first] == [a.path for a in second]
+        assert [a.frontmatter for a in first] == [a.frontmatter for a in second]
+        assert [a.content for a in first] == [a.content for a in second]
+
+    def test_dates_round_trip(self, tmp_repo: Path) -> None:
+        _run(tmp_repo)
+        _, atlases, _ = _run(tmp_repo)
+
+        assert atlases[0].frontmatter["date_updated"] == dt.date(2026, 3, 21)
+
+    def test_new_directory_is_listed(self, tmp_repo: Path) -> None:
+        _run(tmp_repo)
+        (tmp_repo / "added").mkdir()
+        (tmp_repo / "added" / ".abstract.md").write_text("---\ntype: atlas\n---\n")
+        _bump_mtime(tmp_repo)
+
+        cache, atlases, _ = _run(tmp_repo)
+
+        assert tmp_repo / "added" / ".abstract.md" in [a.path for a in atlases]
+        assert cache.stats["cache_dir_hits"] == 1  # only subdir was unchanged
+
+    def test_edited_file_is_reparsed(self, tmp_repo: Path) -> None:
+        _run(tmp_repo)
+        target = tmp_repo / "subdir" / ".abstract.md"
+        target.write_text("---\ntype: atlas\nlayer: l2\n---\nEdited\n")
+
+        cache, atlases, _ = _run(tmp_repo)
+        edited = next(a for a in atlases if a.path == target)
+
+        assert edited.frontmatter["layer"] == "l2"
+        assert edited.content == "Edited\n"
+        assert cache.stats["cache_file_hits"] == 2
+
+    def test_cached_parse_errors_are_reported(self, tmp_path: Path) -> None:
+        (tmp_path / ".abstract.md").write_text("no frontmatter\n")
+        _run(tmp_path)
+        _, atlases, parser = _run(tmp_path)
+
+        assert atlases[0].validation_errors == [FRONTMATTER_ERROR]
+        assert [e.code.value for e in parser.errors] == ["E005"]
+
+    def test_corrupt_or_stale_cache_is_ignored(self, tmp_repo: Path) -> None:
+        path = cache_path(tmp_repo)
+        path.write_text("{not json")
+        cache, atlases, _ = _run(tmp_repo)
+        assert len(atlases) == 3
+        assert cache.stats["cache_hit_rate"] == 0.0
+
+        path.write_text('{"version": 0, "dirs": {}, "files": {}}')
+        assert ScanCache(path).stats["cache_hit_rate"] == 0.0
+
+    def test_deeper_depth_reuses_listings(self, tmp_repo: Path) -> None:
+        _run(tmp_repo, max_depth=0)
+        cache, atlases, _ = _run(tmp_repo)
+
+        assert len(atlases) == 3
+        assert cache.stats["cache_dir_hits"] == 1
+
+    def test_header_only_entries_do_not_serve_full_parse(self, tmp_repo: Path) -> None:
+        atlas = tmp_repo / ".abstract.md"
+        cache = ScanCache.for_root(tmp_repo)
+        Parser(cache=cache, read_body=False).parse_batch(
+            [a for a in Scanner(ScannerConfig(root_path=tmp_repo)).scan()]
+        )
+        cache.save()
+
+        cache, atlases, _ = _run(tmp_repo)
+
+        assert cache.stats["cache_file_hits"] == 0
+        assert "Root abstract." in next(a for a in atlases if a.path == atlas).content
+
+    def test_walk_only_run_keeps_file_entries(self, tmp_repo: Path) -> None:
+        _run(tmp_repo)
+        cache = ScanCache.for_root(tmp_repo)
+        written = cache.files_path.stat().st_mtime_ns
+        Scanner(ScannerConfig(root_path=tmp_repo), cache).scan()
+        cache.save()
+
+        assert cache.files_path.stat().st_mtime_ns == written
+        warm, _, _ = _run(tmp_repo)
+        assert warm.stats["cache_file_hits"] == 3
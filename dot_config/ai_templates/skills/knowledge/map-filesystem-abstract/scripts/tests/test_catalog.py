@@ -0,0 +1,122 @@
+"""Tests for the SQLite atlas catalog and its query language."""
+
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+
+import pytest
+
+from lib.catalog import Catalog, QueryError, catalog_path, compile_where, find_catalog
+from lib.parser import Parser
+from lib.scanner import Scanner, ScannerConfig
+from lib.validator import Validator
+
+TODAY = dt.date(2026, 4, 20)
+
+
+def _index(root: Path) -> Catalog:
+    atlases = Parser(quiet=True).parse_batch(
+        Scanner(ScannerConfig(root_path=root, quiet=True)).scan()
+    )
+    Validator(quiet=True).validate(atlases)
+    catalog = Catalog(catalog_path(root))
+    catalog.rebuild(root, atlases)
+    return catalog
+
+
+def _query(catalog: Catalog, expr: str, **kwargs) -> list[str]:
+    where, params = compile_where(expr, TODAY)
+    return [
+        a.path.relative_to(catalog.meta()["root"]).as_posix()
+        for a in catalog.query(where, params, **kwargs)
+    ]
+
+
+class TestCompileWhere:
+    def test_comparison_is_parameterized(self) -> None:
+        sql, params = compile_where("layer = l1", TODAY)
+        assert sql == "a.layer = ?"
+        assert params == ["l1"]
+
+    def test_boolean_operators_and_parens(self) -> None:
+        sql, params = compile_where(
+            "corpus=code or (layer != l0 and not valid = true)", TODAY
+        )
+        assert " OR " in sql and " AND " in sql and "NOT " in sql
+        assert params == ["code", "l0", 1]
+
+    def test_relative_dates(self) -> None:
+        assert compile_where("date_updated < 30 days ago", TODAY)[1] == ["2026-03-21"]
+        assert compile_where("date_updated >= 2 weeks ago", TODAY)[1] == ["2026-04-06"]
+        assert compile_where("date_updated = yesterday", TODAY)[1] == ["2026-04-19"]
+        assert compile_where("date_updated > today", TODAY)[1] == ["2026-04-20"]
+
+    def test_none_means_null_unless_quoted(self) -> None:
+        assert compile_where("parent = none", TODAY) == ("a.parent IS NULL", [])
+        assert compile_where("parent != none", TODAY) == ("a.parent IS NOT NULL", [])
+        assert compile_where("parent = 'none'", TODAY)[1] == ["none"]
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "",
+            "color = red",
+            "layer ==",
+            "layer = l1 and",
+            "(layer = l1",
+            "depth = deep",
+            "date_updated < someday",
+            "sibling.layer = l1",
+        ],
+    )
+    def test_invalid_expressions(self, expr: str) -> None:
+        with pytest.raises(QueryError):
+            compile_where(expr, TODAY)
+
+
+class TestCatalog:
+    def test_rebuild_and_filter(self, tmp_repo: Path) -> None:
+        catalog = _index(tmp_repo)
+        try:
+            assert _query(catalog, "layer = l1") == ["subdir/.abstract.md"]
+            assert _query(catalog, "depth = 0 and file = overview") == [".overview.md"]
+            assert _query(catalog, "scope ~ 's*'") == ["subdir/.abstract.md"]
+            assert _query(catalog, "date_updated < 30 days ago") == []
+            assert len(_query(catalog, "date_updated <= 2026-03-21")) == 3
+        finally:
+            catalog.close()
+
+    def test_parent_and_child_joins(self, tmp_repo: Path) -> None:
+        catalog = _index(tmp_repo)
+        try:
+            assert _query(catalog, "parent.layer = l0") == ["subdir/.abstract.md"]
+            assert _query(catalog, "child.corpus = code") == [
+                ".abstract.md",
+                ".overview.md",
+            ]
+        finally:
+            catalog.close()
+
+    def test_query_under_subdirectory(self, tmp_repo: Path) -> None:
+        catalog = _index(tmp_repo)
+        try:
+            atlases = catalog.query(under=tmp_repo / "subdir")
+            assert [a.path for a in atlases] == [tmp_repo / "subdir/.abstract.md"]
+            assert atlases[0].frontmatter["date_updated"] == dt.date(2026, 3, 21)
+        finally:
+            catalog.close()
+
+    def test_rebuild_replaces_rows(self, tmp_repo: Path) -> None:
+        _index(tmp_repo).close()
+        (tmp_repo / "subdir" / ".abstract.md").unlink()
+        catalog = _index(tmp_repo)
+        try:
+            assert _query(catalog, "layer = l1") == []
+        finally:
+            catalog.close()
+
+    def test_find_catalog_walks_up(self, tmp_repo: Path) -> None:
+        _index(tmp_repo).close()
+        assert find_catalog(tmp_repo / "subdir") == (catalog_path(tmp_repo), tmp_repo)
+        assert find_catalog(tmp_repo.parent) is None
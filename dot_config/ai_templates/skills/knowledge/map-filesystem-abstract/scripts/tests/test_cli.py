@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -107,6 +108,23 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Statistics" in result.output or "scan_time" in result.output.lower()
 
+    def test_tree_depth_folds(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(
+            app, ["scan", str(tmp_repo), "--tree", "--tree-depth", "0"]
+        )
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == [f"{tmp_repo.name}/ (l0)", "└── … 1 more"]
+
+    def test_view_options_need_tree_or_graphviz(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(app, ["scan", str(tmp_repo), "--root-at", "subdir"])
+        assert result.exit_code == 1
+        result = runner.invoke(app, ["scan", str(tmp_repo), "--tree", "--clusters"])
+        assert result.exit_code == 1
+
     def test_graphviz_export(self, tmp_repo: Path) -> None:
         from abstract_gen import app
 
@@ -121,6 +139,160 @@ class TestCLI:
         assert result.exit_code == 0
         assert ".abstract.md" in result.output or ".overview.md" in result.output
 
+    def test_workers_option(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        serial = runner.invoke(app, ["scan", str(tmp_repo), "--workers", "1"])
+        parallel = runner.invoke(app, ["scan", str(tmp_repo), "-j", "8"])
+        assert serial.exit_code == parallel.exit_code == 0
+        assert serial.output == parallel.output
+
+    def test_prune_and_ignore_files(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        for name in ("drafts", "generated"):
+            (tmp_repo / name).mkdir()
+            (tmp_repo / name / ".abstract.md").write_text("---\ntype: atlas\n---\n")
+        (tmp_repo / ".atlasignore").write_text("generated\n")
+
+        result = runner.invoke(
+            app, ["scan", str(tmp_repo), "--prune", "draft*", "--ignore-files"]
+        )
+        assert result.exit_code == 0
+        assert "drafts" not in result.output
+        assert "generated" not in result.output
+
+    def test_scan_several_roots_stats(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        subdir = tmp_repo / "subdir"
+        args = ["scan", str(tmp_repo), str(subdir), "-f", "json", "--stats"]
+        data = json.loads(runner.invoke(app, args).stdout)
+
+        assert len(data["atlases"]) == 2  # subdir once
+        roots = data["stats"]["roots"]
+        assert [r["root"] for r in roots] == [str(tmp_repo), str(subdir)]
+        assert [r["duplicate_dirs"] for r in roots] == [0, 1]
+        assert data["stats"]["duplicate_dirs"] == 1
+        assert data["stats"]["dirs_scanned"] == sum(r["dirs_scanned"] for r in roots)
+
+    def test_cache_hit_rate_and_no_cache(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        args = ["scan", str(tmp_repo), "--format", "json", "--stats"]
+        runner.invoke(app, args)
+        warm = json.loads(runner.invoke(app, args).stdout)
+        cold = json.loads(runner.invoke(app, [*args, "--no-cache"]).stdout)
+
+        assert warm["stats"]["cache_hit_rate"] == 1.0
+        assert "cache_hit_rate" not in cold["stats"]
+
+    def test_index_then_query(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        missing = runner.invoke(app, ["query", str(tmp_repo)])
+        assert missing.exit_code == 1
+
+        assert runner.invoke(app, ["index", str(tmp_repo), "-q"]).exit_code == 0
+        result = runner.invoke(
+            app, ["query", str(tmp_repo), "-w", "layer=l1", "--format", "json"]
+        )
+        assert result.exit_code == 0
+        records = json.loads(result.stdout)
+        assert [r["path"] for r in records] == [str(tmp_repo / "subdir")]
+        assert records[0]["files"] == ["abstract"]
+
+        empty = runner.invoke(app, ["query", str(tmp_repo), "-w", "layer=l3"])
+        assert empty.exit_code == 2
+        bad = runner.invoke(app, ["query", str(tmp_repo), "-w", "layer =="])
+        assert bad.exit_code == 1
+
+    def test_update_dry_run(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(app, ["update", str(tmp_repo), "--dry-run", "--json"])
+        assert result.exit_code == 0
+        plan = json.loads(result.stdout)
+        assert [p["path"] for p in plan] == [str(tmp_repo / "subdir"), str(tmp_repo)]
+        assert plan[0]["reason"] == "missing .overview.md"
+
+    def test_update_missing_agent(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(
+            app, ["update", str(tmp_repo), "--agent", "no-such-agent-cli"]
+        )
+        assert result.exit_code == 1
+        assert "no-such-agent-cli" in result.output
+
+    def test_stream_ndjson(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(
+            app, ["scan", str(tmp_repo), "--stream", "-f", "json", "--validate"]
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert sorted(r["path"] for r in records) == [
+            str(tmp_repo),
+            str(tmp_repo / "subdir"),
+        ]
+        assert all(r["is_valid"] for r in records)
+
+    def test_stream_reports_parent_errors_at_end(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        abstract = tmp_repo / "subdir" / ".abstract.md"
+        abstract.write_text(
+            abstract.read_text().replace("parent: test_repo", "parent: nope")
+        )
+        result = runner.invoke(
+            app, ["scan", str(tmp_repo), "--stream", "-f", "plain", "--validate"]
+        )
+        assert result.exit_code == 3
+        assert str(abstract) in result.stdout
+        assert "Parent atlas 'nope' not found" in result.output
+
+    def test_stream_rejects_other_formats(self, tmp_repo: Path) -> None:
+        from abstract_gen import app
+
+        result = runner.invoke(app, ["scan", str(tmp_repo), "--stream", "-f", "yaml"])
+        assert result.exit_code == 1
+
+    def test_profile_table_and_file(self, tmp_repo: Path, tmp_path: Path) -> None:
+        from abstract_gen import app
+
+        out = tmp_path / "scan.prof"
+        result = runner.invoke(
+            app,
+            [
+                "scan",
+                str(tmp_repo),
+                "--validate",
+                "--orphans",
+                "--profile",
+                "--profile-out",
+                str(out),
+            ],
+        )
+        assert result.exit_code == 0
+        for phase in ("scan", "parse", "validate", "orphans", "write", "total"):
+            assert phase in result.output
+        assert out.stat().st_size > 0
+
+    def test_profile_out_json_phases(self, tmp_repo: Path, tmp_path: Path) -> None:
+        from abstract_gen import app
+
+        out = tmp_path / "list.json"
+        result = runner.invoke(
+            app, ["list", str(tmp_repo), "-q", "--profile-out", str(out)]
+        )
+        assert result.exit_code == 0
+        assert "total" not in result.output  # no table without --profile
+        data = json.loads(out.read_text())
+        assert set(data) == {"total_ms", "phases_ms"}
+        assert "scan" in data["phases_ms"]
+
     def test_validate_flag_on_scan(self, tmp_repo: Path) -> None:
         from abstract_gen import app
 
@@ -147,6 +319,16 @@ class TestList:
         paths = result.output.strip().split("\n")
         assert len(paths) >= 2
 
+    def test_list_several_roots(self, tmp_repo_with_both: Path) -> None:
+        from abstract_gen import app
+
+        child = tmp_repo_with_both / "child_project"
+        result = runner.invoke(
+            app, ["list", str(child), str(tmp_repo_with_both), "--json", "-q"]
+        )
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == [str(tmp_repo_with_both), str(child)]
+
     def test_list_empty_dir(self, tmp_repo_empty: Path) -> None:
         from abstract_gen import app
 
@@ -0,0 +1,164 @@
+"""Tests for the serve daemon, its watcher and the thin client."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import abstract_gen
+from lib.client import forward, socket_path
+from lib.daemon import AtlasIndex, serve
+from lib.scanner import ScannerConfig
+from lib.watcher import IN_CREATE, InotifyWatcher, inotify_available
+
+needs_inotify = pytest.mark.skipif(
+    not inotify_available(), reason="inotify not available"
+)
+
+ATLAS = "---\ntype: atlas\nlayer: l1\n---\n"
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def index(tmp_repo: Path, monkeypatch: pytest.MonkeyPatch):
+    idx = AtlasIndex(ScannerConfig(root_path=tmp_repo, quiet=True))
+    idx.refresh()
+    if idx.watcher is not None:
+        idx.watcher.start()
+    monkeypatch.setattr(abstract_gen, "_daemon_index", idx)
+    yield idx
+    idx.close()
+
+
+def _request(*argv: str) -> dict:
+    return abstract_gen._serve_request({"argv": list(argv), "cwd": "/", "width": 1000})
+
+
+@needs_inotify
+class TestInotifyWatcher:
+    def test_reports_entry_events(self, tmp_path: Path) -> None:
+        events: list[tuple[str | None, str, int]] = []
+        watcher = InotifyWatcher(lambda *event: events.append(event))
+        try:
+            assert watcher.sync([str(tmp_path)]) == [str(tmp_path)]
+            watcher.start()
+            (tmp_path / "new").mkdir()
+            assert _wait_for(lambda: any(e[1] == "new" for e in events))
+        finally:
+            watcher.close()
+        path, name, mask = next(e for e in events if e[1] == "new")
+        assert path == str(tmp_path)
+        assert mask & IN_CREATE
+
+    def test_sync_drops_stale_watches(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        watcher = InotifyWatcher(lambda *event: None)
+        try:
+            watcher.sync([str(tmp_path), str(tmp_path / "a")])
+            assert watcher.sync([str(tmp_path)]) == []
+            assert watcher.watched == 1
+        finally:
+            watcher.close()
+
+
+class TestAtlasIndex:
+    def test_queries_are_served_from_the_cache(self, index: AtlasIndex) -> None:
+        response = _request("scan", str(index.config.root_path), "-f", "plain")
+
+        assert response["exit_code"] == 0
+        assert len(response["stdout"].splitlines()) == 3
+        assert index.cache.misses == {"dirs": 0, "files": 0}
+
+    @needs_inotify
+    def test_watch_picks_up_new_and_edited_atlases(
+        self, index: AtlasIndex, tmp_repo: Path
+    ) -> None:
+        assert index.cache.trusted
+        (tmp_repo / "added").mkdir()
+        (tmp_repo / "added" / ".abstract.md").write_text(ATLAS)
+        (tmp_repo / "subdir" / ".abstract.md").write_text(ATLAS + "edited\n")
+        assert _wait_for(lambda: index.dirty)
+        time.sleep(0.1)  # let the rest of the events land
+
+        response = _request("scan", str(tmp_repo), "-f", "json", "-m")
+
+        assert str(tmp_repo / "added") in response["stdout"]
+        assert '"layer": "l1"' in response["stdout"]
+        assert index.watcher is not None
+        assert _wait_for(lambda: str(tmp_repo / "added") in index.cache.dir_paths)
+
+    def test_untrusted_without_watches(
+        self, tmp_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        idx = AtlasIndex(ScannerConfig(root_path=tmp_repo, quiet=True), watch=False)
+        idx.refresh()
+        monkeypatch.setattr(abstract_gen, "_daemon_index", idx)
+        (tmp_repo / "late").mkdir()
+        (tmp_repo / "late" / ".abstract.md").write_text(ATLAS)
+        time.sleep(0.01)
+        (tmp_repo / ".keep").write_text("")  # bump the root's mtime
+
+        response = _request("scan", str(tmp_repo), "-f", "plain")
+
+        assert not idx.cache.trusted
+        assert str(tmp_repo / "late" / ".abstract.md") in response["stdout"]
+
+    def test_unserved_commands_fall_back(self, index: AtlasIndex) -> None:
+        assert _request("serve")["exit_code"] is None
+
+    def test_exit_codes_and_stderr(self, index: AtlasIndex, tmp_path: Path) -> None:
+        response = _request("scan", str(tmp_path / "missing"))
+
+        assert response["exit_code"] == 1
+        assert "Path not found" in response["stderr"]
+
+
+class TestClient:
+    def test_no_daemon(self) -> None:
+        assert not socket_path().exists()
+        assert forward(["list", "."]) is None
+
+    def test_round_trip(
+        self,
+        index: AtlasIndex,
+        tmp_repo_with_both: Path,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        started = threading.Event()
+        servers = []
+
+        def ready(server) -> None:
+            servers.append(server)
+            started.set()
+
+        thread = threading.Thread(
+            target=serve,
+            args=(index, abstract_gen._serve_request, socket_path(), ready),
+        )
+        thread.start()
+        assert started.wait(5)
+        try:
+            code = forward(["list", str(tmp_repo_with_both), "-q"])
+            assert forward(["--version"]) is None
+        finally:
+            servers[0].shutdown()
+            thread.join()
+
+        assert code == 0
+        assert capsys.readouterr().out.splitlines() == [
+            str(tmp_repo_with_both),
+            str(tmp_repo_with_both / "child_project"),
+        ]
+        assert not socket_path().exists()
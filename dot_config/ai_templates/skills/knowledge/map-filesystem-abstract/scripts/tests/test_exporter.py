@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
 from lib.exporter import ExportConfig, Exporter
 from lib.models import AtlasFile, AtlasType, ErrorCode, ScanResult
 from lib.parser import Parser
+from lib.tree_builder import TreeView
 
 
 class TestExporter:
@@ -73,6 +75,21 @@ class TestExporter:
 
         assert ".abstract.md" in output
 
+    def test_export_dir_streams_ndjson_and_plain(self, tmp_repo: Path) -> None:
+        atlases = Parser().parse_batch(
+            [
+                AtlasFile(path=tmp_repo / ".abstract.md", atlas_type=AtlasType.ABSTRACT),
+                AtlasFile(path=tmp_repo / ".overview.md", atlas_type=AtlasType.OVERVIEW),
+            ]
+        )
+
+        line = Exporter(ExportConfig(format="json")).export_dir(atlases)
+        assert "\n" not in line
+        assert json.loads(line)["files"] == ["abstract", "overview"]
+
+        plain = Exporter(ExportConfig(format="plain")).export_dir(atlases)
+        assert plain.splitlines() == [str(a.path) for a in atlases]
+
     def test_export_tree(self, tmp_repo: Path) -> None:
         parser = Parser()
         atlases = [
@@ -103,6 +120,25 @@ class TestExporter:
         assert "digraph" in output
         assert tmp_repo.name in output
 
+    def test_write_graphviz_clusters(self, tmp_path: Path) -> None:
+        atlases = [
+            AtlasFile(path=tmp_path / name / ".abstract.md", atlas_type=AtlasType.ABSTRACT)
+            for name in ("", "proj", "proj/sub", "proj/sub2", "zz")
+        ]
+        atlases[1].frontmatter = {"scope": "top"}
+        out = io.StringIO()
+        Exporter().write_graphviz(atlases, out, TreeView(max_children=1), clusters=True)
+        lines = [line.strip() for line in out.getvalue().splitlines()]
+
+        root, proj = f'"{tmp_path}"', f'"{tmp_path / "proj"}"'
+        start = lines.index(f'subgraph "cluster_{tmp_path / "proj"}" {{')
+        end = lines.index("}", start)
+        assert f"{proj} -> \"{tmp_path / 'proj' / 'sub'}\";" in lines[start:end]
+        assert any("… 1 more" in line for line in lines[start:end])
+        # The edge into the cluster follows it, so the root stays outside
+        assert lines[end + 1] == f"{root} -> {proj};"
+        assert any(line.startswith(f'"{tmp_path}#more"') for line in lines)
+
     def test_empty_result(self) -> None:
         result = ScanResult(atlases=[])
 
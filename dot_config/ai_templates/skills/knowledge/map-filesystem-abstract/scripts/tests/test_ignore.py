@@ -0,0 +1,59 @@
+"""Tests for ignore module."""
+
+from __future__ import annotations
+
+from lib.ignore import IgnoreFile, is_ignored, is_pruned
+
+
+class TestIsPruned:
+    def test_default_rules(self) -> None:
+        for name in (
+            "node_modules",
+            ".git",
+            ".venv",
+            "target",
+            "build",
+            "old_archived",
+        ):
+            assert is_pruned(name)
+
+    def test_regular_dirs_kept(self) -> None:
+        for name in ("src", "docs", "builder", "targets"):
+            assert not is_pruned(name)
+
+    def test_extra_globs(self) -> None:
+        assert is_pruned("cache-2024", ("cache-*",))
+        assert not is_pruned("cache", ("cache-*",))
+
+
+class TestIgnoreFile:
+    def test_unanchored_name_matches_at_any_depth(self) -> None:
+        rules = IgnoreFile.parse("/r", "logs/\n")
+        assert rules.match("/r/logs", "logs") is True
+        assert rules.match("/r/a/b/logs", "logs") is True
+        assert rules.match("/r/logs2", "logs2") is None
+
+    def test_anchored_pattern(self) -> None:
+        rules = IgnoreFile.parse("/r", "/out\nsrc/gen\n")
+        assert rules.match("/r/out", "out") is True
+        assert rules.match("/r/a/out", "out") is None
+        assert rules.match("/r/src/gen", "gen") is True
+        assert rules.match("/r/lib/src/gen", "gen") is None
+
+    def test_globs_and_double_star(self) -> None:
+        rules = IgnoreFile.parse("/r", "*.egg-info\n**/tmp\ndocs/**/_build\n")
+        assert rules.match("/r/pkg.egg-info", "pkg.egg-info") is True
+        assert rules.match("/r/a/b/tmp", "tmp") is True
+        assert rules.match("/r/docs/_build", "_build") is True
+        assert rules.match("/r/docs/x/y/_build", "_build") is True
+
+    def test_comments_blank_lines_and_negation(self) -> None:
+        rules = IgnoreFile.parse("/r", "# comment\n\ncache*\n!cache-keep\n")
+        assert rules.match("/r/cache1", "cache1") is True
+        assert rules.match("/r/cache-keep", "cache-keep") is False
+
+    def test_deeper_file_wins(self) -> None:
+        outer = IgnoreFile.parse("/r", "notes\n")
+        inner = IgnoreFile.parse("/r/a", "!notes\n")
+        assert is_ignored("/r/b/notes", "notes", (outer,))
+        assert not is_ignored("/r/a/notes", "notes", (outer, inner))
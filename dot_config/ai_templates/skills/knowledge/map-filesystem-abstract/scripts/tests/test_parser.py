@@ -5,7 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from lib.models import AtlasFile, AtlasType
-from lib.parser import Parser
+from lib.parser import (
+    FRONTMATTER_ERROR,
+    PARALLEL_MIN,
+    Parser,
+    read_frontmatter,
+    split_frontmatter,
+)
 
 
 class TestParser:
@@ -137,3 +143,85 @@ root: test
         result = parser.parse(atlas)
 
         assert "# Abstract" in result.content or "Abstract" in result.content
+
+    def test_repeated_values_are_shared(self, tmp_repo: Path) -> None:
+        atlases = Parser().parse_batch(
+            [
+                AtlasFile(
+                    path=tmp_repo / ".abstract.md", atlas_type=AtlasType.ABSTRACT
+                ),
+                AtlasFile(
+                    path=tmp_repo / ".overview.md", atlas_type=AtlasType.OVERVIEW
+                ),
+            ]
+        )
+
+        first, second = (a.frontmatter for a in atlases)
+        assert first["type"] is second["type"]
+        assert first["root"] is second["root"]
+
+
+class TestHeaderOnlyParse:
+    def test_read_frontmatter_stops_at_closing_marker(self, tmp_path: Path) -> None:
+        path = tmp_path / ".abstract.md"
+        path.write_text("---\ntype: atlas\n---\n" + "body\n" * 1000)
+
+        assert read_frontmatter(path) == "type: atlas\n"
+
+    def test_read_frontmatter_matches_split(self, tmp_path: Path) -> None:
+        path = tmp_path / ".abstract.md"
+        for text in ("no frontmatter\n", "---\nunterminated\n", "---x\n---\n", ""):
+            path.write_text(text)
+            assert read_frontmatter(path) == split_frontmatter(text)[0]
+
+    def test_metadata_only_skips_body(self, tmp_repo: Path) -> None:
+        path = tmp_repo / ".abstract.md"
+        atlas = AtlasFile(path=path, atlas_type=AtlasType.ABSTRACT)
+        Parser(read_body=False).parse(atlas)
+        path.write_text(path.read_text().replace("Root abstract.", "Edited."))
+
+        assert atlas.frontmatter["layer"] == "l0"
+        assert atlas.content == "# Abstract\nEdited.\n"  # read on first access
+
+    def test_equality_ignores_whether_body_was_loaded(self, tmp_repo: Path) -> None:
+        path = tmp_repo / ".abstract.md"
+        loaded = Parser().parse(AtlasFile(path=path, atlas_type=AtlasType.ABSTRACT))
+        unloaded = Parser(read_body=False).parse(
+            AtlasFile(path=path, atlas_type=AtlasType.ABSTRACT)
+        )
+
+        assert loaded == unloaded
+        assert unloaded == loaded
+
+    def test_metadata_only_reports_frontmatter_errors(self, tmp_path: Path) -> None:
+        path = tmp_path / ".abstract.md"
+        path.write_text("---\n- a list\n---\nBody\n")
+        parser = Parser(read_body=False)
+        atlas = parser.parse(AtlasFile(path=path, atlas_type=AtlasType.ABSTRACT))
+
+        assert atlas.validation_errors == [FRONTMATTER_ERROR]
+        assert [e.code.value for e in parser.errors] == ["E005"]
+
+
+class TestParallelParse:
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        atlases = []
+        for i in range(PARALLEL_MIN + 6):
+            path = tmp_path / f"d{i}" / ".abstract.md"
+            path.parent.mkdir()
+            body = f"---\nlayer: l{i}\n---\n" if i % 7 else "broken\n"
+            path.write_text(body)
+            atlases.append(path)
+        (tmp_path / "d0" / ".abstract.md").unlink()  # unreadable
+
+        def run(workers: int) -> tuple[list, list]:
+            parser = Parser(workers=workers)
+            parsed = parser.parse_batch(
+                [AtlasFile(path=p, atlas_type=AtlasType.ABSTRACT) for p in atlases]
+            )
+            return (
+                [(a.frontmatter, a.validation_errors) for a in parsed],
+                [(e.code, e.path) for e in parser.errors],
+            )
+
+        assert run(8) == run(1)
@@ -0,0 +1,65 @@
+"""Tests for phase timing and profile output."""
+
+from __future__ import annotations
+
+import pstats
+import time
+from pathlib import Path
+
+import pytest
+
+from lib.profiling import Profiler, record
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiler:
+    def test_nested_phase_is_subtracted_from_parent(self) -> None:
+        profiler = Profiler()
+        with profiler.phase("scan"):
+            _busy(0.01)
+            with profiler.phase("parse"):
+                _busy(0.05)
+        with profiler.phase("parse"):
+            _busy(0.01)
+
+        # Inclusive timing would give scan >= 0.06
+        assert 0.01 <= profiler.timings["scan"] < 0.04
+        assert profiler.timings["parse"] >= 0.06
+
+    def test_report_adds_other(self) -> None:
+        profiler = Profiler()
+        profiler.timings = {"scan": 0.3, "parse": 0.5}
+        rows = profiler.report(1.0)
+        assert [name for name, _, _ in rows] == ["scan", "parse", "other"]
+        assert rows[2][1] == pytest.approx(200.0)
+        assert sum(percent for _, _, percent in rows) == pytest.approx(100.0)
+
+    def test_disabled_records_nothing(self) -> None:
+        profiler = Profiler(enabled=False)
+        with profiler.phase("scan"):
+            pass
+        assert profiler.timings == {}
+
+
+class TestRecord:
+    def test_collapsed_stacks(self, tmp_path: Path) -> None:
+        out = tmp_path / "scan.folded"
+        with record(out):
+            _busy(0.05)
+        lines = out.read_text().splitlines()
+        assert lines
+        assert any("_busy (test_profiling.py" in line for line in lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+    def test_pstats(self, tmp_path: Path) -> None:
+        out = tmp_path / "scan.prof"
+        with record(out):
+            _busy(0.01)
+        names = {func[2] for func in pstats.Stats(str(out)).stats}
+        assert "_busy" in names
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 from lib.models import AtlasType, ErrorCode
-from lib.scanner import Scanner, ScannerConfig
+from lib.scanner import Scanner, ScannerConfig, dedupe_roots, scan_roots
 
 
 class TestScanner:
@@ -91,6 +92,28 @@ class TestScanner:
 
         assert tmp_repo / "deep" in orphans
 
+    def test_find_orphans_reuses_the_scan_walk(
+        self, tmp_repo: Path, monkeypatch
+    ) -> None:
+        (tmp_repo / "deep").mkdir()
+        scanner = Scanner(ScannerConfig(root_path=tmp_repo))
+        atlases = scanner.scan()
+        assert scanner.atlas_counts[str(tmp_repo / "subdir")] == 1
+
+        def no_walk(handle) -> None:
+            raise AssertionError("second walk")
+
+        monkeypatch.setattr(scanner, "_walk", no_walk)
+        orphans = scanner.find_orphans(atlases)
+        assert orphans == [tmp_repo / "deep", tmp_repo / "subdir"]
+
+    def test_find_orphans_without_scan_walks(self, tmp_repo: Path) -> None:
+        (tmp_repo / "subdir" / "deep").mkdir()
+        scanner = Scanner(ScannerConfig(root_path=tmp_repo, max_depth=1))
+        atlases = Scanner(ScannerConfig(root_path=tmp_repo)).scan()
+        # subdir/deep is below max_depth, so it is never listed
+        assert scanner.find_orphans(atlases) == [tmp_repo / "subdir"]
+
     def test_scan_empty_directory(self, tmp_repo_empty: Path) -> None:
         config = ScannerConfig(root_path=tmp_repo_empty)
         scanner = Scanner(config)
@@ -127,6 +150,17 @@ class TestScanner:
             elif atlas.path.name == ".overview.md":
                 assert atlas.atlas_type == AtlasType.OVERVIEW
 
+    def test_paths_are_stored_relative_to_a_shared_root(self, tmp_repo: Path) -> None:
+        results = Scanner(ScannerConfig(root_path=tmp_repo)).scan()
+
+        assert [a.rel_path for a in results] == [
+            ".abstract.md",
+            ".overview.md",
+            os.path.join("subdir", ".abstract.md"),
+        ]
+        assert results[0].root is results[2].root
+        assert results[2].path == tmp_repo / "subdir" / ".abstract.md"
+
     def test_skips_git_directory(self, tmp_repo: Path) -> None:
         git_dir = tmp_repo / ".git" / "objects"
         git_dir.mkdir(parents=True)
@@ -242,3 +276,190 @@ class TestScanner:
             or a.path.is_relative_to(tmp_repo / "Z_ARCHIVED")
         ]
         assert archive_atlases == []
+
+
+class TestParallelScan:
+    @staticmethod
+    def _build_tree(root: Path, fanout: int = 4, depth: int = 3) -> None:
+        fm = "---\ntype: atlas\nlayer: l0\n---\n"
+        dirs = [root]
+        for _ in range(depth):
+            dirs = [d / f"d{i}" for d in dirs for i in range(fanout)]
+            for d in dirs:
+                d.mkdir(parents=True)
+                if sum(map(ord, d.name + d.parent.name)) % 3 == 0:
+                    (d / ".abstract.md").write_text(fm)
+                if sum(map(ord, d.as_posix())) % 2 == 0:
+                    (d / ".overview.md").write_text(fm)
+        (root / "node_modules" / "pkg").mkdir(parents=True)
+        (root / "node_modules" / "pkg" / ".abstract.md").write_text(fm)
+
+    def _scan(self, root: Path, workers: int, **kwargs) -> tuple[list[Path], Scanner]:
+        scanner = Scanner(ScannerConfig(root_path=root, workers=workers, **kwargs))
+        return [a.path for a in scanner.scan()], scanner
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        self._build_tree(tmp_path)
+        serial, serial_scanner = self._scan(tmp_path, workers=1)
+        parallel, parallel_scanner = self._scan(tmp_path, workers=8)
+
+        assert serial
+        assert parallel == serial
+        assert (
+            parallel_scanner.stats["dirs_scanned"]
+            == serial_scanner.stats["dirs_scanned"]
+        )
+        assert parallel_scanner.stats["dirs_pruned"] == 1
+
+    def test_parallel_respects_depth_and_filters(self, tmp_path: Path) -> None:
+        self._build_tree(tmp_path)
+        for kwargs in ({"max_depth": 1}, {"max_depth": 2, "has_both": True}):
+            serial, _ = self._scan(tmp_path, workers=1, **kwargs)
+            parallel, _ = self._scan(tmp_path, workers=8, **kwargs)
+            assert parallel == serial
+        depth_one, _ = self._scan(tmp_path, workers=8, max_depth=1)
+        assert all(len(p.relative_to(tmp_path).parts) <= 2 for p in depth_one)
+
+    def test_parallel_symlink_cycle(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        try:
+            (tmp_path / "a" / "link_to_b").symlink_to(tmp_path / "b")
+            (tmp_path / "b" / "link_to_a").symlink_to(tmp_path / "a")
+        except OSError:
+            pytest.skip("Symlinks not supported on this system")
+
+        _, serial = self._scan(tmp_path, workers=1)
+        _, parallel = self._scan(tmp_path, workers=8)
+
+        assert any(e.code == ErrorCode.E003 for e in parallel.errors)
+        assert [str(e) for e in parallel.errors] == [str(e) for e in serial.errors]
+
+    def test_symlink_to_sibling_is_followed(self, tmp_path: Path) -> None:
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / ".abstract.md").write_text("---\ntype: atlas\n---\n")
+        try:
+            (tmp_path / "alias").symlink_to(real)
+        except OSError:
+            pytest.skip("Symlinks not supported on this system")
+
+        paths, scanner = self._scan(tmp_path, workers=4)
+
+        assert tmp_path / "alias" / ".abstract.md" in paths
+        assert scanner.stats["symlinks_followed"] == 1
+        assert not scanner.errors
+
+    def test_stats_report_walk_time(self, tmp_repo: Path) -> None:
+        _, scanner = self._scan(tmp_repo, workers=2)
+
+        assert scanner.stats["walk_time_ms"] >= 0
+        assert scanner.stats["workers"] == 2
+        assert scanner.stats["dirs_scanned"] == 2
+
+
+class TestPruning:
+    @staticmethod
+    def _atlas(d: Path) -> None:
+        d.mkdir(parents=True, exist_ok=True)
+        (d / ".abstract.md").write_text("---\ntype: atlas\n---\n")
+
+    def test_pruned_dirs_are_never_opened(
+        self, tmp_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import os
+
+        for name in ("node_modules", "target", "build", ".venv"):
+            self._atlas(tmp_repo / name / "deep")
+        opened: list[str] = []
+        real_scandir = os.scandir
+
+        def spy(path):
+            opened.append(str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", spy)
+        scanner = Scanner(ScannerConfig(root_path=tmp_repo, workers=1))
+        scanner.scan()
+
+        assert sorted(opened) == [str(tmp_repo), str(tmp_repo / "subdir")]
+        assert scanner.stats["dirs_pruned"] == 4
+
+    def test_extra_prune_globs(self, tmp_repo: Path) -> None:
+        self._atlas(tmp_repo / "scratch-1")
+        scanner = Scanner(ScannerConfig(root_path=tmp_repo, prune=("scratch-*",)))
+        results = scanner.scan()
+
+        assert all("scratch-1" not in a.path.parts for a in results)
+        assert scanner.stats["dirs_pruned"] == 1
+
+    def test_ignore_files_are_opt_in(self, tmp_repo: Path) -> None:
+        self._atlas(tmp_repo / "generated")
+        (tmp_repo / ".gitignore").write_text("generated/\n")
+
+        default = Scanner(ScannerConfig(root_path=tmp_repo)).scan()
+        scanner = Scanner(ScannerConfig(root_path=tmp_repo, use_ignore_files=True))
+        honored = scanner.scan()
+
+        assert tmp_repo / "generated" / ".abstract.md" in [a.path for a in default]
+        assert tmp_repo / "generated" / ".abstract.md" not in [a.path for a in honored]
+        assert scanner.stats["dirs_ignored"] == 1
+
+    def test_nested_ignore_files(self, tmp_repo: Path) -> None:
+        self._atlas(tmp_repo / "subdir" / "out")
+        self._atlas(tmp_repo / "other" / "out")
+        (tmp_repo / "subdir" / ".gitignore").write_text("out\n")
+
+        config = ScannerConfig(root_path=tmp_repo, use_ignore_files=True, workers=4)
+        paths = [a.path for a in Scanner(config).scan()]
+
+        assert tmp_repo / "other" / "out" / ".abstract.md" in paths
+        assert tmp_repo / "subdir" / "out" / ".abstract.md" not in paths
+
+    def test_atlasignore_overrides_gitignore(self, tmp_repo: Path) -> None:
+        self._atlas(tmp_repo / "docs")
+        (tmp_repo / ".gitignore").write_text("docs\n")
+        (tmp_repo / ".atlasignore").write_text("!docs\n")
+
+        config = ScannerConfig(root_path=tmp_repo, use_ignore_files=True)
+        paths = [a.path for a in Scanner(config).scan()]
+
+        assert tmp_repo / "docs" / ".abstract.md" in paths
+
+
+class TestScanRoots:
+    def _scanners(self, *roots: Path) -> list[Scanner]:
+        return [Scanner(ScannerConfig(root_path=r, workers=4)) for r in roots]
+
+    def test_shared_pool_matches_separate_scans(self, tmp_path: Path) -> None:
+        for name in ("a", "b"):
+            TestParallelScan._build_tree(tmp_path / name, fanout=3)
+        roots = [tmp_path / "a", tmp_path / "b"]
+
+        results = scan_roots(self._scanners(*roots), workers=4)
+        separate = [s.scan() for s in self._scanners(*roots)]
+        assert [[x.path for x in r] for r in results] == [
+            [x.path for x in r] for r in separate
+        ]
+
+    def test_earlier_root_wins_by_real_path(self, tmp_path: Path) -> None:
+        TestParallelScan._build_tree(tmp_path / "repo", fanout=3)
+        try:
+            (tmp_path / "alias").symlink_to(tmp_path / "repo" / "d0")
+        except OSError:
+            pytest.skip("Symlinks not supported on this system")
+        scanners = self._scanners(
+            tmp_path / "repo" / "d1", tmp_path / "alias", tmp_path / "repo"
+        )
+        kept, dropped = dedupe_roots(scanners, scan_roots(scanners, workers=4))
+
+        assert kept[0] and kept[1]
+        assert all(a.path.is_relative_to(tmp_path / "alias") for a in kept[1])
+        # repo/d0 came in through the alias and repo/d1 as the first root
+        assert not any(
+            a.path.is_relative_to(tmp_path / "repo" / d)
+            for a in kept[2]
+            for d in ("d0", "d1")
+        )
+        assert dropped[:2] == [0, 0]
+        assert dropped[2] == len({a.dir_path for a in kept[0] + kept[1]})
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from lib.models import AtlasFile, AtlasType
 from lib.parser import Parser
-from lib.tree_builder import TreeBuilder
+from lib.tree_builder import TreeBuilder, TreeView
 
 
 class TestTreeBuilder:
@@ -122,3 +122,57 @@ root: test
         tree = builder.build([atlas])
 
         assert tree["roots"][0]["layer"] == "l2"
+
+
+def _dirs(root: Path, *names: str) -> list[AtlasFile]:
+    atlases = []
+    for name in ("", *names):
+        atlas = AtlasFile(path=root / name / ".abstract.md", atlas_type=AtlasType.ABSTRACT)
+        atlases.append(atlas)
+    atlases[0].frontmatter = {"layer": "l0"}
+    return atlases
+
+
+class TestTreeView:
+    def test_max_children_folds_the_rest(self, tmp_path: Path) -> None:
+        atlases = _dirs(tmp_path, "a", "a/x", "a/y", "b", "c", "c/z")
+        output = TreeBuilder().build_ascii_tree(atlases, TreeView(max_children=2))
+        assert output.splitlines() == [
+            f"{tmp_path.name}/ (l0)",
+            "├── a/ (l1)",
+            "│   ├── x/ (l2)",
+            "│   └── y/ (l2)",
+            "├── b/ (l1)",
+            "└── … 2 more",
+        ]
+
+    def test_max_depth_counts_every_folded_dir(self, tmp_path: Path) -> None:
+        atlases = _dirs(tmp_path, "a", "a/x", "a/y", "b")
+        output = TreeBuilder().build_ascii_tree(atlases, TreeView(max_depth=1))
+        assert output.splitlines()[1:] == [
+            "├── a/ (l1)",
+            "│   └── … 2 more",
+            "└── b/ (l1)",
+        ]
+
+    def test_root_at_keeps_inherited_layers(self, tmp_path: Path) -> None:
+        atlases = _dirs(tmp_path, "a", "a/x", "b", "b/c/p", "b/c/q")
+        builder = TreeBuilder()
+        assert builder.build_ascii_tree(atlases, TreeView(root_at=tmp_path / "a")) == (
+            "a/ (l1)\n└── x/ (l2)"
+        )
+        # No atlas at the chosen directory: each top node is named relative to it
+        output = builder.build_ascii_tree(atlases, TreeView(root_at=tmp_path / "b" / "c"))
+        assert output.splitlines() == ["p/ (l2)", "q/ (l2)"]
+
+    def test_walk_events(self, tmp_path: Path) -> None:
+        atlases = _dirs(tmp_path, "a", "b")
+        events = [
+            (event, node["name"], arg if event == "more" else None)
+            for event, node, arg in TreeBuilder().walk(atlases, TreeView(max_depth=0))
+        ]
+        assert events == [
+            ("node", tmp_path.name, None),
+            ("more", tmp_path.name, 2),
+            ("close", tmp_path.name, None),
+        ]
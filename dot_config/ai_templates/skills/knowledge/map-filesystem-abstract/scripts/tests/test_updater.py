@@ -0,0 +1,157 @@
+"""Tests for stale-atlas detection and leaves-first regeneration."""
+
+from __future__ import annotations
+
+import os
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+
+from lib.parser import Parser
+from lib.scanner import Scanner, ScannerConfig
+from lib.updater import Updater, read_inputs
+
+OLD = 1_772_323_200  # 2026-03-01, before the fixtures' date_updated
+
+FAKE_AGENT = """\
+import datetime, os, pathlib, sys
+cwd = pathlib.Path.cwd()
+with open({log!r}, "a") as log:
+    log.write(str(cwd) + "\\n")
+if cwd.name == os.environ.get("FAIL_DIR"):
+    sys.exit("boom")
+fm = "---\\ntype: atlas\\nlayer: l1\\ndate_updated: %s\\n---\\n" % datetime.date.today()
+for name in (".abstract.md", ".overview.md"):
+    (cwd / name).write_text(fm)
+print("rewrote", cwd.name)
+"""
+
+
+def _age(root: Path) -> None:
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (OLD, OLD))
+
+
+def _atlases(root: Path) -> list:
+    return Parser(quiet=True, read_body=False).parse_batch(
+        Scanner(ScannerConfig(root_path=root, quiet=True)).scan()
+    )
+
+
+@pytest.fixture
+def nested_repo(tmp_repo_with_both: Path) -> Path:
+    (tmp_repo_with_both / "child_project" / "main.py").write_text("print(1)\n")
+    (tmp_repo_with_both / "notes.md").write_text("notes\n")
+    _age(tmp_repo_with_both)
+    return tmp_repo_with_both
+
+
+@pytest.fixture
+def agent(tmp_path: Path) -> tuple[str, Path]:
+    log = tmp_path / "agent.log"
+    script = tmp_path / "fake_agent.py"
+    script.write_text(FAKE_AGENT.format(log=str(log)))
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}", log
+
+
+class TestReadInputs:
+    def test_child_atlas_stands_in_for_its_subtree(self, nested_repo: Path) -> None:
+        child = str(nested_repo / "child_project")
+        inputs = read_inputs(str(nested_repo), {str(nested_repo), child})
+        # notes.md plus the child's two atlas files; main.py is the child's
+        assert inputs.files == 3
+
+        (nested_repo / "child_project" / "main.py").write_text("print(2)\n")
+        assert read_inputs(str(nested_repo), {str(nested_repo), child}) == inputs
+
+    def test_own_atlas_and_pruned_dirs_are_not_inputs(self, nested_repo: Path) -> None:
+        (nested_repo / "node_modules").mkdir()
+        (nested_repo / "node_modules" / "x.js").write_text("x")
+        inputs = read_inputs(str(nested_repo), {str(nested_repo)})
+        # notes.md and all of child_project; not .abstract.md, .overview.md
+        assert inputs.files == 4
+
+
+class TestPlan:
+    def test_up_to_date_tree_has_empty_plan(self, nested_repo: Path) -> None:
+        assert Updater(nested_repo).plan(_atlases(nested_repo)) == []
+
+    def test_changed_leaf_makes_ancestors_stale_leaves_first(
+        self, nested_repo: Path
+    ) -> None:
+        (nested_repo / "child_project" / "main.py").write_text("print(2)\n")
+        plan = Updater(nested_repo).plan(_atlases(nested_repo))
+
+        assert [s.path for s in plan] == [nested_repo / "child_project", nested_repo]
+        assert plan[0].reason == "files changed after 2026-03-21"
+        assert plan[0].parent == nested_repo
+        assert plan[1].reason == "child atlas stale: child_project"
+
+    def test_stored_fingerprint_overrides_dates(self, nested_repo: Path) -> None:
+        updater = Updater(nested_repo)
+        updater.plan(_atlases(nested_repo))  # records fingerprints
+        updater.save_state()
+
+        # A newer mtime on unchanged content size still counts as a change
+        os.utime(nested_repo / "notes.md", (OLD, OLD + 60))
+        plan = Updater(nested_repo).plan(_atlases(nested_repo))
+        assert [(s.path, s.reason) for s in plan] == [
+            (nested_repo, "files changed since last update")
+        ]
+
+    def test_missing_atlas_and_create_root(self, tmp_repo: Path) -> None:
+        plan = Updater(tmp_repo / "subdir").plan(
+            _atlases(tmp_repo / "subdir"), create_root=True
+        )
+        assert [(s.path.name, s.reason) for s in plan] == [
+            ("subdir", "missing .overview.md")
+        ]
+
+    def test_force(self, nested_repo: Path) -> None:
+        plan = Updater(nested_repo).plan(_atlases(nested_repo), force=True)
+        assert [s.reason for s in plan] == ["forced", "forced"]
+
+
+class TestRun:
+    def test_parents_wait_for_children(
+        self, nested_repo: Path, agent: tuple[str, Path]
+    ) -> None:
+        command, log = agent
+        (nested_repo / "child_project" / "main.py").write_text("print(2)\n")
+        updater = Updater(nested_repo, agent=command, jobs=4)
+        results = updater.run(updater.plan(_atlases(nested_repo)))
+        updater.save_state()
+
+        assert all(r.ok for r in results)
+        assert results[0].message == "rewrote child_project"
+        assert log.read_text().split() == [
+            str(nested_repo / "child_project"),
+            str(nested_repo),
+        ]
+        assert Updater(nested_repo).plan(_atlases(nested_repo)) == []
+
+    def test_failed_child_skips_parent(
+        self, nested_repo: Path, agent: tuple[str, Path], monkeypatch
+    ) -> None:
+        monkeypatch.setenv("FAIL_DIR", "child_project")
+        command, log = agent
+        updater = Updater(nested_repo, agent=command)
+        results = updater.run(updater.plan(_atlases(nested_repo), force=True))
+
+        assert [(r.path, r.ok) for r in results] == [
+            (nested_repo / "child_project", False),
+            (nested_repo, False),
+        ]
+        assert results[0].message == "agent exited 1: boom"
+        assert results[1].message == "skipped: a child atlas failed"
+        assert log.read_text().split() == [str(nested_repo / "child_project")]
+
+    def test_prompt_placeholder(self, nested_repo: Path) -> None:
+        updater = Updater(nested_repo, agent="llm -p {prompt} --cwd {path}")
+        argv = updater.command(nested_repo)
+        assert argv[:2] == ["llm", "-p"]
+        assert f"Execute those instructions for: {nested_repo}" in argv[2]
+        assert argv[3:] == ["--cwd", str(nested_repo)]
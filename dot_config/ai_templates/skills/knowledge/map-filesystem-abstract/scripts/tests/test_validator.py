@@ -108,3 +108,102 @@ date_updated: invalid-date
         validator.validate_date_consistency([atlas], [])
 
         assert any("date" in e.lower() for e in atlas.validation_errors)
+
+
+def _atlas(path: Path, **fields: object) -> AtlasFile:
+    frontmatter = {
+        "type": "atlas",
+        "layer": "l1",
+        "corpus": "code",
+        "scope": "subtree",
+        "root": "proj",
+        "parent": "",
+        "date_updated": "2026-03-21",
+    }
+    frontmatter.update(fields)
+    return AtlasFile(
+        path=path / ".abstract.md",
+        atlas_type=AtlasType.ABSTRACT,
+        frontmatter=frontmatter,
+    )
+
+
+class TestValidateHierarchy:
+    def _errors(self, atlases: list[AtlasFile], code: ErrorCode) -> list[str]:
+        errors = Validator().validate(atlases).errors
+        return [f"{e.path.parent.name}: {e.message}" for e in errors if e.code == code]
+
+    def test_consistent_tree(self, tmp_path: Path) -> None:
+        proj = tmp_path / "proj"
+        atlases = [
+            _atlas(proj, layer="l0", scope="top"),
+            _atlas(proj / "src", parent="proj"),
+            _atlas(proj / "src" / "deep" / "api", layer="l2", parent="src"),
+        ]
+        result = Validator().validate(atlases)
+
+        assert result.errors == []
+        assert all(a.is_valid for a in atlases)
+
+    def test_parent_must_name_enclosing_atlas(self, tmp_path: Path) -> None:
+        proj = tmp_path / "proj"
+        atlases = [
+            _atlas(proj, layer="l0", scope="top"),
+            _atlas(proj / "src", parent="proj"),
+            _atlas(proj / "src" / "api", layer="l2", parent="proj"),
+            _atlas(proj / "docs", parent="src"),
+        ]
+
+        assert self._errors(atlases, ErrorCode.E010) == [
+            "api: Parent 'proj' does not match enclosing atlas 'src'",
+            "docs: Parent 'src' does not match enclosing atlas 'proj'",
+        ]
+        assert not atlases[2].is_valid
+
+    def test_parent_outside_scan_may_be_any_ancestor(self, tmp_path: Path) -> None:
+        sub = tmp_path / "proj" / "sub"
+        atlases = [
+            _atlas(sub, parent="proj"),
+            _atlas(tmp_path / "other", parent="sub"),
+        ]
+
+        assert self._errors(atlases, ErrorCode.E010) == [
+            "other: Parent 'sub' does not enclose this atlas"
+        ]
+
+    def test_root_agrees_within_project(self, tmp_path: Path) -> None:
+        proj = tmp_path / "proj"
+        atlases = [
+            _atlas(proj, layer="l0", scope="top"),
+            _atlas(proj / "src", parent="proj", root="elsewhere"),
+            _atlas(proj / "vendor", layer="l0", scope="top", root="vendor"),
+            _atlas(proj / "vendor" / "lib", parent="vendor", root="vendor"),
+        ]
+
+        assert self._errors(atlases, ErrorCode.E010) == [
+            f"src: Root 'elsewhere' differs from project root 'proj' ({proj})"
+        ]
+
+    def test_layer_follows_nesting(self, tmp_path: Path) -> None:
+        proj = tmp_path / "proj"
+        atlases = [
+            _atlas(proj, layer="l0", scope="top"),
+            _atlas(proj / "src", layer="l2", parent="proj"),
+        ]
+
+        assert self._errors(atlases, ErrorCode.E010) == [
+            "src: Layer l2 does not follow enclosing atlas layer l0"
+        ]
+
+    def test_parent_older_than_child_warns(self, tmp_path: Path) -> None:
+        proj = tmp_path / "proj"
+        atlases = [
+            _atlas(proj, layer="l0", scope="top", date_updated="2026-01-01"),
+            _atlas(proj / "a", parent="proj", date_updated="2026-02-01"),
+            _atlas(proj / "b", parent="proj", date_updated="2026-03-01"),
+        ]
+
+        assert self._errors(atlases, ErrorCode.E011) == [
+            "proj: date_updated 2026-01-01 is older than child atlas b (2026-03-01)"
+        ]
+        assert all(a.is_valid for a in atlases)
@@ -36,9 +36,13 @@ Examples:
 import base64
 import os
 import platform
+import queue
 import subprocess
 import sys
+import threading
+import time
 import traceback
+from contextlib import nullcontext
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
@@ -158,6 +162,35 @@ def load_image_as_base64(image_path: Path) -> str:
         return f"data:image/png;base64,{b64_data}"
 
 
+def image_seeds(seed: int | None, count: int) -> list[int | None]:
+    """Per-image seeds: base seed + index, or no seed for any image."""
+    if seed is None:
+        return [None] * count
+    return [seed + i for i in range(count)]
+
+
+def request_image(
+    client: OpenAI, message_content: str | list[dict], extra_body: dict
+) -> str:
+    """Make one generation request and return its first image as a data URL."""
+    response = client.chat.completions.create(
+        model=MODEL_NAME,
+        messages=[
+            {
+                "role": "user",
+                "content": message_content,
+            }
+        ],
+        extra_body=extra_body,
+    )
+    message = response.choices[0].message
+    images = getattr(message, "images", None)
+    if not images:
+        detail = f" Model response: {message.content}" if message.content else ""
+        raise RuntimeError(f"No image was generated in the response.{detail}")
+    return images[0]["image_url"]["url"]
+
+
 # Valid image sizes and aspect ratios
 VALID_SIZES = ["1K", "2K", "4K"]
 VALID_ASPECT_RATIOS = [
@@ -450,7 +483,10 @@ def generate(
                 console_stderr.print(f"[bold]Safety Filter:[/bold] {safety.lower()}")
             if open_after:
                 console_stderr.print("[bold]Open After:[/bold] Yes")
-            if seed is not None:
+            if seed is not None and nbr_img_output > 1:
+                seed_list = ", ".join(map(str, image_seeds(seed, nbr_img_output)))
+                console_stderr.print(f"[bold]Seeds:[/bold] {seed_list}")
+            elif seed is not None:
                 console_stderr.print(f"[bold]Seed:[/bold] {seed}")
             console_stderr.print(
                 f"[bold]API Key:[/bold] {'[green]SET[/green]' if resolved_key else '[red]NOT SET[/red]'}"
@@ -525,7 +561,10 @@ def generate(
             console_stderr.print(f"  Thinking: {thinking.lower()}")
         if safety:
             console_stderr.print(f"  Safety: {safety.lower()}")
-        if seed is not None:
+        if seed is not None and nbr_img_output > 1:
+            seed_list = ", ".join(map(str, image_seeds(seed, nbr_img_output)))
+            console_stderr.print(f"  Seeds: {seed_list}")
+        elif seed is not None:
             console_stderr.print(f"  Seed: {seed}")
         if nbr_img_output > 1:
             for p in output_paths:
@@ -577,8 +616,6 @@ def generate(
             "modalities": ["image", "text"],
             "image_config": image_config,
         }
-        if seed is not None:
-            extra_body["seed"] = seed
         if thinking:
             # Map thinking mode to effort level
             effort_map = {
@@ -601,67 +638,56 @@ def generate(
             console_stderr.print(f"  Model: {MODEL_NAME}")
             console_stderr.print(f"  Endpoint: {API_BASE_URL}/chat/completions")
 
-        # Make API call with progress spinner
-        if console_stderr.is_terminal:
-            with console_stderr.status(
-                f"[bold]{mode}...{' (this may take a minute)' if not quiet else ''}",
-                spinner="dots",
-            ):
-                try:
-                    response = client.chat.completions.create(
-                        model=MODEL_NAME,
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": message_content,
-                            }
-                        ],
-                        extra_body=extra_body,
-                    )
-                except KeyboardInterrupt:
-                    if not quiet:
-                        console_stderr.print("\n[yellow]Interrupted by user[/yellow]")
-                    raise typer.Exit(130) from None
-        else:
-            try:
-                response = client.chat.completions.create(
-                    model=MODEL_NAME,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": message_content,
-                        }
-                    ],
-                    extra_body=extra_body,
-                )
-            except KeyboardInterrupt:
-                if not quiet:
-                    console_stderr.print("\n[yellow]Interrupted by user[/yellow]")
-                raise typer.Exit(130) from None
+        # One request per image, all in flight at once, so N variations take
+        # about as long as one. Each image is saved as soon as it arrives.
+        seeds = image_seeds(seed, nbr_img_output)
+        started = time.monotonic()
+        arrived: queue.Queue[tuple[int, str | None, Exception | None]] = queue.Queue()
 
-        message = response.choices[0].message
+        def fetch(idx: int, body: dict) -> None:
+            try:
+                arrived.put((idx, request_image(client, message_content, body), None))
+            except Exception as e:
+                arrived.put((idx, None, e))
+
+        # Daemon threads, so Ctrl-C does not wait for requests still in flight
+        for idx, image_seed in enumerate(seeds):
+            body = (
+                extra_body if image_seed is None else {**extra_body, "seed": image_seed}
+            )
+            threading.Thread(target=fetch, args=(idx, body), daemon=True).start()
 
-        if verbose:
-            console_stderr.print("[bold cyan][DEBUG][/bold cyan] Response received")
-            if hasattr(message, "images") and message.images:
-                console_stderr.print(f"  Images in response: {len(message.images)}")
-
-        # Check for images in response
-        if hasattr(message, "images") and message.images:
-            num_to_save = min(len(message.images), nbr_img_output)
-            for idx in range(num_to_save):
-                image_data = message.images[idx]
-                image_url = image_data["image_url"]["url"]
+        results: dict[int, tuple[float, str | None]] = {}  # idx -> (secs, error)
+        status = (
+            console_stderr.status(
+                f"[bold]{mode}...{' (this may take a minute)' if not quiet else ''}",
+                spinner="dots",
+            )
+            if console_stderr.is_terminal
+            else nullcontext()
+        )
+        with status:
+            for _ in seeds:
+                idx, image_url, error = arrived.get()
                 current_output_path = output_paths[idx]
-                save_image_from_base64(image_url, current_output_path, format_lower)
+                try:
+                    if error is not None:
+                        raise error
+                    save_image_from_base64(image_url, current_output_path, format_lower)
+                except Exception as e:
+                    results[idx] = (time.monotonic() - started, str(e))
+                    console_stderr.print(f"[red]Image {idx + 1} failed:[/red] {e}")
+                    if verbose:
+                        traceback.print_exception(e, file=sys.stderr)
+                    continue
+                results[idx] = (time.monotonic() - started, None)
 
                 if verbose:
-                    # Get image size from saved file
-                    img = Image.open(current_output_path)
-                    size_mb = current_output_path.stat().st_size / (1024 * 1024)
-                    console_stderr.print(
-                        f"  Image {idx + 1}: {img.width}x{img.height} pixels, {size_mb:.1f} MB"
-                    )
+                    with Image.open(current_output_path) as img:
+                        size_mb = current_output_path.stat().st_size / (1024 * 1024)
+                        console_stderr.print(
+                            f"  Image {idx + 1}: {img.width}x{img.height} pixels, {size_mb:.1f} MB"
+                        )
 
                 # Output path to stdout (data output)
                 console.print(str(current_output_path.resolve()))
@@ -669,24 +695,38 @@ def generate(
                 if not quiet:
                     console.print("[green]Image saved[/green]")
 
-            # Open images if requested
-            if open_after:
-                for output_p in output_paths[:num_to_save]:
-                    try:
-                        _open_file(str(output_p), quiet)
-                    except Exception as e:
-                        if not quiet:
-                            console_stderr.print(
-                                f"[yellow]Warning:[/yellow] Could not open image: {e}"
-                            )
-        else:
-            # Fallback: check content for text response
-            if message.content:
+        saved = [output_paths[i] for i in sorted(results) if results[i][1] is None]
+        failed = len(results) - len(saved)
+
+        if nbr_img_output > 1 and not quiet:
+            console_stderr.print(
+                f"[bold]Summary:[/bold] {len(saved)}/{nbr_img_output} images saved"
+            )
+            for idx in sorted(results):
+                seconds, error = results[idx]
+                seed_note = f" seed {seeds[idx]}," if seeds[idx] is not None else ""
+                outcome = (
+                    f"[red]failed[/red] ({error})" if error else str(output_paths[idx])
+                )
                 console_stderr.print(
-                    f"[yellow]Model response:[/yellow] {message.content}"
+                    f"  {idx + 1}:{seed_note} {seconds:.1f}s, {outcome}"
                 )
+
+        # Open images if requested
+        if open_after:
+            for output_p in saved:
+                try:
+                    _open_file(str(output_p), quiet)
+                except Exception as e:
+                    if not quiet:
+                        console_stderr.print(
+                            f"[yellow]Warning:[/yellow] Could not open image: {e}"
+                        )
+
+        if failed:
             console_stderr.print(
-                "[red]Error:[/red] No image was generated in the response."
+                f"[red]Error:[/red] {failed} of {nbr_img_output} image"
+                f"{'s' if nbr_img_output > 1 else ''} failed."
             )
             raise typer.Exit(1)
 
@@ -694,6 +734,8 @@ def generate(
         if not quiet:
             console_stderr.print("\n[yellow]Interrupted by user[/yellow]")
         raise typer.Exit(130) from None
+    except typer.Exit:
+        raise
     except Exception as e:
         console_stderr.print(f"[red]Error generating image:[/red] {e}")
         if verbose:
@@ -1,6 +1,7 @@
 """Tests for gen_image.py CLI tool."""
 
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
@@ -644,6 +645,23 @@ class TestFlagCombinations:
         assert "\x1b[" not in stderr
         assert "\033[" not in stderr
 
+    def test_seed_with_multiple_images(self):
+        """Each image should get its own seed, counting up from --seed."""
+        stdout, stderr, code = run_script(
+            "--prompt", "test", "--seed", "42", "--nbr-img-output", "3", "--dry-run"
+        )
+        assert code == 0
+        assert "42, 43, 44" in stderr
+
+    def test_seed_with_single_image(self):
+        """A single image should use --seed unchanged."""
+        stdout, stderr, code = run_script(
+            "--prompt", "test", "--seed", "42", "--dry-run"
+        )
+        assert code == 0
+        assert "Seed: 42" in stderr
+        assert "Seeds:" not in stderr
+
 
 class TestQuietMode:
     """Test quiet mode behavior in detail."""
@@ -668,5 +686,196 @@ class TestQuietMode:
         assert "DRY RUN" in stderr or "Mode:" in stderr
 
 
+@pytest.fixture(scope="module")
+def gen_image():
+    """Import gen_image.py in-process for tests that stub the API client."""
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("gen_image", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+TINY_PNG_URL = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAIAAACQd1PeAAAADElEQVR4"
+    "nGP4z8AAAAMBAQDJ/pLvAAAAAElFTkSuQmCC"
+)
+
+
+def fake_response(images=None, content=""):
+    """A chat completion shaped like an OpenRouter image response."""
+    from types import SimpleNamespace
+
+    message = SimpleNamespace(images=images, content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeCompletions:
+    """Records each request; per-seed behavior comes from *handlers*."""
+
+    def __init__(self, handlers=None):
+        import threading
+
+        self.handlers = handlers or {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def create(self, model, messages, extra_body):
+        with self.lock:
+            self.calls.append(extra_body)
+        handler = self.handlers.get(extra_body.get("seed"))
+        if handler is not None:
+            return handler()
+        return fake_response(images=[{"image_url": {"url": TINY_PNG_URL}}])
+
+
+class TestImageSeeds:
+    """Test per-image seed assignment."""
+
+    def test_seeds_count_up_from_base(self, gen_image):
+        """Image i should get seed + i."""
+        assert gen_image.image_seeds(42, 3) == [42, 43, 44]
+
+    def test_no_seed_for_any_image(self, gen_image):
+        """Without --seed, no image should carry a seed."""
+        assert gen_image.image_seeds(None, 2) == [None, None]
+
+
+class TestRequestImage:
+    """Test a single generation request against a stubbed client."""
+
+    def _client(self, completions):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    def test_returns_first_image_url(self, gen_image):
+        """The first image's data URL should be returned."""
+        completions = FakeCompletions()
+        url = gen_image.request_image(self._client(completions), "a cat", {"seed": 7})
+        assert url == TINY_PNG_URL
+        assert completions.calls == [{"seed": 7}]
+
+    def test_no_images_in_response_raises(self, gen_image):
+        """A response without images should raise with the model's text."""
+        completions = FakeCompletions(
+            {None: lambda: fake_response(images=None, content="I can't draw that")}
+        )
+        with pytest.raises(RuntimeError, match="No image was generated") as exc_info:
+            gen_image.request_image(self._client(completions), "a cat", {})
+        assert "I can't draw that" in str(exc_info.value)
+
+
+class TestConcurrentGeneration:
+    """Test multi-image generation with a stubbed OpenAI client."""
+
+    def _run(self, gen_image, monkeypatch, completions, *args):
+        """Invoke the CLI in-process; return (stdout, stderr, exit_code)."""
+        import io
+        from types import SimpleNamespace
+
+        from rich.console import Console
+        from typer.testing import CliRunner
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        monkeypatch.setattr(gen_image, "console", Console(file=stdout, width=500))
+        monkeypatch.setattr(
+            gen_image, "console_stderr", Console(file=stderr, width=500)
+        )
+        monkeypatch.setattr(
+            gen_image,
+            "OpenAI",
+            lambda **kwargs: SimpleNamespace(
+                chat=SimpleNamespace(completions=completions)
+            ),
+        )
+        monkeypatch.setenv("_TEST_SKIP_KEYRING", "1")
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+        result = CliRunner().invoke(gen_image.app, ["--prompt", "test", *args])
+        return stdout.getvalue(), stderr.getvalue(), result.exit_code
+
+    def test_one_request_per_image_with_own_seed(
+        self, gen_image, monkeypatch, tmp_path
+    ):
+        """Each image should be its own request, seeded base + index."""
+        completions = FakeCompletions()
+        stdout, stderr, code = self._run(
+            gen_image,
+            monkeypatch,
+            completions,
+            "--seed",
+            "42",
+            "-c",
+            "3",
+            "-o",
+            str(tmp_path),
+            "-f",
+            "img.png",
+        )
+        assert code == 0
+        assert sorted(c["seed"] for c in completions.calls) == [42, 43, 44]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "img-1.png",
+            "img-2.png",
+            "img-3.png",
+        ]
+        assert "Summary: 3/3 images saved" in stderr
+
+    def test_images_saved_as_they_arrive(self, gen_image, monkeypatch, tmp_path):
+        """A slow first image should not hold back saving the others."""
+
+        def slow_first():
+            deadline = time.monotonic() + 5
+            while not (tmp_path / "img-2.png").exists():
+                assert time.monotonic() < deadline, "image 2 was not saved early"
+                time.sleep(0.01)
+            return fake_response(images=[{"image_url": {"url": TINY_PNG_URL}}])
+
+        completions = FakeCompletions({42: slow_first})
+        _, _, code = self._run(
+            gen_image,
+            monkeypatch,
+            completions,
+            "--seed",
+            "42",
+            "-c",
+            "2",
+            "-o",
+            str(tmp_path),
+            "-f",
+            "img.png",
+        )
+        assert code == 0
+        assert (tmp_path / "img-1.png").exists()
+
+    def test_partial_failure_keeps_other_images(self, gen_image, monkeypatch, tmp_path):
+        """One failed request should not discard the rest, but should exit 1."""
+
+        def rate_limited():
+            raise RuntimeError("429 rate limited")
+
+        completions = FakeCompletions({43: rate_limited})
+        stdout, stderr, code = self._run(
+            gen_image,
+            monkeypatch,
+            completions,
+            "--seed",
+            "42",
+            "-c",
+            "3",
+            "-o",
+            str(tmp_path),
+            "-f",
+            "img.png",
+        )
+        assert code == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["img-1.png", "img-3.png"]
+        assert stdout.count("img-") == 2
+        assert "Summary: 2/3 images saved" in stderr
+        assert "2: seed 43" in stderr and "failed (429 rate limited)" in stderr
+        assert "1 of 3 images failed" in stderr
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,7 +1,7 @@
 #!/usr/bin/env uv run python3
 # /// script
 # dependencies = [
-#     "httpx>=0.27",
+#     "httpx[http2]>=0.27",
 #     "rich>=13.0",
 # ]
 # ///
@@ -14,12 +14,25 @@ Usage:
     uv run grokipedia.py "Italian cuisine" --max-results 10
     uv run grokipedia.py "AI history" --raw
     uv run grokipedia.py "neural networks" --json | jq '.results[].url'
+    uv run grokipedia.py --queries-file topics.txt > results.ndjson
+    uv run grokipedia.py "quantum computing" --prefer-local
+    uv run grokipedia.py "AI history" --raw --ndjson --max-raw-chars 2000
 """
 
 import argparse
+import asyncio
+import contextlib
+import hashlib
+import importlib.util
 import json
+import os
+import re
+import sqlite3
 import subprocess
 import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -34,6 +47,44 @@ TAVILY_API_URL = "https://api.tavily.com/search"
 TAVILY_EXTRACT_URL = "https://api.tavily.com/extract"
 GROKIPEDIA_BASE = "https://grokipedia.com/page"
 SEARCH_DOMAINS = ["grokipedia.com", "grokxpedia.us"]
+PAGE_BASES = [GROKIPEDIA_BASE, *(f"https://{d}/page" for d in SEARCH_DOMAINS[1:])]
+MAX_EXTRACT_CANDIDATES = 10  # URLs probed per /extract call (Tavily max: 20)
+
+# Search tiers: "auto" tries the cheap "basic" depth first and escalates to
+# "advanced" only when neither the exact page nor basic results are good.
+SEARCH_DEPTHS = ("auto", "basic", "advanced")
+BASIC_SCORE_THRESHOLD = 0.6  # top basic-tier score needed to skip "advanced"
+
+# Per-endpoint request timeouts (seconds); overridable from the CLI
+SEARCH_TIMEOUT = 30.0
+EXTRACT_TIMEOUT = 15.0
+
+# Connection pool for the shared client (one per invocation / batch)
+POOL_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
+# Batch mode: concurrent queries under a token-bucket limiter
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 4.0  # requests per second across all workers
+RATE_LIMIT_RETRIES = 4  # HTTP 429 retries per request (batch mode)
+RATE_LIMIT_BACKOFF = 1.0  # first backoff (seconds) when no Retry-After header
+
+# On-disk response cache (override location with GROKIPEDIA_CACHE_DIR)
+CACHE_DIR = Path(
+    os.environ.get("GROKIPEDIA_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "grokipedia"
+)
+CACHE_FILENAME = "responses.sqlite3"
+SEARCH_CACHE_TTL = 24 * 3600  # search rankings drift; keep for a day
+EXTRACT_CACHE_TTL = 7 * 24 * 3600  # page bodies change rarely
+EXTRACT_MISS_CACHE_TTL = 3600  # a missing page may be created; recheck hourly
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # LRU eviction above this total body size
+
+# Offline mirror of every page body fetched, full-text indexed (FTS5/BM25)
+MIRROR_FILENAME = "mirror.sqlite3"
+LOCAL_THRESHOLD = 0.75  # --prefer-local: below this top score, ask Tavily
+SNIPPET_CHARS = 500
 
 # Separate consoles: stdout for data, stderr for diagnostics
 out = Console()
@@ -86,22 +137,390 @@ def get_api_key() -> str:
         ) from exc
 
 
-def search_grokipedia(
+class ResponseCache:
+    """On-disk TTL cache for Tavily responses with size-bounded LRU eviction.
+
+    Entries live in a small SQLite database keyed by a hash of the normalized
+    request. Reads bump ``accessed_at``; once stored bodies exceed *max_bytes*
+    the least recently used entries are evicted. With ``refresh=True`` reads
+    always miss but fresh responses are still written.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = CACHE_MAX_BYTES,
+        refresh: bool = False,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, body TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+        self._db.commit()
+
+    def get(self, key: str, ttl: float) -> Any | None:
+        """Return the cached value for *key*, or None if missing or older than *ttl*."""
+        if self.refresh:
+            return None
+
+        row = self._db.execute(
+            "SELECT body, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        body, created_at = row
+        now = time.time()
+        if now - created_at > ttl:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+
+        self._db.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self._db.commit()
+        return json.loads(body)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store *value* under *key* and evict LRU entries over the size bound."""
+        body = json.dumps(value)
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+            (key, body, len(body), now, now),
+        )
+        self._evict()
+        self._db.commit()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def search_cache_key(payload: dict[str, Any]) -> str:
+    """Cache key for a /search payload (query case and spacing normalized)."""
+    normalized = {
+        "query": " ".join(payload["query"].split()).lower(),
+        "search_depth": payload["search_depth"],
+        "max_results": payload["max_results"],
+        "include_raw_content": payload["include_raw_content"],
+        "include_domains": sorted(payload["include_domains"]),
+    }
+    digest = hashlib.sha256(json.dumps(normalized, sort_keys=True).encode())
+    return f"search:{digest.hexdigest()}"
+
+
+def extract_cache_key(url: str) -> str:
+    """Cache key for an /extract of a single *url*."""
+    return f"extract:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def extract_miss_cache_key(url: str) -> str:
+    """Cache key for a *url* that /extract returned no page for."""
+    return f"extract-miss:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def open_cache(no_cache: bool = False, refresh: bool = False) -> ResponseCache | None:
+    """Open the on-disk cache, or return None when disabled or unavailable."""
+    if no_cache:
+        return None
+    try:
+        return ResponseCache(CACHE_DIR / CACHE_FILENAME, refresh=refresh)
+    except (sqlite3.Error, OSError) as exc:
+        err.print(f"[yellow]Warning: response cache disabled ({exc})[/yellow]")
+        return None
+
+
+class LocalMirror:
+    """Offline corpus of fetched Grokipedia pages with a full-text index.
+
+    Every page body (``raw_content``) seen by a lookup is upserted into a
+    ``pages`` table keyed by URL, with an external-content FTS5 index kept
+    in sync by triggers. Queries are ranked with BM25 (title weighted over
+    body) and each hit gets a 0-1 ``score`` from query-term coverage, so a
+    caller can decide whether the mirror is good enough to skip Tavily.
+
+    Raises:
+        sqlite3.OperationalError: If SQLite was built without FTS5.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY, title TEXT NOT NULL,
+                content TEXT NOT NULL, fetched_at REAL NOT NULL);
+            CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+                title, content, content='pages', content_rowid='rowid');
+            CREATE TRIGGER IF NOT EXISTS pages_ai AFTER INSERT ON pages BEGIN
+                INSERT INTO pages_fts (rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS pages_ad AFTER DELETE ON pages BEGIN
+                INSERT INTO pages_fts (pages_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS pages_au AFTER UPDATE ON pages BEGIN
+                INSERT INTO pages_fts (pages_fts, rowid, title, content)
+                VALUES ('delete', old.rowid, old.title, old.content);
+                INSERT INTO pages_fts (rowid, title, content)
+                VALUES (new.rowid, new.title, new.content);
+            END;
+            """
+        )
+        self._db.commit()
+
+    def add(self, results: list[dict[str, Any]]) -> int:
+        """Upsert every result that carries ``raw_content``; return the count."""
+        stored = 0
+        now = time.time()
+        for result in results:
+            url = result.get("url")
+            raw_content = result.get("raw_content")
+            if not url or not raw_content:
+                continue
+            title = result.get("title") or _page_title_from_url(url)
+            self._db.execute(
+                "INSERT INTO pages VALUES (?, ?, ?, ?) ON CONFLICT (url) DO UPDATE"
+                " SET title = excluded.title, content = excluded.content,"
+                " fetched_at = excluded.fetched_at",
+                (url, title, raw_content, now),
+            )
+            stored += 1
+        self._db.commit()
+        return stored
+
+    def search(
+        self, query: str, max_results: int = 5, include_raw: bool = False
+    ) -> dict[str, Any]:
+        """Answer *query* from the mirror in the Tavily response shape.
+
+        Results carry ``score``: 1.0 for an exact title match, otherwise the
+        mean of the fraction of query terms found in the title and in the
+        body. Sorted by score, BM25 rank breaking ties.
+        """
+        start = time.monotonic()
+        terms = list(dict.fromkeys(t.lower() for t in re.findall(r"\w+", query)))
+        results: list[dict[str, Any]] = []
+        if terms:
+            match = " OR ".join(f'"{term}"' for term in terms)
+            rows = self._db.execute(
+                "SELECT p.url, p.title, p.content FROM pages_fts"
+                " JOIN pages AS p ON p.rowid = pages_fts.rowid"
+                " WHERE pages_fts MATCH ?"
+                " ORDER BY bm25(pages_fts, 10.0, 1.0) LIMIT ?",
+                (match, max_results),
+            ).fetchall()
+            for url, title, content in rows:
+                result = {
+                    "title": title,
+                    "url": url,
+                    "content": _snippet(content),
+                    "score": _coverage_score(terms, title, content),
+                }
+                if include_raw:
+                    result["raw_content"] = content
+                results.append(result)
+            results.sort(key=lambda r: r["score"], reverse=True)  # stable: BM25 ties
+
+        return {
+            "query": query,
+            "results": results,
+            "source": "local",
+            "response_time": time.monotonic() - start,
+        }
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _coverage_score(terms: list[str], title: str, content: str) -> float:
+    title_terms = set(re.findall(r"\w+", title.lower()))
+    if title_terms == set(terms):
+        return 1.0
+    body_terms = set(re.findall(r"\w+", content.lower()))
+    in_title = sum(t in title_terms for t in terms) / len(terms)
+    in_body = sum(t in body_terms for t in terms) / len(terms)
+    return round((in_title + in_body) / 2, 3)
+
+
+def open_mirror(args: argparse.Namespace) -> LocalMirror | None:
+    """Open the offline page mirror, or return None when unused or unavailable.
+
+    The mirror is read with ``--local``/``--prefer-local`` and written on
+    every Tavily lookup, except under ``--no-cache`` (no disk writes).
+    """
+    if args.no_cache and not (args.local or args.prefer_local):
+        return None
+    try:
+        return LocalMirror(CACHE_DIR / MIRROR_FILENAME)
+    except (sqlite3.Error, OSError) as exc:
+        err.print(f"[yellow]Warning: local mirror disabled ({exc})[/yellow]")
+        return None
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter shared by concurrent batch workers.
+
+    Tokens refill at *rate* per second up to *capacity*. ``block_for`` pauses
+    every worker, e.g. after an HTTP 429 with a Retry-After header.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back all requests for *seconds* from now."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    """Build Tavily request headers for *api_key*."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds, if present."""
+    try:
+        return max(0.0, float(response.headers["retry-after"]))
+    except (KeyError, ValueError):
+        return None
+
+
+async def _post_tavily(
+    http: httpx.AsyncClient,
+    url: str,
+    api_key: str,
+    payload: dict[str, Any],
+    timeout: float,
+    limiter: TokenBucket | None = None,
+) -> dict[str, Any]:
+    """POST *payload* to a Tavily endpoint and return the decoded JSON.
+
+    With a *limiter*, every attempt waits for a token and HTTP 429 responses
+    are retried up to RATE_LIMIT_RETRIES times, honoring Retry-After or
+    backing off exponentially. Without one, a 429 raises immediately.
+
+    Raises:
+        httpx.HTTPStatusError: On non-2xx response (after retries).
+        httpx.RequestError: On connection/timeout failure.
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await limiter.acquire()
+        response = await http.post(
+            url, headers=_auth_headers(api_key), json=payload, timeout=timeout
+        )
+        if (
+            response.status_code != 429
+            or limiter is None
+            or attempt >= RATE_LIMIT_RETRIES
+        ):
+            response.raise_for_status()
+            return response.json()
+
+        delay = _retry_after(response)
+        if delay is None:
+            delay = RATE_LIMIT_BACKOFF * 2**attempt
+        limiter.block_for(delay)
+        attempt += 1
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create the pooled keep-alive client shared by every request of a run.
+
+    HTTP/2 is enabled when the ``h2`` package is installed, so concurrent
+    requests to api.tavily.com multiplex over a single TLS connection.
+    """
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=POOL_LIMITS,
+        timeout=httpx.Timeout(SEARCH_TIMEOUT),
+    )
+
+
+@contextlib.asynccontextmanager
+async def _client_scope(
+    client: httpx.AsyncClient | None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield *client*, or a temporary one closed on exit when None."""
+    if client is not None:
+        yield client
+        return
+    async with create_client() as temp_client:
+        yield temp_client
+
+
+async def search_grokipedia_async(
     query: str,
     max_results: int = 5,
     include_raw: bool = False,
     api_key: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    timeout: float = SEARCH_TIMEOUT,
+    cache: ResponseCache | None = None,
+    limiter: TokenBucket | None = None,
+    depth: str = "advanced",
 ) -> dict[str, Any]:
-    """Search grokipedia.com using Tavily API with include_domains filter.
-
-    Args:
-        query: Search query string.
-        max_results: Maximum number of results (1-20).
-        include_raw: Whether to include raw page content.
-        api_key: Tavily API key. If None, retrieved from keyring via get_api_key().
+    """Async variant of :func:`search_grokipedia`.
 
-    Returns:
-        Tavily API response as a dictionary.
+    Pass a shared *client* (see :func:`create_client`) to reuse pooled
+    connections; otherwise a temporary client is opened for this call.
+    With a *cache*, each result carries ``cached: bool``. A *limiter*
+    rate-limits the request and retries HTTP 429 (see :func:`_post_tavily`).
+    *depth* is Tavily's ``search_depth`` ("basic" or "advanced").
 
     Raises:
         ApiKeyError: If api_key is None and keyring lookup fails.
@@ -113,7 +532,7 @@ def search_grokipedia(
 
     payload = {
         "query": query,
-        "search_depth": "advanced",
+        "search_depth": depth,
         "max_results": max_results,
         "include_answer": True,
         "include_raw_content": include_raw,
@@ -121,17 +540,49 @@ def search_grokipedia(
         "topic": "general",
     }
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(
-            TAVILY_API_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()
+    cache_key = search_cache_key(payload)
+    data = cache.get(cache_key, SEARCH_CACHE_TTL) if cache is not None else None
+    from_cache = data is not None
+
+    if data is None:
+        async with _client_scope(client) as http:
+            data = await _post_tavily(
+                http, TAVILY_API_URL, api_key, payload, timeout, limiter
+            )
+        if cache is not None:
+            cache.put(cache_key, data)
+
+    if cache is not None:
+        for result in data.get("results") or []:
+            result["cached"] = from_cache
+    return data
+
+
+def search_grokipedia(
+    query: str,
+    max_results: int = 5,
+    include_raw: bool = False,
+    api_key: str | None = None,
+) -> dict[str, Any]:
+    """Search grokipedia.com using Tavily API with include_domains filter.
+
+    Args:
+        query: Search query string.
+        max_results: Maximum number of results (1-20).
+        include_raw: Whether to include raw page content.
+        api_key: Tavily API key. If None, retrieved from keyring via get_api_key().
+
+    Returns:
+        Tavily API response as a dictionary.
+
+    Raises:
+        ApiKeyError: If api_key is None and keyring lookup fails.
+        httpx.HTTPStatusError: On non-2xx response.
+        httpx.RequestError: On connection/timeout failure.
+    """
+    return asyncio.run(
+        search_grokipedia_async(query, max_results, include_raw, api_key)
+    )
 
 
 def normalize_page_title(query: str) -> str:
@@ -156,15 +607,161 @@ def normalize_page_title(query: str) -> str:
     return title[0].upper() + title[1:]
 
 
+def _is_acronym(word: str) -> bool:
+    """True for all-caps tokens like "AI", "NASA" or "U.S."."""
+    return len(word) >= 2 and word.isupper()
+
+
+def candidate_page_titles(query: str) -> list[str]:
+    """Generate plausible Grokipedia page titles for *query*, best guess first.
+
+    Starts with :func:`normalize_page_title` (interior casing preserved), then
+    sentence case and title case, each with and without acronym preservation.
+    For "neural Networks": Neural_Networks, Neural_networks, ...
+    """
+    words = query.split()
+    if not words:
+        return []
+
+    def _sentence(keep_acronyms: bool) -> list[str]:
+        lowered = [w if keep_acronyms and _is_acronym(w) else w.lower() for w in words]
+        return [lowered[0][:1].upper() + lowered[0][1:], *lowered[1:]]
+
+    def _title(keep_acronyms: bool) -> list[str]:
+        return [
+            w if keep_acronyms and _is_acronym(w) else w[:1].upper() + w[1:].lower()
+            for w in words
+        ]
+
+    candidates = [
+        normalize_page_title(query),
+        "_".join(_sentence(keep_acronyms=True)),
+        "_".join(_title(keep_acronyms=True)),
+        "_".join(_sentence(keep_acronyms=False)),
+        "_".join(_title(keep_acronyms=False)),
+    ]
+    return list(dict.fromkeys(candidates))
+
+
+def candidate_page_urls(query: str) -> list[str]:
+    """Candidate page URLs for *query*: every title on the primary domain
+    first, then on the alternate domains, capped at MAX_EXTRACT_CANDIDATES."""
+    titles = candidate_page_titles(query)
+    urls = [f"{base}/{title}" for base in PAGE_BASES for title in titles]
+    return urls[:MAX_EXTRACT_CANDIDATES]
+
+
+def _page_title_from_url(url: str) -> str:
+    return url.rsplit("/", 1)[-1].replace("_", " ")
+
+
+def _snippet(text: str) -> str:
+    return text[:SNIPPET_CHARS] + "..." if len(text) > SNIPPET_CHARS else text
+
+
+async def extract_exact_page_async(
+    query: str,
+    api_key: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    timeout: float = EXTRACT_TIMEOUT,
+    cache: ResponseCache | None = None,
+    limiter: TokenBucket | None = None,
+) -> dict[str, Any] | None:
+    """Async variant of :func:`extract_exact_page`. Never raises on HTTP errors.
+
+    With a *cache*, the outcome for each candidate URL is cached by URL, only
+    uncached candidates are probed, and the returned dict carries
+    ``cached: bool``. Pages are kept for ``EXTRACT_CACHE_TTL``; URLs absent
+    from the response are misses kept for ``EXTRACT_MISS_CACHE_TTL``; URLs in
+    ``failed_results`` (often timeouts or upstream errors) are not cached.
+    """
+    if api_key is None:
+        api_key = get_api_key()
+
+    urls = candidate_page_urls(query)
+    if not urls:
+        return None
+
+    # Per-URL outcome in Tavily's response shape: {"results": [...]}.
+    outcomes: dict[str, dict[str, Any]] = {}
+    cached_urls: set[str] = set()
+    if cache is not None:
+        for url in urls:
+            entry = cache.get(extract_cache_key(url), EXTRACT_CACHE_TTL)
+            if entry is None:
+                entry = cache.get(extract_miss_cache_key(url), EXTRACT_MISS_CACHE_TTL)
+            if entry is not None:
+                outcomes[url] = entry
+                cached_urls.add(url)
+
+    def _best_hit() -> str | None:
+        for url in urls:
+            if url not in outcomes:
+                return None  # a better-ranked candidate is still unknown
+            if outcomes[url].get("results"):
+                return url
+        return None
+
+    try:
+        to_probe = [url for url in urls if url not in outcomes]
+        if to_probe and _best_hit() is None:
+            async with _client_scope(client) as http:
+                data = await _post_tavily(
+                    http,
+                    TAVILY_EXTRACT_URL,
+                    api_key,
+                    {"urls": to_probe, "format": "markdown"},
+                    timeout,
+                    limiter,
+                )
+
+            results = data.get("results") or []
+            failed = {f.get("url") for f in data.get("failed_results") or []}
+            # Page paths are case-sensitive: Neural_Networks != Neural_networks.
+            by_url = {r.get("url"): r for r in results}
+            for url in to_probe:
+                page = by_url.get(url)
+                if page is None and len(to_probe) == 1 and results:
+                    page = results[0]  # single probe: any page is the answer
+                outcomes[url] = {"results": [page] if page is not None else []}
+                if cache is None:
+                    continue
+                if page is not None:
+                    cache.put(extract_cache_key(url), outcomes[url])
+                elif url not in failed:
+                    cache.put(extract_miss_cache_key(url), outcomes[url])
+
+        hit_url = next((u for u in urls if outcomes[u].get("results")), None)
+        if hit_url is None:
+            return None
+
+        raw_content = outcomes[hit_url]["results"][0].get("raw_content") or ""
+
+        exact = {
+            "title": _page_title_from_url(hit_url),
+            "url": hit_url,
+            "content": _snippet(raw_content),
+            "score": 1.0,  # exact match
+            "raw_content": raw_content,
+        }
+        if cache is not None:
+            exact["cached"] = hit_url in cached_urls
+        return exact
+
+    except (httpx.HTTPStatusError, httpx.RequestError):
+        return None
+
+
 def extract_exact_page(
     query: str,
     api_key: str | None = None,
 ) -> dict[str, Any] | None:
     """Try to extract the canonical Grokipedia page matching the query.
 
-    Constructs the URL ``grokipedia.com/page/{Title}`` and uses Tavily's
-    /extract endpoint. Returns a search-result-compatible dict if the page
-    exists, or None on any failure.
+    Probes several title forms (see :func:`candidate_page_urls`) of
+    ``grokipedia.com/page/{Title}`` in a single Tavily /extract call and
+    keeps the best-ranked hit. Returns a search-result-compatible dict if a
+    page exists, or None on any failure.
 
     Args:
         query: Search query to derive the page title from.
@@ -173,46 +770,281 @@ def extract_exact_page(
     Returns:
         A dict with keys (title, url, content, score, raw_content) or None.
     """
+    return asyncio.run(extract_exact_page_async(query, api_key))
+
+
+def merge_exact_result(
+    data: dict[str, Any], exact: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Prepend the exact-page hit to search results unless its URL is already there.
+
+    URL comparison is case-insensitive. *data* is modified in place and returned.
+    """
+    if exact is None:
+        return data
+
+    existing_urls = {(r.get("url") or "").lower() for r in data.get("results", [])}
+    if exact["url"].lower() not in existing_urls:
+        data.setdefault("results", []).insert(0, exact)
+    return data
+
+
+async def hybrid_search(
+    query: str,
+    max_results: int = 5,
+    include_raw: bool = False,
+    api_key: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    search_timeout: float = SEARCH_TIMEOUT,
+    extract_timeout: float = EXTRACT_TIMEOUT,
+    cache: ResponseCache | None = None,
+    limiter: TokenBucket | None = None,
+    depth: str = "advanced",
+) -> dict[str, Any]:
+    """Run the Tavily search and the canonical-page extract concurrently.
+
+    The canonical URL only depends on the query, so both requests are issued
+    at once and latency is that of the slower call rather than their sum.
+    Both share *client* when given, so they reuse one pooled connection,
+    and consult *cache* before going to the network.
+
+    With ``depth="auto"`` the search starts at the "basic" tier and is
+    repeated at "advanced" only if there is no exact page and the top basic
+    score is below :data:`BASIC_SCORE_THRESHOLD`. The response's ``tier``
+    says which depth answered.
+
+    Raises:
+        ApiKeyError: If api_key is None and keyring lookup fails.
+        httpx.HTTPStatusError: On non-2xx response from /search.
+        httpx.RequestError: On connection/timeout failure of /search.
+    """
     if api_key is None:
         api_key = get_api_key()
 
-    title = normalize_page_title(query)
-    if not title:
-        return None
+    async with _client_scope(client) as http:
+        extract_task = asyncio.create_task(
+            extract_exact_page_async(
+                query,
+                api_key=api_key,
+                client=http,
+                timeout=extract_timeout,
+                cache=cache,
+                limiter=limiter,
+            )
+        )
+
+        async def _search(tier: str) -> dict[str, Any]:
+            return await search_grokipedia_async(
+                query,
+                max_results=max_results,
+                include_raw=include_raw,
+                api_key=api_key,
+                client=http,
+                timeout=search_timeout,
+                cache=cache,
+                limiter=limiter,
+                depth=tier,
+            )
+
+        tier = "basic" if depth == "auto" else depth
+        try:
+            data = await _search(tier)
+        except BaseException:
+            extract_task.cancel()
+            await asyncio.gather(extract_task, return_exceptions=True)
+            raise
+
+        exact = await extract_task
+        weak = _top_score(data) < BASIC_SCORE_THRESHOLD
+        if depth == "auto" and exact is None and weak:
+            tier = "advanced"
+            data = await _search(tier)
+
+        data["tier"] = tier
+        return merge_exact_result(data, exact)
+
+
+def _top_score(data: dict[str, Any]) -> float:
+    return max((r.get("score") or 0.0 for r in data.get("results") or []), default=0.0)
+
+
+async def lookup(
+    args: argparse.Namespace,
+    query: str,
+    api_key: str | None,
+    client: httpx.AsyncClient,
+    cache: ResponseCache | None = None,
+    mirror: LocalMirror | None = None,
+    limiter: TokenBucket | None = None,
+) -> dict[str, Any]:
+    """Answer *query* from the local mirror or Tavily, per ``--local`` flags.
 
-    canonical_url = f"{GROKIPEDIA_BASE}/{title}"
+    ``--local`` never touches the network. ``--prefer-local`` returns the
+    mirror's answer when its top score reaches ``--local-threshold`` and
+    falls back to :func:`hybrid_search` otherwise. Pages fetched from
+    Tavily are stored in *mirror* for next time (not under ``--no-cache``).
+    """
+    if args.local or args.prefer_local:
+        local = (
+            mirror.search(query, args.max_results, include_raw=args.raw)
+            if mirror is not None
+            else {"query": query, "results": [], "source": "local"}
+        )
+        results = local["results"]
+        if args.local or (results and results[0]["score"] >= args.local_threshold):
+            return local
+
+    data = await hybrid_search(
+        query=query,
+        max_results=args.max_results,
+        include_raw=args.raw,
+        api_key=api_key,
+        client=client,
+        search_timeout=args.search_timeout,
+        extract_timeout=args.extract_timeout,
+        cache=cache,
+        limiter=limiter,
+        depth=args.depth,
+    )
+    if mirror is not None and not args.no_cache:
+        mirror.add(data.get("results") or [])
+    return data
 
+
+async def run_query(
+    args: argparse.Namespace, query: str, api_key: str | None
+) -> dict[str, Any]:
+    """Run one lookup on a client shared for the whole invocation."""
+    cache = open_cache(no_cache=args.no_cache, refresh=args.refresh)
+    mirror = open_mirror(args)
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.post(
-                TAVILY_EXTRACT_URL,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={"urls": [canonical_url], "format": "markdown"},
-            )
-            response.raise_for_status()
-            data = response.json()
+        async with create_client() as client:
+            return await lookup(args, query, api_key, client, cache, mirror)
+    finally:
+        if cache is not None:
+            cache.close()
+        if mirror is not None:
+            mirror.close()
 
-        results = data.get("results", [])
-        if not results:
-            return None
 
-        raw_content = results[0].get("raw_content") or ""
-        # Build a snippet from the first 500 chars of the page
-        snippet = raw_content[:500] + "..." if len(raw_content) > 500 else raw_content
+def read_queries(source: str) -> list[str]:
+    """Read batch queries, one per line, from a file path or ``-`` for stdin.
 
-        return {
-            "title": title.replace("_", " "),
-            "url": canonical_url,
-            "content": snippet,
-            "score": 1.0,  # exact match
-            "raw_content": raw_content,
-        }
+    Blank lines and ``#`` comments are skipped; duplicates are dropped
+    (first occurrence wins) so a topic is never paid for twice.
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).expanduser().read_text(encoding="utf-8").splitlines()
+
+    queries = [line.strip() for line in lines]
+    queries = [q for q in queries if q and not q.startswith("#")]
+    return list(dict.fromkeys(queries))
 
-    except (httpx.HTTPStatusError, httpx.RequestError):
-        return None
+
+async def run_batch(
+    args: argparse.Namespace, queries: list[str], api_key: str | None
+) -> int:
+    """Run *queries* concurrently and print NDJSON as each query finishes.
+
+    Each finished query is one line, or with ``--ndjson`` one line per
+    result (see :func:`ndjson_records`). All workers share one client, one
+    cache, one mirror and one token bucket. Failed queries are reported
+    inline as ``{"query": ..., "error": ...}``.
+
+    Returns:
+        Exit code: 0 if every query succeeded, 1 otherwise.
+    """
+    cache = open_cache(no_cache=args.no_cache, refresh=args.refresh)
+    mirror = open_mirror(args)
+    limiter = TokenBucket(args.rate)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failures = 0
+
+    async def _one(client: httpx.AsyncClient, query: str) -> dict[str, Any]:
+        async with semaphore:
+            try:
+                data = await lookup(
+                    args, query, api_key, client, cache, mirror, limiter
+                )
+            except httpx.HTTPStatusError as e:
+                return {"query": query, "error": f"HTTP {e.response.status_code}"}
+            except httpx.RequestError as e:
+                return {"query": query, "error": str(e) or type(e).__name__}
+            return {**data, "query": query}
+
+    try:
+        async with create_client() as client:
+            tasks = [_one(client, query) for query in queries]
+            for finished in asyncio.as_completed(tasks):
+                record = await finished
+                if "error" in record:
+                    failures += 1
+                    write_ndjson(iter([record]))
+                elif args.ndjson:
+                    write_ndjson(ndjson_records(record, args.max_raw_chars))
+                else:
+                    write_ndjson(iter([trim_response(record, args.max_raw_chars)]))
+    finally:
+        if cache is not None:
+            cache.close()
+        if mirror is not None:
+            mirror.close()
+
+    if failures:
+        err.print(f"[yellow]{failures}/{len(queries)} queries failed[/yellow]")
+    return 1 if failures else 0
+
+
+def trim_raw_content(
+    result: dict[str, Any], max_chars: int | None
+) -> dict[str, Any]:
+    """Return *result* with ``raw_content`` cut to *max_chars* (0 drops it)."""
+    if max_chars is None or "raw_content" not in result:
+        return result
+    trimmed = dict(result)
+    if max_chars == 0:
+        del trimmed["raw_content"]
+    else:
+        trimmed["raw_content"] = (trimmed["raw_content"] or "")[:max_chars]
+    return trimmed
+
+
+def trim_response(data: dict[str, Any], max_chars: int | None) -> dict[str, Any]:
+    """Apply :func:`trim_raw_content` to every result of a response."""
+    if max_chars is None:
+        return data
+    results = [trim_raw_content(r, max_chars) for r in data.get("results") or []]
+    return {**data, "results": results}
+
+
+def ndjson_records(
+    data: dict[str, Any], max_raw_chars: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield one flat record per result: query, rank, tier/source, result fields.
+
+    A response without results still yields one ``rank: 0, results: 0``
+    record, so a consumer can tell a finished query with no hits from one
+    that is missing.
+    """
+    context = {
+        key: data[key]
+        for key in ("query", "tier", "source", "answer")
+        if data.get(key)
+    }
+    results = data.get("results") or []
+    if not results:
+        yield {**context, "rank": 0, "results": 0}
+    for rank, result in enumerate(results, 1):
+        yield {**context, "rank": rank, **trim_raw_content(result, max_raw_chars)}
+
+
+def write_ndjson(records: Iterator[dict[str, Any]]) -> None:
+    """Write compact JSON lines and flush, so consumers see them right away."""
+    for record in records:
+        sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
 
 
 def display_results(data: dict[str, Any], raw: bool = False) -> None:
@@ -225,13 +1057,14 @@ def display_results(data: dict[str, Any], raw: bool = False) -> None:
     query = data.get("query", "Unknown")
     answer = data.get("answer")
     results = data.get("results", [])
+    source = "local mirror" if data.get("source") == "local" else "Tavily"
 
     # Header
     out.print(
         Panel(
             f"[bold cyan]Query:[/bold cyan] {query}\n"
             f"[dim]Domains: {', '.join(SEARCH_DOMAINS)}[/dim]",
-            title="[bold green]Grokipedia Search via Tavily[/bold green]",
+            title=f"[bold green]Grokipedia Search via {source}[/bold green]",
             border_style="green",
         )
     )
@@ -288,6 +1121,8 @@ def display_results(data: dict[str, Any], raw: bool = False) -> None:
         out.print(f"[dim]Response time: {response_time:.2f}s[/dim]")
     else:
         out.print("[dim]Response time: N/A[/dim]")
+    if data.get("tier"):
+        out.print(f"[dim]Search depth: {data['tier']}[/dim]")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -301,14 +1136,43 @@ Examples:
   uv run grokipedia.py "Italian cuisine" -n 10
   uv run grokipedia.py "AI history" --raw
   uv run grokipedia.py "neural networks" --json | jq '.results[].url'
+  uv run grokipedia.py "AI history" --raw --ndjson --max-raw-chars 0 | jq .url
+  uv run grokipedia.py "string theory" --depth advanced
+  uv run grokipedia.py "quantum computing" --prefer-local
+  uv run grokipedia.py "quantum computing" --local    # offline
+  uv run grokipedia.py --queries-file topics.txt --concurrency 8 > out.ndjson
+  cat topics.txt | uv run grokipedia.py --queries-file -
 """,
     )
 
     parser.add_argument(
         "query",
+        nargs="?",
         help="Search query (e.g., 'quantum computing')",
     )
 
+    parser.add_argument(
+        "--queries-file",
+        metavar="PATH",
+        help="Batch mode: one query per line ('-' for stdin), NDJSON output",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help=f"Batch mode: queries in flight at once (default: {DEFAULT_CONCURRENCY})",
+    )
+
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        metavar="PER_SEC",
+        help=f"Batch mode: max Tavily requests per second (default: {DEFAULT_RATE:g})",
+    )
+
     parser.add_argument(
         "-n",
         "--max-results",
@@ -317,18 +1181,86 @@ Examples:
         help="Maximum number of results (default: 5, max: 20)",
     )
 
+    parser.add_argument(
+        "--depth",
+        choices=SEARCH_DEPTHS,
+        default="auto",
+        help="Search tier; 'auto' escalates basic to advanced if needed (default: auto)",
+    )
+
     parser.add_argument(
         "--raw",
         action="store_true",
         help="Include raw content from pages",
     )
 
-    parser.add_argument(
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output raw JSON instead of formatted results",
     )
+    output_group.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Output one compact JSON object per result, streamed",
+    )
+
+    parser.add_argument(
+        "--max-raw-chars",
+        type=int,
+        metavar="N",
+        help="In JSON output, truncate raw_content to N chars (0 omits it)",
+    )
+
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response cache (no reads, no writes); don't mirror pages",
+    )
+    cache_group.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached responses but store the fresh ones",
+    )
+
+    local_group = parser.add_mutually_exclusive_group()
+    local_group.add_argument(
+        "--local",
+        action="store_true",
+        help="Answer from the offline page mirror only (no network, no API key)",
+    )
+    local_group.add_argument(
+        "--prefer-local",
+        action="store_true",
+        help="Answer from the mirror; fall back to Tavily below --local-threshold",
+    )
+
+    parser.add_argument(
+        "--local-threshold",
+        type=float,
+        default=LOCAL_THRESHOLD,
+        metavar="SCORE",
+        help=f"Min mirror score for --prefer-local (default: {LOCAL_THRESHOLD:g})",
+    )
+
+    parser.add_argument(
+        "--search-timeout",
+        type=float,
+        default=SEARCH_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Timeout for /search requests (default: {SEARCH_TIMEOUT:g})",
+    )
+
+    parser.add_argument(
+        "--extract-timeout",
+        type=float,
+        default=EXTRACT_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Timeout for /extract requests (default: {EXTRACT_TIMEOUT:g})",
+    )
 
     parser.add_argument(
         "--version",
@@ -336,7 +1268,12 @@ Examples:
         version=f"%(prog)s {__version__}",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.query is None and args.queries_file is None:
+        parser.error("a query or --queries-file is required")
+    if args.query is not None and args.queries_file is not None:
+        parser.error("pass either a query or --queries-file, not both")
+    return args
 
 
 def main() -> int:
@@ -348,11 +1285,23 @@ def main() -> int:
     args = parse_arguments()
 
     # Validate inputs before doing any work
-    query = args.query.strip()
-    if not query:
-        err.print("[red]Error: query must not be empty[/red]")
-        err.print('  uv run grokipedia.py "your search terms"')
-        return 2
+    queries: list[str] = []
+    query = ""
+    if args.queries_file is not None:
+        try:
+            queries = read_queries(args.queries_file)
+        except OSError as e:
+            err.print(f"[red]Error: cannot read --queries-file: {e}[/red]")
+            return 2
+        if not queries:
+            err.print("[red]Error: --queries-file contains no queries[/red]")
+            return 2
+    else:
+        query = args.query.strip()
+        if not query:
+            err.print("[red]Error: query must not be empty[/red]")
+            err.print('  uv run grokipedia.py "your search terms"')
+            return 2
 
     if args.max_results < 1 or args.max_results > 20:
         err.print(
@@ -361,29 +1310,43 @@ def main() -> int:
         err.print('  uv run grokipedia.py "your query" -n 5')
         return 2
 
-    try:
-        api_key = get_api_key()
+    if args.search_timeout <= 0 or args.extract_timeout <= 0:
+        err.print("[red]Error: timeouts must be greater than 0[/red]")
+        err.print('  uv run grokipedia.py "your query" --search-timeout 30')
+        return 2
 
-        data = search_grokipedia(
-            query=query,
-            max_results=args.max_results,
-            include_raw=args.raw,
-            api_key=api_key,
-        )
+    if not 0 <= args.local_threshold <= 1:
+        err.print("[red]Error: --local-threshold must be between 0 and 1[/red]")
+        err.print('  uv run grokipedia.py "query" --prefer-local --local-threshold 0.8')
+        return 2
 
-        # Hybrid lookup: if the canonical page isn't in search results,
-        # try extracting it directly and prepend it.
-        title = normalize_page_title(query)
-        canonical_url = f"{GROKIPEDIA_BASE}/{title}"
-        existing_urls = {r.get("url", "").lower() for r in data.get("results", [])}
+    if args.max_raw_chars is not None and args.max_raw_chars < 0:
+        err.print("[red]Error: --max-raw-chars must be >= 0[/red]")
+        err.print('  uv run grokipedia.py "query" --raw --ndjson --max-raw-chars 2000')
+        return 2
 
-        if canonical_url.lower() not in existing_urls:
-            exact = extract_exact_page(query, api_key=api_key)
-            if exact is not None:
-                data.setdefault("results", []).insert(0, exact)
+    if args.concurrency < 1 or args.rate <= 0:
+        err.print("[red]Error: --concurrency must be >= 1 and --rate > 0[/red]")
+        err.print("  uv run grokipedia.py --queries-file topics.txt --concurrency 4")
+        return 2
 
-        if args.json_output:
-            print(json.dumps(data, indent=2))
+    try:
+        # Resolved once, even for a batch of hundreds of queries;
+        # --local never reaches Tavily and works without a key.
+        api_key = None if args.local else get_api_key()
+
+        if queries:
+            return asyncio.run(run_batch(args, queries, api_key))
+
+        # Hybrid lookup: search and canonical-page extract run concurrently;
+        # the exact page is prepended unless search already returned it.
+        # Fetched pages are mirrored locally for --local / --prefer-local.
+        data = asyncio.run(run_query(args, query, api_key))
+
+        if args.ndjson:
+            write_ndjson(ndjson_records(data, args.max_raw_chars))
+        elif args.json_output:
+            print(json.dumps(trim_response(data, args.max_raw_chars), indent=2))
         else:
             display_results(data, raw=args.raw)
 
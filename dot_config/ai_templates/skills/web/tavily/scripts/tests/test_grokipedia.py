@@ -16,6 +16,7 @@ Run:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
 import sys
@@ -38,6 +39,17 @@ sys.path.insert(0, str(SCRIPT_DIR))
 import grokipedia  # noqa: E402
 
 
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the on-disk response cache at a per-test directory."""
+    cache_dir = tmp_path / "grokipedia-cache"
+    monkeypatch.setattr(grokipedia, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -1010,7 +1022,7 @@ class TestExtractExactPage:
 
     @respx.mock
     def test_unit_constructs_correct_canonical_url(self) -> None:
-        """URL sent to Tavily must follow GROKIPEDIA_BASE/{Title} pattern."""
+        """Canonical GROKIPEDIA_BASE/{Title} URL must be the first probed."""
         captured_urls: list[str] = []
 
         def capture_request(request: httpx.Request) -> httpx.Response:
@@ -1020,7 +1032,8 @@ class TestExtractExactPage:
 
         respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(side_effect=capture_request)
         grokipedia.extract_exact_page("quantum computing", api_key="fake-key")
-        assert captured_urls == ["https://grokipedia.com/page/Quantum_computing"]
+        assert captured_urls[0] == "https://grokipedia.com/page/Quantum_computing"
+        assert captured_urls == grokipedia.candidate_page_urls("quantum computing")
 
     @respx.mock
     def test_unit_api_key_none_calls_get_api_key(self) -> None:
@@ -1131,8 +1144,11 @@ class TestHybridSearch:
         respx.post(grokipedia.TAVILY_API_URL).mock(
             return_value=httpx.Response(200, json=search_response)
         )
-        # Extract should NOT be called if search already has it,
-        # but even if it is, no duplicate should appear.
+        # Extract runs concurrently with search, so it returns the same page;
+        # the merge must not add it twice.
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
 
         import io
 
@@ -1208,6 +1224,9 @@ class TestHybridSearch:
         respx.post(grokipedia.TAVILY_API_URL).mock(
             return_value=httpx.Response(200, json=search_response)
         )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
 
         import io
 
@@ -1221,3 +1240,867 @@ class TestHybridSearch:
         data = json.loads(captured.getvalue())
         # Must not inject a duplicate even though casing differs
         assert len(data["results"]) == 1
+
+
+# ===================================================================
+# Unit Tests -- concurrent hybrid_search
+# ===================================================================
+
+
+class TestHybridSearchConcurrency:
+    """hybrid_search must issue /search and /extract concurrently."""
+
+    @respx.mock
+    def test_unit_requests_overlap(self) -> None:
+        """Both requests must be in flight at the same time."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _slow(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if request.url == grokipedia.TAVILY_EXTRACT_URL:
+                return httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+            return httpx.Response(200, json=FAKE_RESPONSE)
+
+        respx.post(grokipedia.TAVILY_API_URL).mock(side_effect=_slow)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(side_effect=_slow)
+
+        data = asyncio.run(grokipedia.hybrid_search("pattern", api_key="k"))
+
+        assert max_in_flight == 2
+        assert data["results"][0]["url"] == "https://grokipedia.com/page/Pattern"
+
+    @respx.mock
+    def test_unit_search_error_propagates(self) -> None:
+        """A /search failure must surface even while extract is pending."""
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(500, text="boom")
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(grokipedia.hybrid_search("pattern", api_key="k"))
+
+    def test_unit_merge_skips_existing_url(self) -> None:
+        data = {"results": [{"url": "https://grokipedia.com/page/pattern"}]}
+        exact = {"url": "https://grokipedia.com/page/Pattern"}
+        assert grokipedia.merge_exact_result(data, exact)["results"] == [
+            {"url": "https://grokipedia.com/page/pattern"}
+        ]
+
+
+# ===================================================================
+# Unit Tests -- shared client and per-endpoint timeouts
+# ===================================================================
+
+
+class TestSharedClient:
+    """One pooled client must serve every request of an invocation."""
+
+    def test_unit_create_client_is_pooled(self) -> None:
+        async def _check() -> None:
+            async with grokipedia.create_client() as client:
+                assert isinstance(client, httpx.AsyncClient)
+                assert not client.is_closed
+
+        asyncio.run(_check())
+
+    @respx.mock
+    def test_unit_shared_client_not_closed(self) -> None:
+        """hybrid_search must leave a caller-provided client open."""
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+
+        async def _run() -> bool:
+            async with grokipedia.create_client() as client:
+                await grokipedia.hybrid_search("a", api_key="k", client=client)
+                await grokipedia.hybrid_search("b", api_key="k", client=client)
+                return client.is_closed
+
+        assert asyncio.run(_run()) is False
+
+    @respx.mock
+    def test_unit_per_endpoint_timeouts(self) -> None:
+        """Each endpoint must get its own read timeout."""
+        timeouts: dict[str, float] = {}
+
+        def _capture(request: httpx.Request) -> httpx.Response:
+            timeouts[request.url.path] = request.extensions["timeout"]["read"]
+            if request.url.path == "/extract":
+                return httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+            return httpx.Response(200, json=FAKE_RESPONSE)
+
+        respx.post(grokipedia.TAVILY_API_URL).mock(side_effect=_capture)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(side_effect=_capture)
+
+        asyncio.run(
+            grokipedia.hybrid_search(
+                "pattern", api_key="k", search_timeout=7.0, extract_timeout=3.0
+            )
+        )
+        assert timeouts == {"/search": 7.0, "/extract": 3.0}
+
+    def test_unit_timeout_defaults(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "test"]):
+            args = grokipedia.parse_arguments()
+        assert args.search_timeout == grokipedia.SEARCH_TIMEOUT
+        assert args.extract_timeout == grokipedia.EXTRACT_TIMEOUT
+
+    def test_unit_non_positive_timeout_returns_2(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "test", "--search-timeout", "0"]):
+            assert grokipedia.main() == 2
+
+
+# ===================================================================
+# Unit Tests -- on-disk response cache
+# ===================================================================
+
+
+class TestResponseCache:
+    """ResponseCache must honor TTLs, LRU bounds and refresh mode."""
+
+    def test_unit_roundtrip(self, tmp_path: Path) -> None:
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3")
+        cache.put("k", {"a": 1})
+        assert cache.get("k", ttl=60) == {"a": 1}
+
+    def test_unit_expired_entry_misses(self, tmp_path: Path) -> None:
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3")
+        cache.put("k", {"a": 1})
+        with patch("grokipedia.time.time", return_value=grokipedia.time.time() + 120):
+            assert cache.get("k", ttl=60) is None
+
+    def test_unit_lru_eviction(self, tmp_path: Path) -> None:
+        entry = {"body": "x" * 100}
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3", max_bytes=250)
+        cache.put("old", entry)
+        cache.put("recent", entry)
+        cache.get("old", ttl=60)  # bump "old" so "recent" is now LRU
+        cache.put("new", entry)
+        assert cache.get("recent", ttl=60) is None
+        assert cache.get("old", ttl=60) == entry
+        assert cache.get("new", ttl=60) == entry
+
+    def test_unit_refresh_skips_reads(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.sqlite3"
+        grokipedia.ResponseCache(path).put("k", {"a": 1})
+        assert grokipedia.ResponseCache(path, refresh=True).get("k", ttl=60) is None
+
+    def test_unit_search_key_normalizes_query(self) -> None:
+        base = {
+            "query": "Quantum  computing",
+            "search_depth": "advanced",
+            "max_results": 5,
+            "include_raw_content": False,
+            "include_domains": ["grokxpedia.us", "grokipedia.com"],
+        }
+        other = {
+            **base,
+            "query": "quantum computing",
+            "include_domains": grokipedia.SEARCH_DOMAINS,
+        }
+        assert grokipedia.search_cache_key(base) == grokipedia.search_cache_key(other)
+        assert grokipedia.search_cache_key(base) != grokipedia.search_cache_key(
+            {**base, "max_results": 6}
+        )
+
+
+class TestCachedLookups:
+    """Repeated lookups must be served from the cache and say so in --json."""
+
+    def _run_json(self, *argv: str) -> dict[str, Any]:
+        import io
+
+        captured = io.StringIO()
+        with patch("grokipedia.get_api_key", return_value="k"):
+            with patch("sys.argv", ["grokipedia.py", *argv, "--json"]):
+                with patch("sys.stdout", captured):
+                    assert grokipedia.main() == 0
+        return json.loads(captured.getvalue())
+
+    @respx.mock
+    def test_second_run_hits_cache(self) -> None:
+        search = respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        extract = respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
+
+        first = self._run_json("pattern")
+        second = self._run_json("pattern")
+
+        assert search.call_count == 1
+        assert extract.call_count == 1
+        assert all(r["cached"] is False for r in first["results"])
+        assert all(r["cached"] is True for r in second["results"])
+
+    @respx.mock
+    def test_refresh_refetches(self) -> None:
+        search = respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+
+        self._run_json("pattern")
+        data = self._run_json("pattern", "--refresh")
+
+        assert search.call_count == 2
+        assert data["results"][0]["cached"] is False
+
+    @respx.mock
+    def test_no_cache_skips_cache(self, isolated_cache: Path) -> None:
+        search = respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+
+        self._run_json("pattern", "--no-cache")
+        data = self._run_json("pattern", "--no-cache")
+
+        assert search.call_count == 2
+        assert "cached" not in data["results"][0]
+        assert not isolated_cache.exists()
+
+    def test_no_cache_and_refresh_are_exclusive(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "t", "--no-cache", "--refresh"]):
+            with pytest.raises(SystemExit) as exc_info:
+                grokipedia.parse_arguments()
+        assert exc_info.value.code == 2
+
+
+# ===================================================================
+# Unit Tests -- batch mode
+# ===================================================================
+
+
+class TestReadQueries:
+    def test_unit_skips_blanks_comments_and_duplicates(self, tmp_path: Path) -> None:
+        path = tmp_path / "topics.txt"
+        path.write_text("pattern\n\n# comment\n  quantum computing  \npattern\n")
+        assert grokipedia.read_queries(str(path)) == ["pattern", "quantum computing"]
+
+    def test_unit_reads_stdin(self) -> None:
+        import io
+
+        with patch("sys.stdin", io.StringIO("a\nb\n")):
+            assert grokipedia.read_queries("-") == ["a", "b"]
+
+
+class TestTokenBucket:
+    def test_unit_limits_rate(self) -> None:
+        """Beyond the burst capacity, tokens arrive at *rate* per second."""
+
+        async def _drain() -> float:
+            bucket = grokipedia.TokenBucket(rate=20.0, capacity=1)
+            start = grokipedia.time.monotonic()
+            for _ in range(4):
+                await bucket.acquire()
+            return grokipedia.time.monotonic() - start
+
+        assert asyncio.run(_drain()) >= 0.14  # 3 refills at 50ms each
+
+    def test_unit_block_for_delays_acquire(self) -> None:
+        async def _blocked() -> float:
+            bucket = grokipedia.TokenBucket(rate=100.0)
+            bucket.block_for(0.1)
+            start = grokipedia.time.monotonic()
+            await bucket.acquire()
+            return grokipedia.time.monotonic() - start
+
+        assert asyncio.run(_blocked()) >= 0.09
+
+
+class TestRateLimitRetry:
+    @respx.mock
+    def test_unit_429_retried_with_limiter(self) -> None:
+        route = respx.post(grokipedia.TAVILY_API_URL).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json=FAKE_RESPONSE),
+            ]
+        )
+        limiter = grokipedia.TokenBucket(rate=100.0)
+        data = asyncio.run(
+            grokipedia.search_grokipedia_async("t", api_key="k", limiter=limiter)
+        )
+        assert route.call_count == 2
+        assert data["results"][0]["url"] == FAKE_RESPONSE["results"][0]["url"]
+
+    @respx.mock
+    def test_unit_429_not_retried_without_limiter(self) -> None:
+        route = respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(429)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            grokipedia.search_grokipedia("t", api_key="k")
+        assert route.call_count == 1
+
+
+class TestBatchMode:
+    """--queries-file must stream one NDJSON line per query."""
+
+    def _run_batch(self, tmp_path: Path, text: str) -> tuple[int, list[dict[str, Any]]]:
+        import io
+
+        path = tmp_path / "topics.txt"
+        path.write_text(text)
+        captured = io.StringIO()
+        with patch("grokipedia.get_api_key", return_value="k") as mock_key:
+            with patch("sys.argv", ["grokipedia.py", "--queries-file", str(path)]):
+                with patch("sys.stdout", captured):
+                    code = grokipedia.main()
+            mock_key.assert_called_once()
+        lines = captured.getvalue().splitlines()
+        return code, [json.loads(line) for line in lines]
+
+    @respx.mock
+    def test_streams_one_line_per_query(self, tmp_path: Path) -> None:
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        code, records = self._run_batch(tmp_path, "alpha\nbeta\ngamma\n")
+        assert code == 0
+        assert sorted(r["query"] for r in records) == ["alpha", "beta", "gamma"]
+        assert all("results" in r for r in records)
+
+    @respx.mock
+    def test_failed_query_reported_inline(self, tmp_path: Path) -> None:
+        def _search(request: httpx.Request) -> httpx.Response:
+            if json.loads(request.content)["query"] == "bad":
+                return httpx.Response(500, text="boom")
+            return httpx.Response(200, json=FAKE_RESPONSE)
+
+        respx.post(grokipedia.TAVILY_API_URL).mock(side_effect=_search)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        code, records = self._run_batch(tmp_path, "good\nbad\n")
+        assert code == 1
+        by_query = {r["query"]: r for r in records}
+        assert by_query["bad"]["error"] == "HTTP 500"
+        assert "results" in by_query["good"]
+
+    def test_query_and_file_are_exclusive(self, tmp_path: Path) -> None:
+        with patch("sys.argv", ["grokipedia.py", "q", "--queries-file", "x"]):
+            with pytest.raises(SystemExit) as exc_info:
+                grokipedia.parse_arguments()
+        assert exc_info.value.code == 2
+
+    def test_empty_file_returns_2(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.txt"
+        path.write_text("\n# nothing\n")
+        with patch("sys.argv", ["grokipedia.py", "--queries-file", str(path)]):
+            assert grokipedia.main() == 2
+
+
+# ===================================================================
+# Unit Tests -- multi-candidate canonical page probing
+# ===================================================================
+
+
+class TestCandidatePageTitles:
+    def test_unit_mixed_case_query(self) -> None:
+        titles = grokipedia.candidate_page_titles("neural Networks")
+        assert titles[0] == "Neural_Networks"
+        assert "Neural_networks" in titles
+
+    def test_unit_acronym_preserved(self) -> None:
+        titles = grokipedia.candidate_page_titles("AI history")
+        assert titles[0] == "AI_history"
+        assert "AI_History" in titles
+        assert "Ai_history" in titles
+
+    def test_unit_no_duplicates(self) -> None:
+        assert grokipedia.candidate_page_titles("pattern") == ["Pattern"]
+
+    def test_unit_empty(self) -> None:
+        assert grokipedia.candidate_page_titles("  ") == []
+
+    def test_unit_urls_include_alternate_domain(self) -> None:
+        urls = grokipedia.candidate_page_urls("pattern")
+        assert urls == [
+            "https://grokipedia.com/page/Pattern",
+            "https://grokxpedia.us/page/Pattern",
+        ]
+
+    def test_unit_urls_capped(self) -> None:
+        urls = grokipedia.candidate_page_urls("the quick brown FOX jumps")
+        assert len(urls) <= grokipedia.MAX_EXTRACT_CANDIDATES
+
+
+class TestMultiCandidateExtract:
+    @respx.mock
+    def test_unit_single_round_trip_finds_alternate_casing(self) -> None:
+        """Only the sentence-case page exists; one call must still find it."""
+        hit = {
+            "results": [
+                {
+                    "url": "https://grokipedia.com/page/Neural_networks",
+                    "raw_content": "Neural networks are...",
+                }
+            ],
+            "failed_results": [],
+        }
+        route = respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=hit)
+        )
+        result = grokipedia.extract_exact_page("neural Networks", api_key="k")
+        assert route.call_count == 1
+        assert result is not None
+        assert result["url"] == "https://grokipedia.com/page/Neural_networks"
+        assert result["title"] == "Neural networks"
+
+    @respx.mock
+    def test_unit_prefers_best_ranked_candidate(self) -> None:
+        both = {
+            "results": [
+                {"url": "https://grokxpedia.us/page/AI_history", "raw_content": "b"},
+                {"url": "https://grokipedia.com/page/AI_History", "raw_content": "a"},
+            ]
+        }
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=both)
+        )
+        result = grokipedia.extract_exact_page("AI history", api_key="k")
+        assert result is not None
+        assert result["url"] == "https://grokipedia.com/page/AI_History"
+
+    @respx.mock
+    def test_unit_cached_misses_are_not_reprobed(self, tmp_path: Path) -> None:
+        captured: list[list[str]] = []
+
+        def _extract(request: httpx.Request) -> httpx.Response:
+            captured.append(json.loads(request.content)["urls"])
+            return httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(side_effect=_extract)
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3")
+
+        for _ in range(2):
+            result = asyncio.run(
+                grokipedia.extract_exact_page_async("AI history", api_key="k", cache=cache)
+            )
+            assert result is None
+
+        assert len(captured) == 1
+
+    @respx.mock
+    def test_unit_cached_misses_expire_sooner_than_pages(self, tmp_path: Path) -> None:
+        route = respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3")
+        asyncio.run(
+            grokipedia.extract_exact_page_async("AI history", api_key="k", cache=cache)
+        )
+        later = grokipedia.time.time() + grokipedia.EXTRACT_MISS_CACHE_TTL + 60
+        with patch("grokipedia.time.time", return_value=later):
+            asyncio.run(
+                grokipedia.extract_exact_page_async(
+                    "AI history", api_key="k", cache=cache
+                )
+            )
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_unit_failed_results_are_not_cached(self, tmp_path: Path) -> None:
+        captured: list[list[str]] = []
+
+        def _extract(request: httpx.Request) -> httpx.Response:
+            urls = json.loads(request.content)["urls"]
+            captured.append(urls)
+            failed = [{"url": url, "error": "timeout"} for url in urls]
+            return httpx.Response(200, json={"results": [], "failed_results": failed})
+
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(side_effect=_extract)
+        cache = grokipedia.ResponseCache(tmp_path / "c.sqlite3")
+
+        for _ in range(2):
+            result = asyncio.run(
+                grokipedia.extract_exact_page_async(
+                    "AI history", api_key="k", cache=cache
+                )
+            )
+            assert result is None
+
+        assert len(captured) == 2
+        assert captured[1] == captured[0]
+
+
+# ===================================================================
+# Unit Tests -- local mirror (FTS5/BM25)
+# ===================================================================
+
+
+QUANTUM_PAGE: dict[str, Any] = {
+    "title": "Quantum computing",
+    "url": "https://grokipedia.com/page/Quantum_computing",
+    "content": "snippet",
+    "raw_content": "Quantum computing uses qubits and superposition. " * 20,
+}
+
+
+class TestLocalMirror:
+    def test_unit_add_skips_results_without_raw_content(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        stored = mirror.add([QUANTUM_PAGE, {"url": "https://x/page/Y", "content": "c"}])
+        assert stored == 1
+        mirror.close()
+
+    def test_unit_exact_title_scores_one(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        mirror.add([QUANTUM_PAGE])
+        data = mirror.search("quantum computing")
+        assert data["source"] == "local"
+        assert data["results"][0]["url"] == QUANTUM_PAGE["url"]
+        assert data["results"][0]["score"] == 1.0
+        assert data["results"][0]["content"].endswith("...")
+        assert "raw_content" not in data["results"][0]
+        mirror.close()
+
+    def test_unit_partial_match_scores_below_one(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        mirror.add([QUANTUM_PAGE])
+        data = mirror.search("qubits history", include_raw=True)
+        assert 0 < data["results"][0]["score"] < grokipedia.LOCAL_THRESHOLD
+        assert data["results"][0]["raw_content"] == QUANTUM_PAGE["raw_content"]
+        mirror.close()
+
+    def test_unit_title_ranks_above_body(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        other = {
+            "title": "Superposition",
+            "url": "https://grokipedia.com/page/Superposition",
+            "raw_content": "Superposition in quantum mechanics.",
+        }
+        mirror.add([QUANTUM_PAGE, other])
+        data = mirror.search("superposition")
+        assert data["results"][0]["url"] == other["url"]
+        mirror.close()
+
+    def test_unit_readd_replaces_page(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        mirror.add([QUANTUM_PAGE])
+        mirror.add([{**QUANTUM_PAGE, "raw_content": "Updated qubits text"}])
+        results = mirror.search("quantum computing", include_raw=True)["results"]
+        assert len(results) == 1
+        assert results[0]["raw_content"] == "Updated qubits text"
+        mirror.close()
+
+    def test_unit_readd_updates_row_in_place(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        mirror.add([QUANTUM_PAGE])
+        mirror.add([{**QUANTUM_PAGE, "raw_content": "Updated qubits text"}])
+        rows = mirror._db.execute("SELECT url, content FROM pages").fetchall()
+        assert rows == [(QUANTUM_PAGE["url"], "Updated qubits text")]
+        assert mirror.search("superposition")["results"] == []  # old body unindexed
+        assert len(mirror.search("updated")["results"]) == 1
+        mirror.close()
+
+    def test_unit_no_match_and_punctuation_only(self, tmp_path: Path) -> None:
+        mirror = grokipedia.LocalMirror(tmp_path / "m.sqlite3")
+        mirror.add([QUANTUM_PAGE])
+        assert mirror.search("cuisine")["results"] == []
+        assert mirror.search('"*)(')["results"] == []
+        mirror.close()
+
+
+class TestLocalModes:
+    def _run_json(self, *argv: str) -> dict[str, Any]:
+        import io
+
+        captured = io.StringIO()
+        with patch("grokipedia.get_api_key", return_value="k"):
+            with patch("sys.argv", ["grokipedia.py", *argv, "--json"]):
+                with patch("sys.stdout", captured):
+                    assert grokipedia.main() == 0
+        return json.loads(captured.getvalue())
+
+    def _seed(self, isolated_cache: Path) -> None:
+        mirror = grokipedia.LocalMirror(isolated_cache / grokipedia.MIRROR_FILENAME)
+        mirror.add([QUANTUM_PAGE])
+        mirror.close()
+
+    @respx.mock
+    def test_tavily_lookup_mirrors_exact_page(self, isolated_cache: Path) -> None:
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
+        self._run_json("pattern")
+
+        mirror = grokipedia.LocalMirror(isolated_cache / grokipedia.MIRROR_FILENAME)
+        results = mirror.search("pattern")["results"]
+        assert results[0]["url"] == "https://grokipedia.com/page/Pattern"
+        mirror.close()
+
+    @respx.mock
+    def test_local_needs_no_key_or_network(self, isolated_cache: Path) -> None:
+        self._seed(isolated_cache)
+        with patch("grokipedia.get_api_key", side_effect=AssertionError):
+            data = self._run_json("quantum computing", "--local")
+        assert data["source"] == "local"
+        assert data["results"][0]["url"] == QUANTUM_PAGE["url"]
+
+    @respx.mock
+    def test_prefer_local_above_threshold_skips_tavily(
+        self, isolated_cache: Path
+    ) -> None:
+        self._seed(isolated_cache)
+        data = self._run_json("quantum computing", "--prefer-local")
+        assert data["source"] == "local"
+
+    @respx.mock
+    def test_prefer_local_below_threshold_falls_back(
+        self, isolated_cache: Path
+    ) -> None:
+        self._seed(isolated_cache)
+        search = respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        data = self._run_json("qubits history", "--prefer-local")
+        assert search.call_count == 1
+        assert "source" not in data
+
+    def test_local_and_prefer_local_are_exclusive(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "t", "--local", "--prefer-local"]):
+            with pytest.raises(SystemExit) as exc_info:
+                grokipedia.parse_arguments()
+        assert exc_info.value.code == 2
+
+    def test_threshold_out_of_range_rejected(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "t", "--local-threshold", "1.5"]):
+            assert grokipedia.main() == 2
+
+
+# ===================================================================
+# Unit Tests -- tiered search depth
+# ===================================================================
+
+
+LOW_SCORE_RESPONSE: dict[str, Any] = {
+    **FAKE_RESPONSE,
+    "results": [{**FAKE_RESPONSE["results"][0], "score": 0.2}],
+}
+
+
+class TestTieredSearch:
+    def _mock_search(self, *responses: dict[str, Any]) -> list[str]:
+        depths: list[str] = []
+        queue = list(responses)
+
+        def _search(request: httpx.Request) -> httpx.Response:
+            depths.append(json.loads(request.content)["search_depth"])
+            return httpx.Response(200, json=queue.pop(0))
+
+        respx.post(grokipedia.TAVILY_API_URL).mock(side_effect=_search)
+        return depths
+
+    def _run(self, depth: str) -> dict[str, Any]:
+        return asyncio.run(
+            grokipedia.hybrid_search("pattern", api_key="k", depth=depth)
+        )
+
+    @respx.mock
+    def test_unit_exact_hit_stays_basic(self) -> None:
+        depths = self._mock_search(LOW_SCORE_RESPONSE)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
+        data = self._run("auto")
+        assert depths == ["basic"]
+        assert data["tier"] == "basic"
+        assert data["results"][0]["score"] == 1.0
+
+    @respx.mock
+    def test_unit_strong_basic_results_stay_basic(self) -> None:
+        depths = self._mock_search(FAKE_RESPONSE)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        data = self._run("auto")
+        assert depths == ["basic"]
+        assert data["tier"] == "basic"
+
+    @respx.mock
+    def test_unit_weak_basic_escalates_to_advanced(self) -> None:
+        depths = self._mock_search(LOW_SCORE_RESPONSE, FAKE_RESPONSE)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        data = self._run("auto")
+        assert depths == ["basic", "advanced"]
+        assert data["tier"] == "advanced"
+        assert data["results"][0]["score"] == 0.95
+
+    @respx.mock
+    def test_unit_fixed_depth_never_escalates(self) -> None:
+        depths = self._mock_search(LOW_SCORE_RESPONSE)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        data = self._run("advanced")
+        assert depths == ["advanced"]
+        assert data["tier"] == "advanced"
+
+    @respx.mock
+    def test_json_reports_tier(self) -> None:
+        import io
+
+        self._mock_search(FAKE_RESPONSE)
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_FAIL_RESPONSE)
+        )
+        captured = io.StringIO()
+        with patch("grokipedia.get_api_key", return_value="k"):
+            with patch("sys.argv", ["grokipedia.py", "pattern", "--json"]):
+                with patch("sys.stdout", captured):
+                    assert grokipedia.main() == 0
+        assert json.loads(captured.getvalue())["tier"] == "basic"
+
+    def test_invalid_depth_rejected(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "t", "--depth", "deep"]):
+            with pytest.raises(SystemExit) as exc_info:
+                grokipedia.parse_arguments()
+        assert exc_info.value.code == 2
+
+
+# ===================================================================
+# Unit Tests -- NDJSON streaming output
+# ===================================================================
+
+
+class TestNdjsonOutput:
+    def _run(self, *argv: str) -> tuple[int, list[dict[str, Any]]]:
+        import io
+
+        captured = io.StringIO()
+        with patch("grokipedia.get_api_key", return_value="k"):
+            with patch("sys.argv", ["grokipedia.py", *argv]):
+                with patch("sys.stdout", captured):
+                    code = grokipedia.main()
+        return code, [json.loads(line) for line in captured.getvalue().splitlines()]
+
+    def _mock(self) -> None:
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_RESPONSE)
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json=FAKE_EXTRACT_RESPONSE)
+        )
+
+    def test_unit_trim_truncates_without_mutating(self) -> None:
+        result = {"url": "u", "raw_content": "abcdef"}
+        assert grokipedia.trim_raw_content(result, 3)["raw_content"] == "abc"
+        assert result["raw_content"] == "abcdef"
+
+    def test_unit_trim_zero_omits(self) -> None:
+        trimmed = grokipedia.trim_raw_content({"url": "u", "raw_content": "x"}, 0)
+        assert trimmed == {"url": "u"}
+
+    def test_unit_trim_none_keeps_everything(self) -> None:
+        result = {"url": "u", "raw_content": "x"}
+        assert grokipedia.trim_raw_content(result, None) is result
+
+    def test_unit_records_are_flat_and_ranked(self) -> None:
+        data = {**FAKE_RESPONSE, "tier": "basic"}
+        records = list(grokipedia.ndjson_records(data))
+        assert records == [
+            {
+                "query": "test query",
+                "tier": "basic",
+                "answer": FAKE_RESPONSE["answer"],
+                "rank": 1,
+                **FAKE_RESPONSE["results"][0],
+            }
+        ]
+
+    def test_unit_no_results_yields_marker_record(self) -> None:
+        data = {"query": "nothing", "tier": "advanced", "results": []}
+        records = list(grokipedia.ndjson_records(data))
+        assert records == [
+            {"query": "nothing", "tier": "advanced", "rank": 0, "results": 0}
+        ]
+
+    @respx.mock
+    def test_batch_reports_query_without_results(self, tmp_path: Path) -> None:
+        respx.post(grokipedia.TAVILY_API_URL).mock(
+            return_value=httpx.Response(200, json={"query": "q", "results": []})
+        )
+        respx.post(grokipedia.TAVILY_EXTRACT_URL).mock(
+            return_value=httpx.Response(200, json={"results": []})
+        )
+        path = tmp_path / "topics.txt"
+        path.write_text("zzqx\n")
+        code, records = self._run("--queries-file", str(path), "--ndjson")
+        assert code == 0
+        assert len(records) == 1
+        assert records[0]["query"] == "zzqx"
+        assert (records[0]["rank"], records[0]["results"]) == (0, 0)
+
+    @respx.mock
+    def test_one_line_per_result(self) -> None:
+        self._mock()
+        code, records = self._run("pattern", "--ndjson", "--max-raw-chars", "4")
+        assert code == 0
+        assert [r["rank"] for r in records] == [1, 2]
+        assert records[0]["url"] == "https://grokipedia.com/page/Pattern"
+        assert all(len(r["raw_content"]) <= 4 for r in records)
+
+    @respx.mock
+    def test_json_honors_max_raw_chars(self) -> None:
+        import io
+
+        self._mock()
+        captured = io.StringIO()
+        argv = ["grokipedia.py", "pattern", "--json", "--max-raw-chars", "0"]
+        with patch("grokipedia.get_api_key", return_value="k"):
+            with patch("sys.argv", argv):
+                with patch("sys.stdout", captured):
+                    assert grokipedia.main() == 0
+        data = json.loads(captured.getvalue())
+        assert all("raw_content" not in r for r in data["results"])
+
+    @respx.mock
+    def test_batch_streams_results_per_query(self, tmp_path: Path) -> None:
+        self._mock()
+        path = tmp_path / "topics.txt"
+        path.write_text("pattern\nbeta\n")
+        code, records = self._run("--queries-file", str(path), "--ndjson")
+        assert code == 0
+        by_query = {q: [r for r in records if r["query"] == q] for q in ("pattern", "beta")}
+        assert [r["rank"] for r in by_query["pattern"]] == [1, 2]  # exact + search
+        assert [r["rank"] for r in by_query["beta"]] == [1]
+        assert all(r["rank"] > 0 and "results" not in r for r in records)
+
+    def test_json_and_ndjson_are_exclusive(self) -> None:
+        with patch("sys.argv", ["grokipedia.py", "t", "--json", "--ndjson"]):
+            with pytest.raises(SystemExit) as exc_info:
+                grokipedia.parse_arguments()
+        assert exc_info.value.code == 2
+
+    def test_negative_max_raw_chars_rejected(self) -> None:
+        code, _ = self._run("t", "--max-raw-chars", "-1")
+        assert code == 2